@@ -5,12 +5,11 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 import contextlib
-from functools import partial
 from itertools import chain
 import logging
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 import mimetypes
-from operator import contains, itemgetter
+from operator import itemgetter
 import os
 import platform
 import sys
@@ -85,6 +84,7 @@ from .helpers import (
     recorder,
     restore_state,
     template,
+    template_code_cache,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
@@ -96,8 +96,10 @@ from .setup import (
     # that it is not part of the public API and should not be used
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
+    DATA_STORAGE_LOAD_TIME,
     _setup_started,
     async_get_setup_timings,
+    async_get_storage_load_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
@@ -117,9 +119,6 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-SETUP_ORDER_SORT_KEY = partial(contains, BASE_PLATFORMS)
-
-
 ERROR_LOG_FILENAME = "home-assistant.log"
 
 # hass.data key for logging information.
@@ -254,6 +253,22 @@ PRELOAD_STORAGE = [
     "auth_module.totp",
 ]
 
+#
+# Storage keys loaded by async_load_base_functionality
+# in order of their size on a typical install.
+#
+BASE_PRELOAD_STORAGE = [
+    entity_registry.STORAGE_KEY,
+    restore_state.STORAGE_KEY,
+    device_registry.STORAGE_KEY,
+    config_entries.STORAGE_KEY,
+    issue_registry.STORAGE_KEY,
+    area_registry.STORAGE_KEY,
+    label_registry.STORAGE_KEY,
+    floor_registry.STORAGE_KEY,
+    category_registry.STORAGE_KEY,
+]
+
 
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
@@ -276,6 +291,9 @@ async def async_setup_hass(
         if runtime_config.debug or hass.loop.get_debug():
             hass.config.debug = True
 
+        if runtime_config.intern_state_attributes:
+            hass.states.async_enable_attribute_interning()
+
         hass.config.safe_mode = runtime_config.safe_mode
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
@@ -424,8 +442,13 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     translation.async_setup(hass)
     entity.async_setup(hass)
     template.async_setup(hass)
+    store_manager = get_internal_store_manager(hass)
+    await store_manager.async_initialize()
+    # Read and parse the files in parallel while the registries
+    # wait for them instead of each reading its own file
+    preload_task = create_eager_task(store_manager.async_preload(BASE_PRELOAD_STORAGE))
     await asyncio.gather(
-        create_eager_task(get_internal_store_manager(hass).async_initialize()),
+        preload_task,
         create_eager_task(area_registry.async_load(hass)),
         create_eager_task(category_registry.async_load(hass)),
         create_eager_task(device_registry.async_load(hass)),
@@ -435,10 +458,14 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template_code_cache.async_load(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
     )
+    # Kept apart from the integration setup timings since the
+    # files are loaded before any integration is set up
+    hass.data[DATA_STORAGE_LOAD_TIME] = preload_task.result()
 
 
 async def async_from_config_dict(
@@ -781,6 +808,10 @@ async def async_setup_multi_components(
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    # The other integrations are started in order of how long their import
+    # took in the previous run so the slowest imports are queued first
+    # and the quick ones fill in while they are being set up.
+    import_timings = loader.async_get_previous_import_timings(hass)
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
@@ -788,7 +819,12 @@ async def async_setup_multi_components(
             eager_start=True,
         )
         for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+            domains_not_yet_setup,
+            key=lambda domain: (
+                domain in BASE_PLATFORMS,
+                import_timings.get(domain, 0),
+            ),
+            reverse=True,
         )
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
@@ -1075,3 +1111,13 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        load_time = async_get_storage_load_timings(hass)
+        _LOGGER.debug(
+            "Base storage load times: %s",
+            dict(sorted(load_time.items(), key=itemgetter(1), reverse=True)),
+        )
+        import_time = loader.async_get_import_timings(hass)
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
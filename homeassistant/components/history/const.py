@@ -1,7 +1,13 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Historical states are sent in chunks covering at most this
+# time window to bound memory use for long time ranges
+HISTORY_STREAM_CHUNK_TIME = timedelta(days=1)
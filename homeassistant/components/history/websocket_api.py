@@ -38,7 +38,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -277,24 +281,42 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Long time ranges are fetched and sent in chunks of
+    HISTORY_STREAM_CHUNK_TIME so the states for the whole
+    range never have to be held in memory at once.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_event_time: dt | None = None
+    chunk_start_time = start_time
+    while True:
+        chunk_end_time = min(chunk_start_time + HISTORY_STREAM_CHUNK_TIME, end_time)
+        is_last_chunk = chunk_end_time == end_time
+        last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start_time,
+            # The time range of the query excludes both ends. The end of
+            # a chunk is the start of the next one, so a state exactly at
+            # the boundary is included in the chunk it ends.
+            end_time if is_last_chunk else chunk_end_time + timedelta(microseconds=1),
+            entity_ids,
+            # Only the first chunk needs the state at the start time
+            include_start_time_state and chunk_start_time == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and is_last_chunk and last_event_time is None,
+        )
+        if payload:
+            connection.send_message(payload)
+        if last_time_ts != 0:
+            last_event_time = last_time_dt
+        if is_last_chunk or msg_id not in connection.subscriptions:
+            return last_event_time
+        chunk_start_time = chunk_end_time
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
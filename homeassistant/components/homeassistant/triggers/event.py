@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import ItemsView, Mapping
+from collections.abc import Hashable, ItemsView, Mapping
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, EVENT_STATE_REPORTED
+from homeassistant.const import (
+    CONF_EVENT_DATA,
+    CONF_PLATFORM,
+    EVENT_STATE_REPORTED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, template
@@ -166,10 +171,32 @@ async def async_attach_trigger(
         )
 
     event_filter = filter_event if event_data_items or event_data_schema else None
-    removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
-        for event_type in event_types
-    ]
+    # When matching simple event data, index the listener on one of the
+    # hashable values so the bus only runs the filter for candidate events
+    dispatch_key: tuple[str, Hashable] | None = None
+    for key, value in event_data_items or ():
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        dispatch_key = (key, value)
+        break
+    removes: list[CALLBACK_TYPE] = []
+    for event_type in event_types:
+        # Listeners for all events can't be keyed on event data
+        if dispatch_key and event_type != MATCH_ALL:
+            data_key, data_value = dispatch_key
+            removes.append(
+                hass.bus.async_listen_keyed(
+                    event_type, data_key, data_value, handle_event, event_filter
+                )
+            )
+        else:
+            removes.append(
+                hass.bus.async_listen(
+                    event_type, handle_event, event_filter=event_filter
+                )
+            )
 
     @callback
     def remove_listen_events() -> None:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable, Container, Mapping, Sequence
+from dataclasses import dataclass, field
+import threading
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast
 
 from propcache import cached_property
@@ -22,6 +24,80 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+# A busy day of rows, cached rows take about 450 bytes each
+LOGBOOK_ROW_CACHE_MAX_ROWS: Final = 100000
+
+type _RowCacheKey = tuple[float, tuple[int, ...]]
+
+
+class LogbookRowCache:
+    """Cache the rows of past hours read for requests which are not limited.
+
+    Entries are stored with the rows generation of the recorder at the time
+    the rows were read and are ignored once rows have been purged or states
+    have been assigned to another entity_id since.
+
+    The least recently used hours are evicted when more than max_rows rows
+    are cached, except for the hours a request asks to keep. An hour which
+    does not fit otherwise is not cached, so a request for more rows than
+    max_rows keeps the hours it cached first instead of evicting them all.
+    """
+
+    def __init__(self, max_rows: int = LOGBOOK_ROW_CACHE_MAX_ROWS) -> None:
+        """Initialize the logbook row cache."""
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[_RowCacheKey, tuple[int, Sequence[Row]]] = (
+            OrderedDict()
+        )
+        self._num_rows = 0
+
+    def get(
+        self, hour_start: float, event_type_ids: tuple[int, ...], generation: int
+    ) -> Sequence[Row] | None:
+        """Return the cached rows of the hour or None."""
+        key = (hour_start, event_type_ids)
+        with self._lock:
+            if (entry := self._entries.get(key)) is None or entry[0] != generation:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(
+        self,
+        hour_start: float,
+        event_type_ids: tuple[int, ...],
+        generation: int,
+        rows: Sequence[Row],
+        keep: Container[_RowCacheKey] = (),
+    ) -> None:
+        """Cache the rows of the hour read at the rows generation.
+
+        The rows are not cached if they do not fit without evicting the
+        hours to keep.
+        """
+        key = (hour_start, event_type_ids)
+        entries = self._entries
+        with self._lock:
+            if (old := entries.pop(key, None)) is not None:
+                self._num_rows -= len(old[1])
+            if (excess := self._num_rows + len(rows) - self.max_rows) > 0:
+                evictable = [
+                    evict_key for evict_key in entries if evict_key not in keep
+                ]
+                if sum(len(entries[evict_key][1]) for evict_key in evictable) < excess:
+                    return
+                for evict_key in evictable:
+                    self._num_rows -= len(entries.pop(evict_key)[1])
+                    if self._num_rows + len(rows) <= self.max_rows:
+                        break
+            entries[key] = (generation, rows)
+            self._num_rows += len(rows)
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +109,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    row_cache: LogbookRowCache = field(default_factory=LogbookRowCache)
 
 
 class LazyEventPartialState:
@@ -6,13 +6,15 @@ from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     bytes_to_uuid_hex_or_none,
@@ -77,13 +79,17 @@ from .models import (
     EventAsRow,
     LazyEventPartialState,
     LogbookConfig,
+    LogbookRowCache,
     async_event_to_row,
 )
 from .queries import statement_for_request
+from .queries.all import all_stmt
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+_HOUR = 3600
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -126,6 +132,7 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.row_cache: LogbookRowCache = logbook_config.row_cache
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
@@ -170,6 +177,16 @@ class EventProcessor:
                     instance.event_type_manager.get_many(self.event_types, session)
                 )
             )
+            if not self.limited_select:
+                return self.humanify(
+                    self._get_all_rows(
+                        session,
+                        instance,
+                        start_day.timestamp(),
+                        end_day.timestamp(),
+                        event_type_ids,
+                    )
+                )
             stmt = statement_for_request(
                 start_day,
                 end_day,
@@ -184,6 +201,99 @@ class EventProcessor:
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def _get_all_rows(
+        self,
+        session: Session,
+        instance: Recorder,
+        start_ts: float,
+        end_ts: float,
+        event_type_ids: tuple[int, ...],
+    ) -> list[Row]:
+        """Get the rows of a request which is not limited.
+
+        The rows of hours which ended before the last event committed by the
+        recorder are served from the row cache when possible, only the missing
+        hours and the remainder of the time frame are read from the database.
+        """
+        row_cache = self.row_cache
+        # Read the generation before any rows so rows read while they
+        # are being purged or renamed are never served from the cache
+        generation = instance.rows_generation
+        first_hour = start_ts // _HOUR * _HOUR
+        # Only hours which ended before the last event the recorder has
+        # committed are final, rows may still be added to later hours
+        cache_end = min(end_ts, instance.last_committed_event_ts)
+        rows: list[Row] = []
+        missing_hours: list[float] = []
+        # Hours used by this request are not evicted for its other hours
+        request_keys: set[tuple[float, tuple[int, ...]]] = set()
+        hits = 0
+
+        def _read_missing_hours() -> None:
+            """Read the missing hours in a single query and cache them."""
+            rows_by_hour: dict[float, list[Row]] = {hour: [] for hour in missing_hours}
+            stmt = all_stmt(
+                math.nextafter(missing_hours[0], -math.inf),
+                missing_hours[-1] + _HOUR,
+                event_type_ids,
+                self.filters,
+            )
+            for row in execute_stmt_lambda_element(session, stmt, orm_rows=False):
+                rows_by_hour[row[TIME_FIRED_TS_POS] // _HOUR * _HOUR].append(row)
+            for hour, hour_rows in rows_by_hour.items():
+                row_cache.set(hour, event_type_ids, generation, hour_rows, request_keys)
+                request_keys.add((hour, event_type_ids))
+                rows.extend(hour_rows)
+            missing_hours.clear()
+
+        hour = first_hour
+        while hour + _HOUR <= cache_end:
+            if (cached := row_cache.get(hour, event_type_ids, generation)) is None:
+                missing_hours.append(hour)
+            else:
+                if missing_hours:
+                    _read_missing_hours()
+                rows.extend(cached)
+                request_keys.add((hour, event_type_ids))
+                hits += 1
+            hour += _HOUR
+        if missing_hours:
+            _read_missing_hours()
+
+        if hour == first_hour:
+            # No complete hours in the time frame
+            return list(
+                execute_stmt_lambda_element(
+                    session,
+                    all_stmt(start_ts, end_ts, event_type_ids, self.filters),
+                    orm_rows=False,
+                )
+            )
+
+        _LOGGER.debug(
+            "Logbook row cache: %s of %s hours cached (%s hits, %s misses total)",
+            hits,
+            int((hour - first_hour) // _HOUR),
+            row_cache.hits,
+            row_cache.misses,
+        )
+        if first_hour < start_ts:
+            rows = [row for row in rows if row[TIME_FIRED_TS_POS] > start_ts]
+        if hour < end_ts:
+            rows.extend(
+                execute_stmt_lambda_element(
+                    session,
+                    all_stmt(
+                        math.nextafter(hour, -math.inf),
+                        end_ts,
+                        event_type_ids,
+                        self.filters,
+                    ),
+                    orm_rows=False,
+                )
+            )
+        return rows
+
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
@@ -1140,7 +1140,10 @@ class MQTT:
                     )
             else:
                 self.hass.async_run_hass_job(job, receive_msg)
-        self._mqtt_data.state_write_requests.process_write_state_requests(msg)
+        # Entities updated by the same message fire
+        # their state_changed events as one batch
+        with self.hass.states.async_batch_state_changes():
+            self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     @callback
     def _async_mqtt_on_callback(
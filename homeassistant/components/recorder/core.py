@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -87,6 +94,7 @@ from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
+from .table_managers.statistics_rollup import StatisticsRollupManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
@@ -203,6 +211,12 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Events and states whose foreign keys are already known are
+        # inserted with a single executemany instead of through the ORM
+        # once the database is on the current schema
+        self._pending_event_rows: list[dict[str, Any]] = []
+        self._pending_state_rows: list[dict[str, Any]] = []
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -211,6 +225,16 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.statistics_rollup_manager = StatisticsRollupManager()
+        # Increased before and after states or events are purged or the
+        # entity_id of states is changed so caches of rows read from the
+        # database can tell when the rows may have changed
+        self.rows_generation = 0
+        # The time fired of the last event processed before the event
+        # session was last committed, all events queued before it have
+        # been committed so caches can tell which rows are final
+        self.last_committed_event_ts = 0.0
+        self._last_processed_event_ts = 0.0
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -296,35 +320,46 @@ class Recorder(threading.Thread):
         queue_put = self._queue.put_nowait
 
         @callback
-        def _event_listener(event: Event) -> None:
-            """Listen for new events and put them in the process queue."""
+        def _should_record(event: Event) -> bool:
+            """Return if an event should be recorded."""
             if event.event_type in exclude_event_types:
-                return
+                return False
 
             if entity_filter is None or not (
                 entity_id := event.data.get(ATTR_ENTITY_ID)
             ):
-                queue_put(event)
-                return
+                return True
 
             if isinstance(entity_id, str):
-                if entity_filter(entity_id):
-                    queue_put(event)
-                return
+                return entity_filter(entity_id)
 
             if isinstance(entity_id, list):
-                for eid in entity_id:
-                    if entity_filter(eid):
-                        queue_put(event)
-                        return
-                return
+                return any(entity_filter(eid) for eid in entity_id)
 
             # Unknown what it is.
-            queue_put(event)
+            return True
 
-        self._event_listener = self.hass.bus.async_listen(
+        @callback
+        def _event_listener(event: Event) -> None:
+            """Listen for new events and put them in the process queue."""
+            if _should_record(event):
+                queue_put(event)
+
+        @callback
+        def _event_batch_listener(events: list[Event]) -> None:
+            """Put the recorded events of a batch in the process queue.
+
+            The events are queued one by one so the backlog counts each
+            of them.
+            """
+            for event in events:
+                if _should_record(event):
+                    queue_put(event)
+
+        self._event_listener = self.hass.bus.async_listen_batch(
             MATCH_ALL,
             _event_listener,
+            _event_batch_listener,
         )
         self._queue_watcher = async_track_time_interval(
             self.hass,
@@ -1009,6 +1044,7 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
+        self._last_processed_event_ts = event.time_fired_timestamp
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
@@ -1021,47 +1057,68 @@ class Recorder(threading.Thread):
         """Process any event into the session except state changed."""
         session = self.event_session
         assert session is not None
-        dbevent = Events.from_event(event)
 
         # Map the event_type to the EventTypes table
         event_type_manager = self.event_type_manager
-        if pending_event_types := event_type_manager.get_pending(event.event_type):
-            dbevent.event_type_rel = pending_event_types
-        elif event_type_id := event_type_manager.get(event.event_type, session, True):
-            dbevent.event_type_id = event_type_id
-        else:
+        event_type_id: int | None = None
+        if not (
+            event_types := event_type_manager.get_pending(event.event_type)
+        ) and not (
+            event_type_id := event_type_manager.get(event.event_type, session, True)
+        ):
             event_types = EventTypes(event_type=event.event_type)
             event_type_manager.add_pending(event_types)
             self._add_to_session(session, event_types)
-            dbevent.event_type_rel = event_types
 
-        if not event.data:
-            self._add_to_session(session, dbevent)
-            return
+        data_id: int | None = None
+        event_data: EventData | None = None
+        if event.data:
+            event_data_manager = self.event_data_manager
+            if not (
+                shared_data_bytes := event_data_manager.serialize_from_event(event)
+            ):
+                return
 
-        event_data_manager = self.event_data_manager
-        if not (shared_data_bytes := event_data_manager.serialize_from_event(event)):
-            return
+            # Map the event data to the EventData table
+            shared_data = shared_data_bytes.decode("utf-8")
+            # Matching attributes found in the pending commit
+            if pending_event_data := event_data_manager.get_pending(shared_data):
+                event_data = pending_event_data
+            # Matching attributes id found in the cache
+            elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
+                (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
+                and (data_id := event_data_manager.get(shared_data, hash_, session))
+            ):
+                pass
+            else:
+                # No matching attributes found, save them in the DB
+                event_data = EventData(shared_data=shared_data, hash=hash_)
+                event_data_manager.add_pending(event_data)
+                self._add_to_session(session, event_data)
 
-        # Map the event data to the EventData table
-        shared_data = shared_data_bytes.decode("utf-8")
-        # Matching attributes found in the pending commit
-        if pending_event_data := event_data_manager.get_pending(shared_data):
-            dbevent.event_data_rel = pending_event_data
-        # Matching attributes id found in the cache
-        elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
-            (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
-            and (data_id := event_data_manager.get(shared_data, hash_, session))
+        if (
+            event_type_id is not None
+            and event_data is None
+            and self.schema_version == SCHEMA_VERSION
         ):
-            dbevent.data_id = data_id
-        else:
-            # No matching attributes found, save them in the DB
-            dbevent_data = EventData(shared_data=shared_data, hash=hash_)
-            event_data_manager.add_pending(dbevent_data)
-            self._add_to_session(session, dbevent_data)
-            dbevent.event_data_rel = dbevent_data
+            # All foreign keys are known so the event does not need
+            # the ORM unit of work and is inserted in bulk on commit
+            self._event_session_has_pending_writes = True
+            self._pending_event_rows.append(
+                Events.bulk_row_from_event(event, event_type_id, data_id)
+            )
+            return
 
-        self._add_to_session(session, dbevent)
+        dbevent = Events.from_event(event)
+        if event_types is not None:
+            dbevent.event_type_rel = event_types
+        else:
+            dbevent.event_type_id = event_type_id
+        if event_data is not None:
+            dbevent.event_data_rel = event_data
+        else:
+            dbevent.data_id = data_id
+        self._add_orm_row_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1072,30 +1129,27 @@ class Recorder(threading.Thread):
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
         old_state = event.data["old_state"]
 
         assert self.event_session is not None
         session = self.event_session
 
         states_manager = self.states_manager
+        old_state_id: int | None = None
         if pending_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = pending_state
             if old_state:
                 pending_state.last_reported_ts = old_state.last_reported_timestamp
-        elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
-            if old_state:
-                states_manager.update_pending_last_reported(
-                    old_state_id, old_state.last_reported_timestamp
-                )
-        if entity_removed:
-            dbstate.state = None
+        elif (pending_row := states_manager.pop_pending_row(entity_id)) is not None:
+            if "state_id" not in pending_row:
+                # The state_id of the old state is needed to link to it
+                self._insert_pending_rows(session)
+            old_state_id = pending_row["state_id"]
         else:
-            states_manager.add_pending(entity_id, dbstate)
-
-        if states_meta_manager.active:
-            dbstate.entity_id = None
+            old_state_id = states_manager.pop_committed(entity_id)
+        if old_state_id and old_state:
+            states_manager.update_pending_last_reported(
+                old_state_id, old_state.last_reported_timestamp
+            )
 
         if entity_id is None or not (
             shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
@@ -1103,10 +1157,12 @@ class Recorder(threading.Thread):
             return
 
         # Map the entity_id to the StatesMeta table
+        metadata_id: int | None = None
+        states_meta: StatesMeta | None = None
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
+            states_meta = pending_states_meta
         elif metadata_id := states_meta_manager.get(entity_id, session, True):
-            dbstate.metadata_id = metadata_id
+            pass
         elif states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
@@ -1117,14 +1173,14 @@ class Recorder(threading.Thread):
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
             self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
+        attributes_id: int | None = None
+        state_attributes: StateAttributes | None = None
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+            state_attributes = pending_event_data
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
@@ -1136,15 +1192,84 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
+            pass
         else:
             # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            state_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            state_attributes_manager.add_pending(state_attributes)
+            self._add_to_session(session, state_attributes)
 
-        self._add_to_session(session, dbstate)
+        if (
+            self._bulk_insert_states
+            and self.schema_version == SCHEMA_VERSION
+            and pending_state is None
+            and metadata_id is not None
+            and attributes_id is not None
+            and states_meta_manager.active
+        ):
+            # All foreign keys are known so the state does not need
+            # the ORM unit of work and is inserted in bulk
+            row = States.bulk_row_from_event(
+                event, metadata_id, attributes_id, old_state_id
+            )
+            if entity_removed:
+                row["state"] = None
+            else:
+                states_manager.add_pending_row(entity_id, row)
+            self._event_session_has_pending_writes = True
+            self._pending_state_rows.append(row)
+            return
+
+        dbstate = States.from_event(event)
+        if pending_state:
+            dbstate.old_state = pending_state
+        else:
+            dbstate.old_state_id = old_state_id
+        if entity_removed:
+            dbstate.state = None
+        else:
+            states_manager.add_pending(entity_id, dbstate)
+        if states_meta_manager.active:
+            dbstate.entity_id = None
+        if states_meta is not None:
+            dbstate.states_meta_rel = states_meta
+        else:
+            dbstate.metadata_id = metadata_id
+        dbstate.attributes = None
+        if state_attributes is not None:
+            dbstate.state_attributes = state_attributes
+        else:
+            dbstate.attributes_id = attributes_id
+        self._add_orm_row_to_session(session, dbstate)
+
+    def _add_orm_row_to_session(self, session: Session, obj: Events | States) -> None:
+        """Add an event or state to the session after the pending bulk rows.
+
+        The pending bulk rows are inserted first so the ids keep
+        following the order the events were processed in.
+        """
+        if self._pending_event_rows or self._pending_state_rows:
+            self._insert_pending_rows(session)
+        self._add_to_session(session, obj)
+
+    def _insert_pending_rows(self, session: Session) -> None:
+        """Insert the pending bulk rows.
+
+        Objects that are already in the session were processed before
+        the pending rows so they are flushed first.
+        """
+        session.flush()
+        if self._pending_event_rows:
+            session.execute(insert(Events), self._pending_event_rows)
+            self._pending_event_rows = []
+        if state_rows := self._pending_state_rows:
+            state_ids = session.scalars(
+                insert(States).returning(States.state_id, sort_by_parameter_order=True),
+                state_rows,
+            )
+            for row, state_id in zip(state_rows, state_ids, strict=True):
+                row["state_id"] = state_id
+            self._pending_state_rows = []
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1207,8 +1332,11 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self._pending_event_rows or self._pending_state_rows:
+            self._insert_pending_rows(session)
         session.commit()
 
+        self.last_committed_event_ts = self._last_processed_event_ts
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1241,6 +1369,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_event_rows = []
+        self._pending_state_rows = []
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1404,6 +1534,11 @@ class Recorder(threading.Thread):
         assert not self.engine
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        # Bulk inserted states need their state_id returned in order
+        # so the next state of the same entity can link to them
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self.__dict__.pop("dialect_name", None)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
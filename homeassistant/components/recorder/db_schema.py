@@ -309,24 +309,44 @@ class Events(Base):
             return None
         return date_time.isoformat(sep=" ", timespec="seconds")
 
+    @staticmethod
+    def _row_from_event(event: Event) -> dict[str, Any]:
+        """Return the column values of a native event."""
+        context = event.context
+        return {
+            "origin_idx": event.origin.idx,
+            "time_fired_ts": event.time_fired_timestamp,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        }
+
     @staticmethod
     def from_event(event: Event) -> Events:
         """Create an event database object from a native event."""
-        context = event.context
         return Events(
             event_type=None,
             event_data=None,
-            origin_idx=event.origin.idx,
             time_fired=None,
-            time_fired_ts=event.time_fired_timestamp,
             context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
             context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
             context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
+            **Events._row_from_event(event),
         )
 
+    @staticmethod
+    def bulk_row_from_event(
+        event: Event, event_type_id: int, data_id: int | None
+    ) -> dict[str, Any]:
+        """Create an insert row from a native event.
+
+        Only valid when the event type and event data already have ids.
+        """
+        row = Events._row_from_event(event)
+        row["event_type_id"] = event_type_id
+        row["data_id"] = data_id
+        return row
+
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
         context = Context(
@@ -497,8 +517,8 @@ class States(Base):
         return date_time.isoformat(sep=" ", timespec="seconds")
 
     @staticmethod
-    def from_event(event: Event[EventStateChangedData]) -> States:
-        """Create object from a state_changed event."""
+    def _row_from_event(event: Event[EventStateChangedData]) -> dict[str, Any]:
+        """Return the column values of a state_changed event."""
         state = event.data["new_state"]
         # None state means the state was removed from the state machine
         if state is None:
@@ -518,24 +538,49 @@ class States(Base):
             else:
                 last_reported_ts = state.last_reported_timestamp
         context = event.context
+        return {
+            "state": state_value,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+            "origin_idx": event.origin.idx,
+            "last_updated_ts": last_updated_ts,
+            "last_changed_ts": last_changed_ts,
+            "last_reported_ts": last_reported_ts,
+        }
+
+    @staticmethod
+    def from_event(event: Event[EventStateChangedData]) -> States:
+        """Create object from a state_changed event."""
         return States(
-            state=state_value,
             entity_id=event.data["entity_id"],
             attributes=None,
             context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(context.id),
             context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(context.user_id),
             context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(context.parent_id),
-            origin_idx=event.origin.idx,
             last_updated=None,
             last_changed=None,
-            last_updated_ts=last_updated_ts,
-            last_changed_ts=last_changed_ts,
-            last_reported_ts=last_reported_ts,
+            **States._row_from_event(event),
         )
 
+    @staticmethod
+    def bulk_row_from_event(
+        event: Event[EventStateChangedData],
+        metadata_id: int,
+        attributes_id: int,
+        old_state_id: int | None,
+    ) -> dict[str, Any]:
+        """Create an insert row from a state_changed event.
+
+        Only valid when the metadata, the attributes and the old state
+        already have ids.
+        """
+        row = States._row_from_event(event)
+        row["metadata_id"] = metadata_id
+        row["attributes_id"] = attributes_id
+        row["old_state_id"] = old_state_id
+        return row
+
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
         context = Context(
@@ -13,6 +13,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from .const import SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -30,6 +31,7 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_updated_since,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -193,13 +195,13 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+        state_ids, attributes_ids, newest_ts = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
-        _purge_state_ids(instance, session, state_ids)
+        _purge_state_ids(instance, session, state_ids, newest_ts)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -247,22 +249,29 @@ def _purge_events_and_data_ids(
 
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of state and attribute ids to purge."""
+) -> tuple[set[int], set[int], float | None]:
+    """Return sets of state and attribute ids to purge.
+
+    The states are selected oldest first so the newest last_updated_ts
+    of the batch is returned as well. All states that are not in the
+    batch were updated at or after it.
+    """
     state_ids = set()
     attributes_ids = set()
-    for state_id, attributes_id in session.execute(
+    newest_ts: float | None = None
+    for state_id, attributes_id, last_updated_ts in session.execute(
         find_states_to_purge(purge_before.timestamp(), max_bind_vars)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
             attributes_ids.add(attributes_id)
+        newest_ts = last_updated_ts
     _LOGGER.debug(
         "Selected %s state ids and %s attributes_ids to remove",
         len(state_ids),
         len(attributes_ids),
     )
-    return state_ids, attributes_ids
+    return state_ids, attributes_ids, newest_ts
 
 
 def _select_event_data_ids_to_purge(
@@ -509,8 +518,17 @@ def _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
     return event_ids, state_ids, attributes_ids, data_ids
 
 
-def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
-    """Disconnect states and delete by state id."""
+def _purge_state_ids(
+    instance: Recorder,
+    session: Session,
+    state_ids: set[int],
+    newest_ts: float | None = None,
+) -> None:
+    """Disconnect states and delete by state id.
+
+    If newest_ts is passed, all states that are not in state_ids
+    must have been updated at or after it.
+    """
     if not state_ids:
         return
 
@@ -518,7 +536,17 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # the delete does not fail due to a foreign key constraint
     # since some databases (MSSQL) cannot do the ON DELETE SET NULL
     # for us.
-    disconnected_rows = session.execute(disconnect_states_rows(state_ids))
+    if newest_ts is None or instance.dialect_name == SupportedDialect.MYSQL:
+        # MySQL and MariaDB check foreign keys row by row while deleting,
+        # so states in the batch must be disconnected from each other too
+        stmt = disconnect_states_rows(state_ids)
+    else:
+        # Most states referring to a purged state are purged as well,
+        # only disconnect the ones that remain to avoid writing rows
+        # that are deleted right after. This relies on the foreign key
+        # being checked at the end of the delete statement.
+        stmt = disconnect_states_rows_updated_since(state_ids, newest_ts)
+    disconnected_rows = session.execute(stmt)
     _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
     deleted_rows = session.execute(delete_states_rows(state_ids))
@@ -5,7 +5,16 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -540,6 +549,28 @@ def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def disconnect_states_rows_updated_since(
+    state_ids: Iterable[int], last_updated_ts: float
+) -> StatementLambdaElement:
+    """Disconnect states rows updated at or after last_updated_ts.
+
+    States updated before last_updated_ts are about to be deleted
+    so there is no need to write them before they are removed.
+    """
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id.in_(state_ids))
+        .where(
+            or_(
+                States.last_updated_ts >= last_updated_ts,
+                States.last_updated_ts.is_(None),
+            )
+        )
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete states rows."""
     return lambda_stmt(
@@ -630,8 +661,9 @@ def find_states_to_purge(
 ) -> StatementLambdaElement:
     """Find states to purge."""
     return lambda_stmt(
-        lambda: select(States.state_id, States.attributes_id)
+        lambda: select(States.state_id, States.attributes_id, States.last_updated_ts)
         .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts)
         .limit(max_bind_vars)
     )
 
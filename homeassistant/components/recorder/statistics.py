@@ -83,6 +83,7 @@ from .util import (
 
 if TYPE_CHECKING:
     from . import Recorder
+    from .table_managers.statistics_rollup import Rollup, RollupKey
 
 QUERY_STATISTICS = (
     Statistics.metadata_id,
@@ -252,6 +253,44 @@ def _get_statistic_to_display_unit_converter(
     allow_none: bool = True,
 ) -> Callable[[float | None], float | None] | Callable[[float], float] | None:
     """Prepare a converter from the statistics unit to display unit."""
+    if (
+        converter_and_display_unit := _get_statistic_converter_and_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = converter_and_display_unit
+    if allow_none:
+        return converter.converter_factory_allow_none(
+            from_unit=statistic_unit, to_unit=display_unit
+        )
+    return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
+
+
+def _get_statistic_to_display_unit_values_converter(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> Callable[[Iterable[float | None]], list[float | None]] | None:
+    """Prepare a converter of many values from the statistics unit to display unit."""
+    if (
+        converter_and_display_unit := _get_statistic_converter_and_display_unit(
+            statistic_unit, state_unit, requested_units
+        )
+    ) is None:
+        return None
+    converter, display_unit = converter_and_display_unit
+    return converter.values_converter_factory(
+        from_unit=statistic_unit, to_unit=display_unit
+    )
+
+
+def _get_statistic_converter_and_display_unit(
+    statistic_unit: str | None,
+    state_unit: str | None,
+    requested_units: dict[str, str] | None,
+) -> tuple[type[BaseUnitConverter], str | None] | None:
+    """Return the converter and display unit if statistics need to be converted."""
     if (converter := STATISTIC_UNIT_TO_UNIT_CONVERTER.get(statistic_unit)) is None:
         return None
 
@@ -269,11 +308,7 @@ def _get_statistic_to_display_unit_converter(
     if display_unit == statistic_unit:
         return None
 
-    if allow_none:
-        return converter.converter_factory_allow_none(
-            from_unit=statistic_unit, to_unit=display_unit
-        )
-    return converter.converter_factory(from_unit=statistic_unit, to_unit=display_unit)
+    return converter, display_unit
 
 
 def _get_display_to_statistic_unit_converter(
@@ -462,6 +497,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
     start = start.replace(minute=0, second=0, microsecond=0)
     # Commit every 12 hours of data
     commit_interval = 60 / period_size * 12
+    first_start = last_period
 
     with session_scope(
         session=instance.get_session(),
@@ -475,6 +511,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 start, process_timestamp(last_run) + StatisticsShortTerm.duration
             )
 
+        first_start = start
         periods_without_commit = 0
         while start < last_period:
             periods_without_commit += 1
@@ -489,6 +526,11 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    if first_start < last_period:
+        instance.statistics_rollup_manager.invalidate(
+            first_start.replace(minute=0).timestamp()
+        )
+
     return True
 
 
@@ -515,6 +557,12 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    if start.minute == 55:
+        # Hourly statistics were compiled, drop the rollups including them
+        instance.statistics_rollup_manager.invalidate(
+            start.replace(minute=0).timestamp()
+        )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -753,6 +801,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    instance.statistics_rollup_manager.invalidate(0, statistic_ids)
 
 
 def update_statistics_metadata(
@@ -778,6 +827,9 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+        instance.statistics_rollup_manager.invalidate(
+            0, (statistic_id, new_statistic_id)
+        )
 
 
 async def async_list_statistic_ids(
@@ -1119,6 +1171,25 @@ def _reduce_statistics_per_month(
     )
 
 
+_REDUCE_TS_FACTORIES: dict[
+    str,
+    tuple[
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool],
+                Callable[[float], tuple[float, float]],
+            ],
+        ],
+        timedelta,
+    ],
+] = {
+    "day": (reduce_day_ts_factory, timedelta(days=1)),
+    "week": (reduce_week_ts_factory, timedelta(days=7)),
+    "month": (reduce_month_ts_factory, timedelta(days=31)),
+}
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1704,6 +1775,114 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int],
+    period: str,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return hourly statistics reduced to daily, weekly or monthly statistics.
+
+    Periods which have ended are cached by the statistics rollup manager,
+    hourly statistics are only fetched from the first period not cached.
+    """
+    rollup_manager = get_instance(hass).statistics_rollup_manager
+    generation = rollup_manager.generation
+    reduce_ts_factory, period_duration = _REDUCE_TS_FACTORIES[period]
+    same_period, period_start_end = reduce_ts_factory()
+
+    # No more hourly statistics will be compiled for periods which have ended
+    complete_end_ts = dt_util.utcnow().timestamp()
+    if end_time is not None:
+        complete_end_ts = min(complete_end_ts, end_time.timestamp())
+    complete_periods: list[tuple[float, float]] = []
+    query_start_ts = start_time.timestamp()
+    # Periods are only cached when start_time is aligned with a period, the
+    # first period would otherwise only be reduced from some of its hours
+    if period_start_end(query_start_ts)[0] == query_start_ts:
+        while (start_end := period_start_end(query_start_ts))[1] <= complete_end_ts:
+            complete_periods.append(start_end)
+            query_start_ts = start_end[1]
+
+    time_zone = str(dt_util.get_default_time_zone())
+    frozen_types = frozenset(types)
+    keys: dict[str, RollupKey] = {}
+    cached_rows: dict[str, list[StatisticsRow]] = {}
+    for statistic_id, (_, meta) in metadata.items():
+        state_unit = unit = meta["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        display_unit = unit
+        if converter_and_unit := _get_statistic_converter_and_display_unit(
+            unit, state_unit, units
+        ):
+            display_unit = converter_and_unit[1]
+        keys[statistic_id] = key = (period, time_zone, frozen_types, unit, display_unit)
+        cached_rows[statistic_id], num_cached = rollup_manager.get(
+            statistic_id, key, complete_periods
+        )
+        if num_cached < len(complete_periods):
+            query_start_ts = min(query_start_ts, complete_periods[num_cached][0])
+
+    reduced_stats: dict[str, list[StatisticsRow]] = {}
+    if end_time is None or query_start_ts < end_time.timestamp():
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(query_start_ts),
+            end_time,
+            metadata_ids,
+            Statistics,
+            types,
+        )
+        if stats := cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        ):
+            reduced_stats = _reduce_statistics(
+                _sorted_statistics_to_dict(
+                    hass, stats, statistic_ids, metadata, True, Statistics, units, types
+                ),
+                same_period,
+                period_start_end,
+                period_duration,
+                types,
+            )
+
+    result: dict[str, list[StatisticsRow]] = {}
+    new_rollups: dict[str, dict[RollupKey, dict[float, Rollup]]] = {}
+    queried_periods = [
+        start_end for start_end in complete_periods if start_end[0] >= query_start_ts
+    ]
+    for statistic_id in statistic_ids:
+        if (key := keys.get(statistic_id)) is None:
+            continue
+        rows = [
+            row for row in cached_rows[statistic_id] if row["start"] < query_start_ts
+        ]
+        queried_rows = reduced_stats.get(statistic_id, [])
+        rows.extend(queried_rows)
+        if rows:
+            result[statistic_id] = rows
+        if not queried_periods:
+            continue
+        rollups: dict[float, Rollup] = {
+            start: (end, None) for start, end in queried_periods
+        }
+        for row in queried_rows:
+            if row["start"] in rollups:
+                rollups[row["start"]] = (row["end"], row.copy())
+        new_rollups[statistic_id] = {key: rollups}
+
+    if new_rollups:
+        rollup_manager.add(generation, new_rollups)
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1774,35 +1953,52 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if metadata_ids and period in _REDUCE_TS_FACTORIES:
+        assert statistic_ids is not None
+        result = _reduced_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            units,
+            types,
+        )
+        if not result:
+            return {}
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2124,20 +2320,24 @@ def _build_converted_stats(
     table_duration_seconds: float,
     start_ts_idx: int,
     row_mapping: tuple[tuple[str, int], ...],
-    convert: Callable[[float | None], float | None] | Callable[[float], float],
+    convert_values: Callable[[Iterable[float | None]], list[float | None]],
 ) -> list[StatisticsRow]:
     """Build a list of statistics with unit conversion."""
-    return [
+    stats: list[StatisticsRow] = [
         {
             "start": (start_ts := db_row[start_ts_idx]),
             "end": start_ts + table_duration_seconds,
-            **{
-                key: None if (v := db_row[idx]) is None else convert(v)  # type: ignore[typeddict-item]
-                for key, idx in row_mapping
-            },
         }
         for db_row in db_rows
     ]
+    # Convert a whole column at once and set it on the rows, which is
+    # cheaper than calling the converter for every value of every row
+    for key, idx in row_mapping:
+        for row, value in zip(
+            stats, convert_values([db_row[idx] for db_row in db_rows]), strict=False
+        ):
+            row[key] = value  # type: ignore[literal-required]
+    return stats
 
 
 def _sorted_statistics_to_dict(
@@ -2187,15 +2387,19 @@ def _sorted_statistics_to_dict(
     for meta_id, db_rows in stats_by_meta_id.items():
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        convert = convert_values = None
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
                 state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-            convert = _get_statistic_to_display_unit_converter(
-                unit, state_unit, units, allow_none=False
-            )
-        else:
-            convert = None
+            if sum_only:
+                convert = _get_statistic_to_display_unit_converter(
+                    unit, state_unit, units, allow_none=False
+                )
+            else:
+                convert_values = _get_statistic_to_display_unit_values_converter(
+                    unit, state_unit, units
+                )
 
         build_args = (db_rows, table_duration_seconds, start_ts_idx)
         if sum_only:
@@ -2209,8 +2413,8 @@ def _sorted_statistics_to_dict(
                 _stats = _build_sum_converted_stats(*build_args, sum_idx, convert)
             else:
                 _stats = _build_sum_stats(*build_args, sum_idx)
-        elif convert:
-            _stats = _build_converted_stats(*build_args, row_mapping, convert)
+        elif convert_values:
+            _stats = _build_converted_stats(*build_args, row_mapping, convert_values)
         else:
             _stats = _build_stats(*build_args, row_mapping)
 
@@ -2431,17 +2635,22 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
-
+    imported = False
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    if imported and table == Statistics:
+        instance.statistics_rollup_manager.invalidate(0, (metadata["statistic_id"],))
+
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2482,6 +2691,10 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    instance.statistics_rollup_manager.invalidate(
+        start_time.replace(minute=0).timestamp(), (statistic_id,)
+    )
+
     return True
 
 
@@ -2550,6 +2763,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    instance.statistics_rollup_manager.invalidate(0, (statistic_id,))
+
 
 @callback
 def async_change_statistics_unit(
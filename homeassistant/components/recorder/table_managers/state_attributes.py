@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -18,6 +19,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,11 +40,51 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The state machine reuses the attributes object when only the
+        # state changes so we can skip serializing them again by keeping
+        # the last serialized attributes for the most recently changed
+        # entities.
+        self._serialized: LRU[
+            str, tuple[Mapping[str, Any], StateInfo | None, bytes]
+        ] = LRU(CACHE_SIZE)
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        serialized = self._serialized
+        if new_size > serialized.get_size():
+            serialized.set_size(new_size)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
-        """Serialize event data."""
+        """Serialize event data.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        entity_id = event.data["entity_id"]
+        if (state := event.data["new_state"]) is None:
+            self._serialized.pop(entity_id, None)
+        elif (
+            (serialized := self._serialized.get(entity_id))
+            and serialized[0] is state.attributes
+            and serialized[1] is state.state_info
+        ):
+            return serialized[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +94,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if state is not None:
+            self._serialized[entity_id] = (
+                state.attributes,
+                state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from ..db_schema import States
 
 
@@ -11,6 +13,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_rows: dict[str, dict[str, Any]] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
@@ -24,6 +27,18 @@ class StatesManager:
         """
         return self._pending.pop(entity_id, None)
 
+    def pop_pending_row(self, entity_id: str) -> dict[str, Any] | None:
+        """Pop a pending bulk insert row.
+
+        Pending rows are states that are inserted in bulk instead of
+        being added to the session. The state_id of a row is only
+        known after it has been inserted.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_rows.pop(entity_id, None)
+
     def pop_committed(self, entity_id: str) -> int | None:
         """Pop a committed state.
 
@@ -45,6 +60,14 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_row(self, entity_id: str, row: dict[str, Any]) -> None:
+        """Add a pending bulk insert row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows[entity_id] = row
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -63,7 +86,10 @@ class StatesManager:
         """
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+        for entity_id, row in self._pending_rows.items():
+            self._last_committed_id[entity_id] = row["state_id"]
         self._pending.clear()
+        self._pending_rows.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +100,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -0,0 +1,89 @@
+"""Support caching rollups of the Statistics table."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import threading
+from typing import TYPE_CHECKING
+
+from lru import LRU
+
+if TYPE_CHECKING:
+    from ..statistics import StatisticsRow
+
+# period, time zone, statistic types, statistic unit, display unit
+type RollupKey = tuple[str, str, frozenset[str], str | None, str | None]
+# The end of the period and the reduced row, None if there were no statistics
+type Rollup = tuple[float, StatisticsRow | None]
+
+# The maximum number of cached periods of all statistics
+CACHE_SIZE = 16384
+
+
+class StatisticsRollupManager:
+    """Cache hourly statistics reduced to days, weeks and months.
+
+    Only periods which have ended are cached. Cached periods are dropped
+    when the hourly statistics they were reduced from are changed, which
+    must be done after the changes have been committed. The least recently
+    used periods are dropped when more than lru_size periods are cached.
+    """
+
+    def __init__(self, lru_size: int = CACHE_SIZE) -> None:
+        """Initialize the statistics rollup manager."""
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._rollups: LRU[tuple[str, RollupKey, float], Rollup] = LRU(lru_size)
+
+    @property
+    def generation(self) -> int:
+        """Return a counter which is increased when rollups are dropped."""
+        return self._generation
+
+    def get(
+        self,
+        statistic_id: str,
+        key: RollupKey,
+        periods: list[tuple[float, float]],
+    ) -> tuple[list[StatisticsRow], int]:
+        """Return cached rows for the leading periods and the number of them."""
+        rows: list[StatisticsRow] = []
+        with self._lock:
+            for idx, (start, _) in enumerate(periods):
+                if (rollup := self._rollups.get((statistic_id, key, start))) is None:
+                    return rows, idx
+                if (row := rollup[1]) is not None:
+                    rows.append(row.copy())
+        return rows, len(periods)
+
+    def add(
+        self,
+        generation: int,
+        rollups: dict[str, dict[RollupKey, dict[float, Rollup]]],
+    ) -> None:
+        """Add rollups reduced from hourly statistics read at a generation.
+
+        The rollups are discarded if other rollups were dropped since, as
+        the hourly statistics may have been read before they were changed.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            for statistic_id, rollups_by_key in rollups.items():
+                for key, new_rollups in rollups_by_key.items():
+                    for start, rollup in new_rollups.items():
+                        self._rollups[(statistic_id, key, start)] = rollup
+
+    def invalidate(
+        self, start_ts: float, statistic_ids: Iterable[str] | None = None
+    ) -> None:
+        """Drop rollups of periods ending after start_ts."""
+        with self._lock:
+            self._generation += 1
+            ids = None if statistic_ids is None else set(statistic_ids)
+            for cache_key in [
+                cache_key
+                for cache_key, (end, _) in self._rollups.items()
+                if end > start_ts and (ids is None or cache_key[0] in ids)
+            ]:
+                del self._rollups[cache_key]
@@ -100,11 +100,13 @@ class UpdateStatesMetadataTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        instance.rows_generation += 1
         entity_registry.update_states_metadata(
             instance,
             self.entity_id,
             self.new_entity_id,
         )
+        instance.rows_generation += 1
 
 
 @dataclass(slots=True)
@@ -117,9 +119,12 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        instance.rows_generation += 1
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        instance.rows_generation += 1
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -142,7 +147,12 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
-        if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
+        instance.rows_generation += 1
+        finished = purge.purge_entity_data(
+            instance, self.entity_filter, self.purge_before
+        )
+        instance.rows_generation += 1
+        if finished:
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(PurgeEntitiesTask(self.entity_filter, self.purge_before))
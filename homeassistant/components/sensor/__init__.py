@@ -930,10 +930,9 @@ def async_update_suggested_units(hass: HomeAssistant) -> None:
     """Update the suggested_unit_of_measurement according to the unit system."""
     registry = er.async_get(hass)
 
-    for entry in registry.entities.values():
-        if entry.domain != DOMAIN:
-            continue
-
+    for entry in er.async_entries_for_domain(
+        registry, DOMAIN, include_disabled_entities=True
+    ):
         sensor_private_options = dict(entry.options.get(f"{DOMAIN}.private", {}))
         sensor_private_options["refresh_initial_entity_options"] = True
         registry.async_update_entity_options(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 from collections import deque
 from collections.abc import Callable, Mapping
 import contextlib
@@ -97,6 +98,12 @@ STAT_VALUE_MAX = "value_max"
 STAT_VALUE_MIN = "value_min"
 STAT_VARIANCE = "variance"
 
+# Statistics calculated from the sorted values of a sensor source (numeric)
+STATS_SORTED_STATES = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+
 # Statistics supported by a sensor source (numeric)
 STATS_NUMERIC_SUPPORT = {
     STAT_AVERAGE_LINEAR,
@@ -364,6 +371,13 @@ class StatisticsSensor(SensorEntity):
 
         self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        # The characteristics based on the order of the values use a sorted
+        # copy of the states which is updated as states are added and removed
+        self._sorted_states: list[float] | None = (
+            []
+            if not self.is_binary and state_characteristic in STATS_SORTED_STATES
+            else None
+        )
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[[], float | int | datetime | None] = (
@@ -471,10 +485,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_state(new_state.state == "on", new_state.last_reported)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_reported)
+                self._append_state(float(new_state.state), new_state.last_reported)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -487,6 +500,27 @@ class StatisticsSensor(SensorEntity):
 
         self._calculate_state_attributes(new_state)
 
+    def _append_state(self, value: float | bool, age: datetime) -> None:
+        """Append a value to the buffer, the oldest value is dropped if it is full."""
+        if (sorted_states := self._sorted_states) is not None:
+            if math.isnan(value):
+                # NaN can't be sorted, fall back to sorting all states
+                self._sorted_states = None
+            else:
+                if len(self.states) == self.states.maxlen:
+                    del sorted_states[bisect.bisect_left(sorted_states, self.states[0])]
+                # Equal values are kept in the order they were added, like sorted()
+                bisect.insort_right(sorted_states, value)
+        self.states.append(value)
+        self.ages.append(age)
+
+    def _popleft_state(self) -> None:
+        """Remove the oldest value from the buffer."""
+        self.ages.popleft()
+        value = self.states.popleft()
+        if (sorted_states := self._sorted_states) is not None:
+            del sorted_states[bisect.bisect_left(sorted_states, value)]
+
     def _calculate_state_attributes(self, new_state: State) -> None:
         """Set the entity state attributes."""
 
@@ -623,8 +657,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._popleft_state()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -886,9 +919,16 @@ class StatisticsSensor(SensorEntity):
         return None
 
     def _stat_median(self) -> StateType:
-        if len(self.states) > 0:
-            return statistics.median(self.states)
-        return None
+        if (sorted_states := self._sorted_states) is None:
+            if len(self.states) > 0:
+                return statistics.median(self.states)
+            return None
+        # Same as statistics.median without sorting the states
+        if not (count := len(sorted_states)):
+            return None
+        if count % 2 == 1:
+            return sorted_states[count // 2]
+        return (sorted_states[count // 2 - 1] + sorted_states[count // 2]) / 2
 
     def _stat_noisiness(self) -> StateType:
         if len(self.states) == 1:
@@ -901,8 +941,20 @@ class StatisticsSensor(SensorEntity):
         if len(self.states) == 1:
             return self.states[0]
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            if (sorted_states := self._sorted_states) is None:
+                percentiles = statistics.quantiles(
+                    self.states, n=100, method="exclusive"
+                )
+                return percentiles[self._percentile - 1]
+            # Same as the exclusive method of statistics.quantiles
+            # but only for the configured percentile
+            count = len(sorted_states)
+            scaled = self._percentile * (count + 1)
+            idx = min(max(scaled // 100, 1), count - 1)
+            delta = scaled - idx * 100
+            return (
+                sorted_states[idx - 1] * (100 - delta) + sorted_states[idx] * delta
+            ) / 100
         return None
 
     def _stat_standard_deviation(self) -> StateType:
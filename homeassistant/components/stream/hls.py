@@ -425,9 +425,18 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
+        # Write the parts one by one instead of joining them into a new
+        # buffer for every request. The parts are fixed before writing since
+        # parts may still be added to a segment which is not complete.
+        parts = segment.parts[:]
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = sum(len(part.data) for part in parts)
+        await response.prepare(request)
+        for part in parts:
+            await response.write(part.data)
+        await response.write_eof()
+        return response
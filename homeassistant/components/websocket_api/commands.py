@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import suppress
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -55,11 +57,16 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_timings,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_timings,
+    async_get_storage_load_timings,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +74,8 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ALL_COMPRESSED_STATES_JSON_CACHE = "websocket_api_all_compressed_states_json"
+EVENT_FAN_OUTS = "websocket_api_event_fan_outs"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -88,6 +97,7 @@ def async_register_commands(
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_storage_load_info)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
@@ -105,34 +115,76 @@ def pong_message(iden: int) -> dict[str, Any]:
     return {"id": iden, "type": "pong"}
 
 
-@callback
-def _forward_events_check_permissions(
-    send_message: Callable[[bytes | str | dict[str, Any]], None],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event,
-) -> None:
-    """Forward state changed events to websocket."""
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_event_message(message_id_as_bytes, event))
+class _EventFanOut:
+    """Forward events of one event type to all subscribed connections.
 
+    A single bus listener serves every subscription to the event type
+    so each event is encoded once and every connection only needs the
+    message id appended.
+    """
 
-@callback
-def _forward_events_unconditional(
-    send_message: Callable[[bytes | str | dict[str, Any]], None],
-    message_id_as_bytes: bytes,
-    event: Event,
-) -> None:
-    """Forward events to websocket."""
-    send_message(messages.cached_event_message(message_id_as_bytes, event))
+    __slots__ = ("_check_permissions", "_subscriptions", "_unsub", "event_type")
+
+    def __init__(self, event_type: str) -> None:
+        """Initialize the fan out."""
+        self.event_type = event_type
+        self._check_permissions = event_type == EVENT_STATE_CHANGED
+        self._subscriptions: dict[
+            object, tuple[Callable[[bytes | str | dict[str, Any]], None], User, bytes]
+        ] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to the events."""
+        key = object()
+        self._subscriptions[key] = (
+            send_message,
+            user,
+            messages.event_message_suffix(message_id_as_bytes),
+        )
+        if self._unsub is None:
+            self._unsub = hass.bus.async_listen(self.event_type, self._async_forward)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Unsubscribe the connection."""
+            self._subscriptions.pop(key, None)
+            if not self._subscriptions and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+                del hass.data[EVENT_FAN_OUTS][self.event_type]
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward an event to all subscribed connections."""
+        prefix = messages.cached_event_message_prefix(event)
+        check_permissions = self._check_permissions
+        # Copy since a connection may unsubscribe while we are sending
+        for send_message, user, suffix in list(self._subscriptions.values()):
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            if (
+                check_permissions
+                and not user.is_admin
+                and not (permissions := user.permissions).access_all_entities(
+                    POLICY_READ
+                )
+                and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
+            ):
+                continue
+            try:
+                send_message(prefix + suffix)
+            except Exception:
+                _LOGGER.exception("Error forwarding %s event", self.event_type)
 
 
 @callback
@@ -156,22 +208,11 @@ def handle_subscribe_events(
         )
         raise Unauthorized(user_id=connection.user.id)
 
-    message_id_as_bytes = str(msg["id"]).encode()
-
-    if event_type == EVENT_STATE_CHANGED:
-        forward_events = partial(
-            _forward_events_check_permissions,
-            connection.send_message,
-            connection.user,
-            message_id_as_bytes,
-        )
-    else:
-        forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
-        )
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+    fan_outs: dict[str, _EventFanOut] = hass.data.setdefault(EVENT_FAN_OUTS, {})
+    if (fan_out := fan_outs.get(event_type)) is None:
+        fan_out = fan_outs[event_type] = _EventFanOut(event_type)
+    connection.subscriptions[msg["id"]] = fan_out.async_subscribe(
+        hass, connection.send_message, connection.user, str(msg["id"]).encode()
     )
 
     connection.send_result(msg["id"])
@@ -394,6 +435,64 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+@callback
+def _forward_entity_changes_batch(
+    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    message_id_as_bytes: bytes,
+    events: list[Event[EventStateChangedData]],
+) -> None:
+    """Forward a batch of entity state changed events to websocket at once."""
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    check_entity = not user.is_admin and not permissions.access_all_entities(
+        POLICY_READ
+    )
+    forward_events: list[Event[EventStateChangedData]] = []
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if (
+            (entity_ids and entity_id not in entity_ids)
+            or (entity_filter and not entity_filter(entity_id))
+            or (check_entity and not permissions.check_entity(entity_id, POLICY_READ))
+        ):
+            continue
+        forward_events.append(event)
+    if forward_events:
+        for message in messages.cached_state_diff_batch_messages(
+            message_id_as_bytes, forward_events
+        ):
+            send_message(message)
+
+
+@callback
+def _async_get_all_compressed_states_json(hass: HomeAssistant) -> bytes:
+    """Return the compressed states of all entities joined as JSON object members.
+
+    The result is shared by all connections subscribing to every entity
+    until the next state change so clients that subscribe at the same
+    time, for example after a restart, do not each build the payload.
+    """
+    if (cached := hass.data.get(ALL_COMPRESSED_STATES_JSON_CACHE)) is not None:
+        return cast(bytes, cached)
+    payload = b",".join(
+        [state.as_compressed_state_json for state in hass.states.async_all()]
+    )
+    hass.data[ALL_COMPRESSED_STATES_JSON_CACHE] = payload
+
+    @callback
+    def _async_invalidate(_event: Event[EventStateChangedData]) -> None:
+        """Drop the cached payload when any state changes."""
+        hass.data.pop(ALL_COMPRESSED_STATES_JSON_CACHE, None)
+        unsub()
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _async_invalidate)
+    return payload
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -412,10 +511,21 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    all_states_json: bytes | None = None
+    user = connection.user
+    if (
+        not entity_ids
+        and not entity_filter
+        and (user.is_admin or user.permissions.access_all_entities(POLICY_READ))
+    ):
+        with suppress(ValueError, TypeError):
+            all_states_json = _async_get_all_compressed_states_json(hass)
+    states = (
+        _async_get_allowed_states(hass, connection) if all_states_json is None else []
+    )
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
+    connection.subscriptions[msg_id] = hass.bus.async_listen_batch(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
@@ -425,9 +535,23 @@ def handle_subscribe_entities(
             connection.user,
             message_id_as_bytes,
         ),
+        partial(
+            _forward_entity_changes_batch,
+            connection.send_message,
+            entity_ids,
+            entity_filter,
+            connection.user,
+            message_id_as_bytes,
+        ),
     )
     connection.send_result(msg_id)
 
+    if all_states_json is not None:
+        _send_handle_entities_init_response(
+            connection, message_id_as_bytes, [all_states_json]
+        )
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -489,15 +613,35 @@ def _send_handle_entities_init_response(
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
     """Return JSON of descriptions (i.e. user documentation) for all service calls."""
     descriptions = await async_get_all_descriptions(hass)
+    cached_fragments: dict[str, tuple[dict[str, Any], json_fragment]] = {}
     if ALL_SERVICE_DESCRIPTIONS_JSON_CACHE in hass.data:
-        cached_descriptions, cached_json_payload = hass.data[
+        cached_descriptions, cached_json_payload, cached_fragments = hass.data[
             ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
         ]
         # If the descriptions are the same, return the cached JSON payload
         if cached_descriptions is descriptions:
             return cast(bytes, cached_json_payload)
-    json_payload = json_bytes(descriptions)
-    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
+    # Only encode the domains whose descriptions changed, the dict
+    # of a domain is kept as long as none of its descriptions change
+    fragments: dict[str, tuple[dict[str, Any], json_fragment]] = {}
+    for domain, domain_descriptions in descriptions.items():
+        if (cached := cached_fragments.get(domain)) is not None and cached[
+            0
+        ] is domain_descriptions:
+            fragments[domain] = cached
+        else:
+            fragments[domain] = (
+                domain_descriptions,
+                json_fragment(json_bytes(domain_descriptions)),
+            )
+    json_payload = json_bytes(
+        {domain: fragment for domain, (_, fragment) in fragments.items()}
+    )
+    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (
+        descriptions,
+        json_payload,
+        fragments,
+    )
     return json_payload
 
 
@@ -561,15 +705,35 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
+    import_timings = async_get_import_timings(hass)
     connection.send_result(
         msg["id"],
         [
-            {"domain": integration, "seconds": seconds}
+            {
+                "domain": integration,
+                "seconds": seconds,
+                "import_seconds": import_timings.get(integration),
+            }
             for integration, seconds in async_get_setup_timings(hass).items()
         ],
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "storage/load_info"})
+def handle_storage_load_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle storage load info command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"key": key, "seconds": seconds}
+            for key, seconds in async_get_storage_load_timings(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -128,6 +128,19 @@ def cached_event_message(message_id_as_bytes: bytes, event: Event) -> bytes:
     )
 
 
+def cached_event_message_prefix(event: Event) -> bytes:
+    """Return an event message without the id and the closing brace.
+
+    Appending event_message_suffix for a message id completes the message.
+    """
+    return _partial_cached_event_message(event)[:-1]
+
+
+def event_message_suffix(message_id_as_bytes: bytes) -> bytes:
+    """Return the end of an event message for a message id."""
+    return b"".join((b',"id":', message_id_as_bytes, b"}"))
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
@@ -162,6 +175,56 @@ def cached_state_diff_message(
     )
 
 
+def cached_state_diff_batch_messages(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> list[bytes]:
+    """Return the event messages for a batch of state_changed events.
+
+    The state diffs of the batch are combined into as few messages as
+    possible. An entity that changes again within the batch starts a
+    new message since its second diff is relative to the first one.
+    """
+    if len(events) == 1:
+        return [cached_state_diff_message(message_id_as_bytes, events[0])]
+    result: list[bytes] = []
+    chunk: list[Event[EventStateChangedData]] = []
+    entity_ids: set[str] = set()
+    for event in events:
+        if (entity_id := event.data["entity_id"]) in entity_ids:
+            result.extend(_state_diff_batch_messages(message_id_as_bytes, chunk))
+            chunk = []
+            entity_ids.clear()
+        entity_ids.add(entity_id)
+        chunk.append(event)
+    result.extend(_state_diff_batch_messages(message_id_as_bytes, chunk))
+    return result
+
+
+def _state_diff_batch_messages(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> list[bytes]:
+    """Return one event message with the state diffs of different entities."""
+    if len(events) == 1:
+        return [cached_state_diff_message(message_id_as_bytes, events[0])]
+    combined: dict[str, Any] = {}
+    for event in events:
+        for key, value in _state_diff_event(event).items():
+            if key == ENTITY_EVENT_REMOVE:
+                combined.setdefault(key, []).extend(value)
+            else:
+                combined.setdefault(key, {}).update(value)
+    if (
+        partial_message := _message_to_json_bytes_or_none(
+            {"type": "event", "event": combined}
+        )
+    ) is None:
+        # Only leave out the states that can not be serialized
+        return [
+            cached_state_diff_message(message_id_as_bytes, event) for event in events
+        ]
+    return [b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))]
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
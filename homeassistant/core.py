@@ -12,18 +12,22 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
+import contextlib
 from dataclasses import dataclass
 import datetime
 import enum
 import functools
 import inspect
 import logging
+import math
 import re
 import threading
 import time
@@ -39,6 +43,7 @@ from typing import (
     cast,
     overload,
 )
+import weakref
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -1431,6 +1436,25 @@ _FilterableJobType = tuple[
 ]
 
 
+def _keyed_jobs(
+    keyed: dict[str, dict[Hashable, list[_FilterableJobType[Any]]]],
+    event_data: Mapping[str, Any],
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listeners matching the event data."""
+    jobs: list[_FilterableJobType[Any]] = []
+    for data_key, jobs_by_value in keyed.items():
+        if (value := event_data.get(data_key, _SENTINEL)) is _SENTINEL:
+            continue
+        try:
+            keyed_jobs = jobs_by_value.get(value)
+        except TypeError:
+            # Unhashable values can never match a keyed listener
+            continue
+        if keyed_jobs:
+            jobs.extend(keyed_jobs)
+    return jobs
+
+
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
     hass: HomeAssistant
@@ -1469,15 +1493,31 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        # event_type -> data key -> data value -> listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Hashable, list[_FilterableJobType[Any]]]],
+        ] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # job of the single event listener -> batch listener
+        self._batch_listeners: dict[
+            HassJob[..., Any], Callable[[list[Event[Any]]], None]
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1493,7 +1533,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(jobs)
+                for jobs_by_value in keyed.values()
+                for jobs in jobs_by_value.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1559,6 +1606,8 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_data is not None and (keyed := self._keyed_listeners.get(event_type)):
+            listeners = listeners + _keyed_jobs(keyed, event_data)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1588,6 +1637,78 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        batch: Iterable[tuple[_DataT, Context | None, float | None]],
+        origin: EventOrigin = EventOrigin.local,
+    ) -> None:
+        """Fire a batch of events of the same type, for internal use only.
+
+        batch is an iterable of (event_data, context, time_fired) tuples.
+
+        Listeners registered with async_listen_batch are called once with
+        all events of the batch, then the other listeners are called for
+        each event in order. Unlike firing the events one by one, batch
+        listeners therefore see every event of the batch before any other
+        listener sees the first one.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        events = [
+            Event(event_type, event_data, origin, time_fired, context)
+            for event_data, context, time_fired in batch
+        ]
+        if not events:
+            return
+
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = self._match_all_listeners
+        else:
+            match_all_listeners = EMPTY_LIST
+
+        batch_listeners = self._batch_listeners
+        if batch_listeners:
+            for job, _ in (
+                self._listeners.get(event_type, EMPTY_LIST) + match_all_listeners
+            ):
+                if (batch_listener := batch_listeners.get(job)) is None:
+                    continue
+                try:
+                    batch_listener(events)
+                except Exception:
+                    _LOGGER.exception("Error running batch listener: %s", job)
+
+        for event in events:
+            event_data = event.data
+            if self._debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+            listeners = self._listeners.get(event_type, EMPTY_LIST)
+            if keyed := self._keyed_listeners.get(event_type):
+                listeners = listeners + _keyed_jobs(keyed, event_data)
+            for job, event_filter in listeners + match_all_listeners:
+                if job in batch_listeners:
+                    continue
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1663,6 +1784,126 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[Event[_DataT]], None],
+        batch_listener: Callable[[list[Event[_DataT]]], None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type and handle batches at once.
+
+        The listener is called for events fired on their own. The
+        batch_listener is called once with all events of a batch, such as
+        the state_changed events of StateMachine.async_set_many, so the
+        events can be processed in one pass. Both must be callables
+        decorated with @callback.
+
+        The batch_listener runs before the other listeners are called for
+        the first event of the batch, so it must not rely on the order in
+        which listeners are called relative to each other.
+
+        To listen to all events specify the constant ``MATCH_ALL``
+        as event_type.
+
+        This method must be run in the event loop.
+        """
+        for func in (listener, batch_listener):
+            if not is_callback_check_partial(func):
+                raise HomeAssistantError(f"Batch listener {func} is not a callback")
+        job: HassJob[[Event[_DataT]], None] = HassJob(
+            listener, f"listen batch {event_type}"
+        )
+        self._batch_listeners[job] = batch_listener
+        return functools.partial(
+            self._async_remove_batch_listener,
+            self._async_listen_filterable_job(event_type, (job, None)),
+            job,
+        )
+
+    @callback
+    def _async_remove_batch_listener(
+        self, remove_listener: CALLBACK_TYPE, job: HassJob[..., Any]
+    ) -> None:
+        """Remove a batch listener.
+
+        This method must be run in the event loop.
+        """
+        remove_listener()
+        self._batch_listeners.pop(job, None)
+
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        value: Hashable,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type where data_key equals value.
+
+        Keyed listeners are dispatched with a dict lookup on the event data
+        instead of running a filter for every listener of the event type,
+        which keeps firing cheap when there are many listeners that each
+        only care about a single value of the same data key.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, is run after the key matches
+        to determine if the listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError(
+                f"Keyed listeners can't be used for event {MATCH_ALL}"
+            )
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {data_key}={value}"),
+            event_filter,
+        )
+        self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        ).setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            data_key,
+            value,
+            filterable_job,
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        value: Hashable,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed = self._keyed_listeners[event_type]
+            jobs_by_value = keyed[data_key]
+            jobs = jobs_by_value[value]
+            jobs.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+        if not jobs:
+            del jobs_by_value[value]
+            if not jobs_by_value:
+                del keyed[data_key]
+                if not keyed:
+                    del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2073,10 +2314,68 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+# Only attribute values of these types are shared between states since the
+# interning key must not treat equal values of different types (1 and True)
+# as the same attributes. Floats also carry their sign in the key since
+# -0.0 == 0.0.
+_INTERNABLE_ATTRIBUTE_TYPES = {str, int, float, bool, type(None)}
+
+
+class _StateAttributesInterner:
+    """Share identical attribute mappings between states.
+
+    Large installs tend to have many states with exactly the same
+    attributes. Interning keeps a single ReadOnlyDict for each distinct
+    set of attributes instead of one copy per state. Mappings are held
+    weakly so they are released when no state references them anymore.
+    """
+
+    __slots__ = ("_attributes",)
+
+    def __init__(self) -> None:
+        """Initialize the interner."""
+        self._attributes: weakref.WeakValueDictionary[
+            tuple[tuple[Any, ...], ...], ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Return the number of distinct attribute mappings."""
+        return len(self._attributes)
+
+    def intern(self, attributes: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return a shared ReadOnlyDict equal to attributes if possible."""
+        internable_types = _INTERNABLE_ATTRIBUTE_TYPES
+        for value in attributes.values():
+            if type(value) not in internable_types:
+                return attributes
+        # The key keeps the order of the attributes since it shows up
+        # in the serialized state
+        key = tuple(
+            (name, float, value, math.copysign(1.0, value))
+            if type(value) is float
+            else (name, type(value), value)
+            for name, value in attributes.items()
+        )
+        if (shared := self._attributes.get(key)) is not None:
+            return shared
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        self._attributes[key] = attributes
+        return attributes
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_attributes_interner",
+        "_batched_changes",
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2087,6 +2386,38 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._attributes_interner: _StateAttributesInterner | None = None
+        self._batched_changes: (
+            list[tuple[EventStateChangedData, Context | None, float | None]] | None
+        ) = None
+
+    @callback
+    def async_enable_attribute_interning(self) -> None:
+        """Share identical attribute mappings between states.
+
+        This is opt-in as it trades a small amount of CPU time on each
+        attribute change for lower memory usage on installs with many
+        entities that have the same attributes. Bootstrap enables it
+        before any states are set when Home Assistant is started with
+        --intern-state-attributes.
+
+        Only the attributes of states set afterwards are interned, the
+        attributes of existing states are left alone.
+
+        This method must be run in the event loop.
+        """
+        if self._attributes_interner is None:
+            self._attributes_interner = _StateAttributesInterner()
+
+    @callback
+    def async_interned_attributes_count(self) -> int | None:
+        """Return the number of distinct interned attribute mappings.
+
+        Returns None if attribute interning is not enabled.
+        """
+        if self._attributes_interner is None:
+            return None
+        return len(self._attributes_interner)
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2204,6 +2535,9 @@ class StateMachine:
             "old_state": old_state,
             "new_state": None,
         }
+        if (batched_changes := self._batched_changes) is not None:
+            batched_changes.append((state_changed_data, context, None))
+            return True
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2292,6 +2626,63 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities at once.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+
+        The states are written with the same timestamp and their
+        state_changed events are fired as one batch, see
+        async_batch_state_changes. Each entity gets its own context
+        unless one is passed.
+
+        This method must be run in the event loop.
+        """
+        timestamp = timestamp or time.time()
+        with self.async_batch_state_changes():
+            for entity_id, new_state, attributes in states:
+                self.async_set_internal(
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+
+    @contextlib.contextmanager
+    def async_batch_state_changes(self) -> Generator[None]:
+        """Fire the state_changed events of the states set in the block as a batch.
+
+        The states are written right away but the events are held back
+        until the block exits, then fired in order with one call to the
+        listeners registered with EventBus.async_listen_batch. Those are
+        called before the other listeners, see
+        EventBus.async_fire_batch_internal.
+
+        Nested blocks are part of the outermost batch. The block must
+        not await since states set by other tasks would be batched too.
+
+        This method must be run in the event loop.
+        """
+        if self._batched_changes is not None:
+            yield
+            return
+        self._batched_changes = batched_changes = []
+        try:
+            yield
+        finally:
+            self._batched_changes = None
+            self._bus.async_fire_batch_internal(EVENT_STATE_CHANGED, batched_changes)
+
     @callback
     def async_set_internal(
         self,
@@ -2367,6 +2758,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif self._attributes_interner is not None and attributes:
+            attributes = self._attributes_interner.intern(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2390,6 +2783,9 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
+        if (batched_changes := self._batched_changes) is not None:
+            batched_changes.append((state_changed_data, context, timestamp))
+            return
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
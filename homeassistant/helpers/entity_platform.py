@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Iterable
+from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
@@ -949,6 +950,20 @@ class EntityPlatform:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
 
+    @contextmanager
+    def async_batch_state_writes(self) -> Generator[None]:
+        """Write the states of the entities updated in the block as one batch.
+
+        Integrations that update many entities of the platform from a
+        single message, such as one device frame, can wrap the calls to
+        async_write_ha_state so the state_changed events are handled
+        in one pass by the recorder and the websocket subscriptions.
+
+        The block must not await.
+        """
+        with self.hass.states.async_batch_state_changes():
+            yield
+
     @callback
     def async_prepare(self) -> None:
         """Register the entity platform in DATA_ENTITY_PLATFORM."""
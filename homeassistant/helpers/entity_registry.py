@@ -373,30 +373,37 @@ class RegistryEntry:
     @callback
     def write_unavailable_state(self, hass: HomeAssistant) -> None:
         """Write the unavailable state to the state machine."""
-        attrs: dict[str, Any] = {ATTR_RESTORED: True}
+        hass.states.async_set(
+            self.entity_id, STATE_UNAVAILABLE, _unavailable_state_attributes(self)
+        )
 
-        if self.capabilities is not None:
-            attrs.update(self.capabilities)
 
-        device_class = self.device_class or self.original_device_class
-        if device_class is not None:
-            attrs[ATTR_DEVICE_CLASS] = device_class
+def _unavailable_state_attributes(entry: RegistryEntry) -> dict[str, Any]:
+    """Return the attributes of the unavailable state of a registry entry."""
+    attrs: dict[str, Any] = {ATTR_RESTORED: True}
 
-        icon = self.icon or self.original_icon
-        if icon is not None:
-            attrs[ATTR_ICON] = icon
+    if entry.capabilities is not None:
+        attrs.update(entry.capabilities)
 
-        name = self.name or self.original_name
-        if name is not None:
-            attrs[ATTR_FRIENDLY_NAME] = name
+    device_class = entry.device_class or entry.original_device_class
+    if device_class is not None:
+        attrs[ATTR_DEVICE_CLASS] = device_class
 
-        if self.supported_features is not None:
-            attrs[ATTR_SUPPORTED_FEATURES] = self.supported_features
+    icon = entry.icon or entry.original_icon
+    if icon is not None:
+        attrs[ATTR_ICON] = icon
 
-        if self.unit_of_measurement is not None:
-            attrs[ATTR_UNIT_OF_MEASUREMENT] = self.unit_of_measurement
+    name = entry.name or entry.original_name
+    if name is not None:
+        attrs[ATTR_FRIENDLY_NAME] = name
 
-        hass.states.async_set(self.entity_id, STATE_UNAVAILABLE, attrs)
+    if entry.supported_features is not None:
+        attrs[ATTR_SUPPORTED_FEATURES] = entry.supported_features
+
+    if entry.unit_of_measurement is not None:
+        attrs[ATTR_UNIT_OF_MEASUREMENT] = entry.unit_of_measurement
+
+    return attrs
 
 
 @attr.s(frozen=True, slots=True)
@@ -549,13 +556,17 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains ten additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+    - platform -> dict[key, True]
+    - category_id -> dict[key, True]
+    - domain -> dict[key, True]
+    - disabled_by -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -567,6 +578,10 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._platform_index: RegistryIndexType = defaultdict(dict)
+        self._categories_index: RegistryIndexType = defaultdict(dict)
+        self._domain_index: RegistryIndexType = defaultdict(dict)
+        self._disabled_by_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -582,6 +597,12 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._area_id_index[area_id][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
+        self._platform_index[entry.platform][key] = True
+        for category_id in entry.categories.values():
+            self._categories_index[category_id][key] = True
+        self._domain_index[entry.domain][key] = True
+        if (disabled_by := entry.disabled_by) is not None:
+            self._disabled_by_index[disabled_by][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -599,6 +620,14 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
+        self._unindex_entry_value(key, entry.platform, self._platform_index)
+        if categories := entry.categories:
+            # The same category id may be set for more than one scope
+            for category_id in set(categories.values()):
+                self._unindex_entry_value(key, category_id, self._categories_index)
+        self._unindex_entry_value(key, entry.domain, self._domain_index)
+        if disabled_by := entry.disabled_by:
+            self._unindex_entry_value(key, disabled_by, self._disabled_by_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -642,6 +671,40 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_entries_for_platform(self, platform: str) -> list[RegistryEntry]:
+        """Get entries for platform."""
+        data = self.data
+        return [data[key] for key in self._platform_index.get(platform, ())]
+
+    def get_entries_for_category(
+        self, scope: str, category_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for category in a scope."""
+        data = self.data
+        return [
+            entry
+            for key in self._categories_index.get(category_id, ())
+            if (entry := data[key]).categories.get(scope) == category_id
+        ]
+
+    def get_entries_for_domain(
+        self, domain: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for domain."""
+        data = self.data
+        return [
+            entry
+            for key in self._domain_index.get(domain, ())
+            if not (entry := data[key]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_disabled_by(
+        self, disabled_by: RegistryEntryDisabler
+    ) -> list[RegistryEntry]:
+        """Get entries disabled by a disabler."""
+        data = self.data
+        return [data[key] for key in self._disabled_by_index.get(disabled_by, ())]
+
 
 def _validate_item(
     hass: HomeAssistant,
@@ -1370,13 +1433,10 @@ class EntityRegistry(BaseRegistry):
     @callback
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear category id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if (
-                existing_category_id := entry.categories.get(scope)
-            ) and category_id == existing_category_id:
-                categories = entry.categories.copy()
-                del categories[scope]
-                self.async_update_entity(entity_id, categories=categories)
+        for entry in self.entities.get_entries_for_category(scope, category_id):
+            categories = entry.categories.copy()
+            del categories[scope]
+            self.async_update_entity(entry.entity_id, categories=categories)
 
     @callback
     def async_clear_label_id(self, label_id: str) -> None:
@@ -1469,14 +1529,31 @@ def async_entries_for_category(
     registry: EntityRegistry, scope: str, category_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a category in a scope."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if (
-            (existing_category_id := entry.categories.get(scope))
-            and category_id == existing_category_id
-        )
-    ]
+    return registry.entities.get_entries_for_category(scope, category_id)
+
+
+@callback
+def async_entries_for_platform(
+    registry: EntityRegistry, platform: str
+) -> list[RegistryEntry]:
+    """Return entries that match a platform."""
+    return registry.entities.get_entries_for_platform(platform)
+
+
+@callback
+def async_entries_for_domain(
+    registry: EntityRegistry, domain: str, include_disabled_entities: bool = False
+) -> list[RegistryEntry]:
+    """Return entries that match an entity domain."""
+    return registry.entities.get_entries_for_domain(domain, include_disabled_entities)
+
+
+@callback
+def async_entries_for_disabled_by(
+    registry: EntityRegistry, disabled_by: RegistryEntryDisabler
+) -> list[RegistryEntry]:
+    """Return entries that are disabled by a disabler."""
+    return registry.entities.get_entries_for_disabled_by(disabled_by)
 
 
 @callback
@@ -1607,11 +1684,15 @@ def _async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) -
         """Make sure state machine contains entry for each registered entity."""
         existing = set(hass.states.async_entity_ids())
 
-        for entry in registry.entities.values():
-            if entry.entity_id in existing or entry.disabled:
-                continue
-
-            entry.write_unavailable_state(hass)
+        hass.states.async_set_many(
+            (
+                entry.entity_id,
+                STATE_UNAVAILABLE,
+                _unavailable_state_attributes(entry),
+            )
+            for entry in registry.entities.values()
+            if entry.entity_id not in existing and not entry.disabled
+        )
 
     hass.bus.async_listen(EVENT_HOMEASSISTANT_START, _write_unavailable_states)
 
@@ -1975,11 +1975,20 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        # Skip the render if only attributes changed and the
+        # template never read more than the state value
+        return (
+            new_state is None
+            or old_state is None
+            or new_state.state != old_state.state
+            or info.filter_attribute_change(entity_id)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
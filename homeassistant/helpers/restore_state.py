@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+from propcache import cached_property
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -18,7 +20,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -96,6 +98,55 @@ class StoredState:
         )
 
 
+class _LazyStoredState(StoredState):
+    """A stored state loaded from storage that is decoded when first used.
+
+    Most stored states are never restored or are only restored by a
+    single entity, so they are kept as loaded until they are needed.
+    Saving them again reuses the loaded data instead of converting it
+    to a State and back.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, json_dict: dict[str, Any], last_seen: datetime
+    ) -> None:
+        """Initialize a new lazy stored state."""
+        self._json_dict = json_dict
+        self.last_seen = last_seen
+
+    @cached_property
+    def state(self) -> State:
+        """Return the stored state."""
+        return cast(State, State.from_dict(self._json_dict["state"]))
+
+    @cached_property
+    def extra_data(self) -> ExtraStoredData | None:
+        """Return the stored extra data."""
+        extra_data_dict = self._json_dict.get("extra_data")
+        return RestoredExtraData(extra_data_dict) if extra_data_dict else None
+
+    @cached_property
+    def _state_json_fragment(self) -> json_fragment:
+        """Return the stored state as a JSON fragment."""
+        return json_fragment(json_bytes(self._json_dict["state"]))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to be JSON serialized."""
+        return {
+            "state": self._state_json_fragment,
+            "extra_data": self._json_dict.get("extra_data"),
+            "last_seen": self.last_seen,
+        }
+
+    @classmethod
+    def from_dict(cls, json_dict: dict) -> Self:
+        """Initialize a lazy stored state from a dict."""
+        last_seen = json_dict["last_seen"]
+        if isinstance(last_seen, str):
+            last_seen = dt_util.parse_datetime(last_seen)
+        return cls(json_dict, last_seen)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -164,7 +215,7 @@ class RestoreStateData:
             self.last_states = {}
         else:
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: _LazyStoredState.from_dict(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -77,7 +77,7 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
     HassKey("service_description_cache")
 )
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
-    tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
+    tuple[set[tuple[str, str]] | None, dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
 
 
@@ -713,12 +713,13 @@ async def async_get_all_descriptions(
         for service_name in services_by_domain
     }
     # If we have a complete cache, check if it is still valid
-    all_cache: tuple[set[tuple[str, str]], dict[str, dict[str, Any]]] | None
+    previous_descriptions: dict[str, dict[str, Any]] = {}
+    all_cache: tuple[set[tuple[str, str]] | None, dict[str, dict[str, Any]]] | None
     if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
-        previous_all_services, previous_descriptions_cache = all_cache
+        previous_all_services, previous_descriptions = all_cache
         # If the services are the same, we can return the cache
         if previous_all_services == all_services:
-            return previous_descriptions_cache
+            return previous_descriptions
 
     # Files we loaded for missing descriptions
     loaded: dict[str, JSON_TYPE] = {}
@@ -745,7 +746,10 @@ async def async_get_all_descriptions(
             contents = await hass.async_add_executor_job(
                 _load_services_files, hass, integrations
             )
-            loaded = dict(zip(domains_with_missing_services, contents, strict=False))
+            loaded = {
+                integration.domain: content
+                for integration, content in zip(integrations, contents, strict=True)
+            }
 
     # Load translations for all service domains
     translations = await translation.async_get_translations(
@@ -823,10 +827,29 @@ async def async_get_all_descriptions(
 
             domain_descriptions[service_name] = description
 
+        # Keep the previous dict of a domain if none of its descriptions
+        # changed so consumers can tell which domains changed by identity
+        if (
+            previous_domain_descriptions := previous_descriptions.get(domain)
+        ) is not None and _same_descriptions(
+            previous_domain_descriptions, domain_descriptions
+        ):
+            descriptions[domain] = previous_domain_descriptions
+
     hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (all_services, descriptions)
     return descriptions
 
 
+def _same_descriptions(
+    previous: dict[str, dict[str, Any]], current: dict[str, dict[str, Any]]
+) -> bool:
+    """Return if two dicts of descriptions hold the same description objects."""
+    return len(previous) == len(current) and all(
+        previous.get(service_name) is description
+        for service_name, description in current.items()
+    )
+
+
 @callback
 def remove_entity_service_fields(call: ServiceCall) -> dict[Any, Any]:
     """Remove entity service fields."""
@@ -864,7 +887,9 @@ def async_set_service_schema(
             "optional": response == SupportsResponse.OPTIONAL,
         }
 
-    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
+    if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
+        # Keep the descriptions so unchanged domains can be reused
+        hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (None, all_cache[1])
     descriptions_cache[(domain, service)] = description
 
 
@@ -1164,10 +1189,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in entity_registry.async_entries_for_platform(reg, domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
@@ -11,6 +11,7 @@ from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from propcache import cached_property
@@ -115,6 +116,7 @@ class _StoreManager:
         self._invalidated: set[str] = set()
         self._files: set[str] | None = None
         self._data_preload: dict[str, json_util.JsonValueType] = {}
+        self._preload_futures: dict[str, asyncio.Future[dict[str, float]]] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
 
@@ -203,23 +205,73 @@ class _StoreManager:
         """
         self._data_preload.clear()
 
-    async def async_preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
-        # If async_initialize has not been called yet, we can't preload
-        if self._files is not None and (existing := self._files.intersection(keys)):
-            await self._hass.async_add_executor_job(self._preload, existing)
+    @callback
+    def async_get_preload_future(
+        self, key: str
+    ) -> asyncio.Future[dict[str, float]] | None:
+        """Return a future that is done when the key is preloaded.
+
+        Returns None if the key is not being preloaded.
+        """
+        return self._preload_futures.get(key)
+
+    async def async_preload(self, keys: Iterable[str]) -> dict[str, float]:
+        """Cache the keys.
 
-    def _preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
+        The files are read and parsed in up to MAX_LOAD_CONCURRENTLY
+        executor jobs in parallel. Returns how long reading and parsing
+        each file took.
+        """
+        # If async_initialize has not been called yet, we can't preload
+        if (files := self._files) is None:
+            return {}
+        existing = [
+            key
+            for key in dict.fromkeys(keys)
+            if key in files
+            and key not in self._invalidated
+            and key not in self._data_preload
+            and key not in self._preload_futures
+        ]
+        if not existing:
+            return {}
+        # Keys are in order of when we expect to load them so we
+        # spread them over the jobs to load the first ones first
+        jobs = min(MAX_LOAD_CONCURRENTLY, len(existing))
+        futures: list[asyncio.Future[dict[str, float]]] = []
+        for job in range(jobs):
+            chunk = existing[job::jobs]
+            future = self._hass.async_add_executor_job(self._preload, chunk)
+            futures.append(future)
+            for key in chunk:
+                self._preload_futures[key] = future
+        try:
+            # Use wait so the jobs are not cancelled if we are
+            # since stores may be waiting for them
+            await asyncio.wait(futures)
+        finally:
+            for key in existing:
+                self._preload_futures.pop(key, None)
+        load_times: dict[str, float] = {}
+        for future in futures:
+            load_times.update(future.result())
+        return load_times
+
+    def _preload(self, keys: Iterable[str]) -> dict[str, float]:
+        """Cache the keys and return how long loading each one took."""
         storage_path = self._storage_path
         data_preload = self._data_preload
+        load_times: dict[str, float] = {}
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
+            start = time.monotonic()
             try:
                 if storage_file.is_file():
                     data_preload[key] = json_util.load_json(storage_file)
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
+            load_times[key] = time.monotonic() - start
+        return load_times
 
     def _initialize_files(self) -> None:
         """Initialize the cache."""
@@ -311,6 +363,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
     async def _async_load_data(self):
         """Load the data."""
+        if preload_future := self._manager.async_get_preload_future(self.key):
+            # Wait for the file to be preloaded instead of reading it again,
+            # shielded since other stores may be waiting for the same job
+            await asyncio.shield(preload_future)
+
         # Check if we have a pending write
         if self._data is not None:
             data = self._data
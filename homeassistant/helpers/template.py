@@ -85,6 +85,8 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .template_code_cache import DATA_TEMPLATE_CODE_CACHE, TemplateCodeCache
+from .template_fast_path import FastPathCode, FastPathTemplate, async_compile_fast_path
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -123,6 +125,8 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+# State object attributes that do not change unless the state value changes
+_STATE_VALUE_ATTRIBUTES = {"state", "domain", "object_id"}
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
@@ -151,6 +155,9 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+# Number of template sources per environment whose fast path outcome
+# is remembered so they are only parsed once
+FAST_PATH_CACHE_SIZE = 4096
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
@@ -385,6 +392,9 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entities_full_state",
+        "collection_full_state",
+        "filter_attribute_change",
         "rate_limit",
         "has_time",
     )
@@ -403,6 +413,12 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities where more than the state value was read
+        self.entities_full_state: collections.abc.Set[str] = set()
+        # Set if more than the state value was read from a state
+        # found by iterating over all states or a domain
+        self.collection_full_state = False
+        self.filter_attribute_change: Callable[[str], bool] = _true
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -438,6 +454,17 @@ class RenderInfo:
         """
         return entity_id in self.entities
 
+    def _filter_attribute_change(self, entity_id: str) -> bool:
+        """Template should re-render if only the entity attributes change.
+
+        Only when the template read more than the state value.
+        """
+        if entity_id in self.entities_full_state:
+            return True
+        return self.collection_full_state and (
+            self.all_states or split_entity_id(entity_id)[0] in self.domains
+        )
+
     def _filter_lifecycle_domains(self, entity_id: str) -> bool:
         """Template should re-render if the entity is added or removed.
 
@@ -458,6 +485,7 @@ class RenderInfo:
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
+        self.entities_full_state = frozenset(self.entities_full_state)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -473,6 +501,8 @@ class RenderInfo:
         if self.exception:
             return
 
+        self.filter_attribute_change = self._filter_attribute_change
+
         if not self.all_states_lifecycle:
             if self.domains_lifecycle:
                 self.filter_lifecycle = self._filter_lifecycle_domains
@@ -531,7 +561,7 @@ class Template:
 
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
-        self._compiled: jinja2.Template | None = None
+        self._compiled: jinja2.Template | FastPathTemplate | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -826,7 +856,7 @@ class Template:
         limited: bool = False,
         strict: bool = False,
         log_fn: Callable[[int, str], None] | None = None,
-    ) -> jinja2.Template:
+    ) -> jinja2.Template | FastPathTemplate:
         """Bind a template to a specific hass instance."""
         self.ensure_valid()
 
@@ -848,9 +878,13 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
+        compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._compiled = (
+            async_compile_fast_path(env, self.template, compiled, env.fast_path_cache)
+            or compiled
+        )
 
         return self._compiled
 
@@ -1042,6 +1076,16 @@ class TemplateStateBase(State):
         self._cache: dict[str, Any] = {}
 
     def _collect_state(self) -> None:
+        """Collect a read of more than the state value."""
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                render_info.entities_full_state.add(self._entity_id)  # type: ignore[attr-defined]
+            else:
+                render_info.collection_full_state = True
+
+    def _collect_state_value(self) -> None:
+        """Collect a read of the state value only."""
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
@@ -1050,9 +1094,10 @@ class TemplateStateBase(State):
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if item in _STATE_VALUE_ATTRIBUTES:
+                self._collect_state_value()
+            else:
+                self._collect_state()
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1071,7 +1116,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1107,13 +1152,13 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.object_id
 
     @property
@@ -1164,6 +1209,8 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        # Rendering the whole state includes its attributes
+        self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -2727,7 +2774,7 @@ _template_context_manager = TemplateContextManager()
 
 
 def _render_with_context(
-    template_str: str, template: jinja2.Template, **kwargs: Any
+    template_str: str, template: jinja2.Template | FastPathTemplate, **kwargs: Any
 ) -> str:
     """Store template being rendered in a ContextVar to aid error handling."""
     with _template_context_manager as cm:
@@ -2854,9 +2901,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Environments with a custom log function are short lived
+        # and are not worth persisting compiled code for
+        self._code_cache_kind: str | None = None
+        if hass is not None and log_fn is None:
+            self._code_cache_kind = (
+                "limited" if limited else "strict" if strict else "default"
+            )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.fast_path_cache: LRU[str, FastPathCode | None] = LRU(FAST_PATH_CACHE_SIZE)
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3209,8 +3264,23 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
+        code_cache: TemplateCodeCache | None = None
+        if (
+            (kind := self._code_cache_kind) is not None
+            and type(source) is str
+            and self.hass is not None
+        ):
+            code_cache = self.hass.data.get(DATA_TEMPLATE_CODE_CACHE)
+        if code_cache is not None and (
+            compiled := code_cache.get(kind, source)  # type: ignore[arg-type]
+        ):
+            self.template_cache[source] = compiled
+            return compiled
+
         compiled = super().compile(source)
         self.template_cache[source] = compiled
+        if code_cache is not None:
+            code_cache.set(kind, source, compiled)  # type: ignore[arg-type]
         return compiled
 
 
@@ -0,0 +1,157 @@
+"""Persistent cache of compiled template code."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import logging
+import marshal
+import os
+import sys
+from types import CodeType
+from typing import Any
+
+import jinja2
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+    __version__,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+from .storage import STORAGE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TEMPLATE_CODE_CACHE: HassKey[TemplateCodeCache] = HassKey("template_code_cache")
+
+TEMPLATE_CODE_CACHE_FILE = "core.template_code_cache"
+TEMPLATE_CODE_CACHE_SIZE = 10000
+
+# Compiled code is only valid for the Python version that created it and
+# the generated code depends on the Jinja and Home Assistant versions.
+_CACHE_VERSION = (
+    1,
+    __version__,
+    jinja2.__version__,
+    sys.implementation.cache_tag,
+)
+
+
+def _cache_key(kind: str, source: str) -> bytes:
+    """Return the cache key for a template source in an environment kind."""
+    return hashlib.sha256(f"{kind}\0{source}".encode()).digest()
+
+
+class TemplateCodeCache:
+    """Least recently used cache of marshaled template code.
+
+    Entries are kept marshaled and only loaded into code objects
+    when a template with a matching source is compiled.
+    """
+
+    def __init__(self, path: str, max_size: int = TEMPLATE_CODE_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @callback
+    def get(self, kind: str, source: str) -> CodeType | None:
+        """Return the cached code for a template source."""
+        key = _cache_key(kind, source)
+        if (data := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        try:
+            code = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            del self._entries[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return code  # type: ignore[no-any-return]
+
+    @callback
+    def set(self, kind: str, source: str, code: CodeType) -> None:
+        """Store the compiled code for a template source."""
+        key = _cache_key(kind, source)
+        self._entries[key] = marshal.dumps(code)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load the cache from disk.
+
+        Must be run in the executor.
+        """
+        try:
+            with open(self.path, "rb") as fdesc:
+                data = marshal.load(fdesc)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Ignoring unreadable template code cache: %s", err)
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != _CACHE_VERSION
+            or not isinstance(entries := data.get("entries"), dict)
+        ):
+            _LOGGER.debug("Ignoring outdated template code cache")
+            return
+        self._entries = OrderedDict(entries)
+
+    @callback
+    def async_snapshot(self) -> dict[str, Any] | None:
+        """Return the data to save or None if nothing changed."""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return {"version": _CACHE_VERSION, "entries": dict(self._entries)}
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Save a snapshot of the cache to disk.
+
+        Must be run in the executor.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, marshal.dumps(data), True, "wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Unable to save template code cache: %s", err)
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Load the template code cache and save it on start and stop."""
+    cache = TemplateCodeCache(hass.config.path(STORAGE_DIR, TEMPLATE_CODE_CACHE_FILE))
+    await hass.async_add_executor_job(cache.load)
+    hass.data[DATA_TEMPLATE_CODE_CACHE] = cache
+
+    async def _async_save(_event: Event) -> None:
+        """Save the cache."""
+        _LOGGER.debug(
+            "Template code cache has %s entries, %s hits, %s misses",
+            len(cache),
+            cache.hits,
+            cache.misses,
+        )
+        if (data := cache.async_snapshot()) is not None:
+            await hass.async_add_executor_job(cache.save, data)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
@@ -0,0 +1,233 @@
+"""Render simple templates without going through Jinja."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, MutableMapping
+import operator
+from typing import Any
+
+import jinja2
+from jinja2 import nodes
+from jinja2.sandbox import SandboxedEnvironment
+
+# Only templates this short are considered for the fast path
+# since larger templates are unlikely to use the restricted subset.
+MAX_FAST_PATH_TEMPLATE_LENGTH = 255
+
+# Globals that can be called from a fast path template. They must not
+# need the Jinja context or only ignore it like the hassfunction wrappers.
+FAST_PATH_GLOBALS = {"states", "is_state", "is_state_attr", "state_attr", "has_value"}
+FAST_PATH_FILTERS = {"float", "int", "round"}
+
+_BINARY_OPERATORS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+    nodes.Pow: operator.pow,
+}
+_UNARY_OPERATORS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Neg: operator.neg,
+    nodes.Pos: operator.pos,
+    nodes.Not: operator.not_,
+}
+_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+}
+
+type _Evaluator = Callable[[], Any]
+type FastPathCode = tuple[frozenset[str], list[_Evaluator]]
+
+
+class _Unsupported(Exception):
+    """Raised when a template uses something outside the fast path subset."""
+
+
+class FastPathTemplate:
+    """A template rendered by directly evaluating its Jinja nodes.
+
+    Only a restricted subset of expressions is supported: constants, calls
+    to state functions, the float, int and round filters, arithmetic,
+    comparisons and boolean operators. Values are computed with the same
+    functions and Python operators the Jinja generated code uses, so the
+    output and the entities collected for RenderInfo are identical.
+    """
+
+    __slots__ = ("_jinja_template", "_names", "_parts")
+
+    def __init__(
+        self,
+        jinja_template: jinja2.Template,
+        names: frozenset[str],
+        parts: list[_Evaluator],
+    ) -> None:
+        """Initialize the fast path template."""
+        self._jinja_template = jinja_template
+        self._names = names
+        self._parts = parts
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        """Render the template."""
+        if args or (kwargs and not self._names.isdisjoint(kwargs)):
+            # Variables shadow the globals, let Jinja resolve them
+            return self._jinja_template.render(*args, **kwargs)
+        return "".join([str(part()) for part in self._parts])
+
+
+def async_compile_fast_path(
+    env: SandboxedEnvironment,
+    source: str,
+    jinja_template: jinja2.Template,
+    code_cache: MutableMapping[str, FastPathCode | None],
+) -> FastPathTemplate | None:
+    """Return a fast path template if the source is in the supported subset.
+
+    The outcome is remembered in code_cache so each source is only parsed
+    once per environment, including sources that do not qualify.
+    """
+    try:
+        code = code_cache[source]
+    except KeyError:
+        code = code_cache[source] = _compile_fast_path_code(env, source)
+    if code is None:
+        return None
+    return FastPathTemplate(jinja_template, *code)
+
+
+def _compile_fast_path_code(
+    env: SandboxedEnvironment, source: str
+) -> FastPathCode | None:
+    """Compile the source to fast path evaluators if it is supported."""
+    if len(source) > MAX_FAST_PATH_TEMPLATE_LENGTH or "{%" in source or "{#" in source:
+        return None
+    try:
+        tree = env.parse(source)
+    except jinja2.TemplateError:
+        return None
+    names: set[str] = set()
+    parts: list[_Evaluator] = []
+    try:
+        for node in tree.body:
+            if not isinstance(node, nodes.Output):
+                return None
+            for child in node.nodes:
+                if isinstance(child, nodes.TemplateData):
+                    data = child.data
+                    parts.append(lambda data=data: data)
+                else:
+                    parts.append(_compile_expr(env, child, names))
+    except _Unsupported:
+        return None
+    if not names:
+        # Templates that do not use any state are cheap to render with Jinja
+        return None
+    return frozenset(names), parts
+
+
+def _compile_expr(
+    env: SandboxedEnvironment, node: nodes.Node, names: set[str]
+) -> _Evaluator:
+    """Compile a Jinja expression node to a callable."""
+    if isinstance(node, nodes.Const):
+        value = node.value
+        if not isinstance(value, (str, int, float, bool, type(None))):
+            raise _Unsupported
+        return lambda: value
+
+    if isinstance(node, nodes.Call):
+        if (
+            not isinstance(node.node, nodes.Name)
+            or node.node.name not in FAST_PATH_GLOBALS
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _Unsupported
+        name = node.node.name
+        func = env.globals[name]
+        if not env.is_safe_callable(func):
+            raise _Unsupported
+        names.add(name)
+        args = [_compile_expr(env, arg, names) for arg in node.args]
+        if getattr(func, "jinja_pass_arg", None) is not None:
+            # The hassfunction wrappers only need the context to make Jinja
+            # call them on every render, the context itself is discarded
+            return lambda: func(None, *[arg() for arg in args])
+        return lambda: func(*[arg() for arg in args])
+
+    if isinstance(node, nodes.Filter):
+        if (
+            node.name not in FAST_PATH_FILTERS
+            or node.node is None
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _Unsupported
+        filter_func = env.filters[node.name]
+        if getattr(filter_func, "jinja_pass_arg", None) is not None:
+            raise _Unsupported
+        value_expr = _compile_expr(env, node.node, names)
+        args = [_compile_expr(env, arg, names) for arg in node.args]
+        return lambda: filter_func(value_expr(), *[arg() for arg in args])
+
+    if type(node) in _BINARY_OPERATORS:
+        assert isinstance(node, nodes.BinExpr)
+        binary_op = _BINARY_OPERATORS[type(node)]
+        left = _compile_expr(env, node.left, names)
+        right = _compile_expr(env, node.right, names)
+        return lambda: binary_op(left(), right())
+
+    if type(node) in _UNARY_OPERATORS:
+        assert isinstance(node, nodes.UnaryExpr)
+        unary_op = _UNARY_OPERATORS[type(node)]
+        operand = _compile_expr(env, node.node, names)
+        return lambda: unary_op(operand())
+
+    if isinstance(node, nodes.And):
+        left = _compile_expr(env, node.left, names)
+        right = _compile_expr(env, node.right, names)
+        return lambda: left() and right()
+
+    if isinstance(node, nodes.Or):
+        left = _compile_expr(env, node.left, names)
+        right = _compile_expr(env, node.right, names)
+        return lambda: left() or right()
+
+    if isinstance(node, nodes.Compare):
+        return _compile_compare(env, node, names)
+
+    raise _Unsupported
+
+
+def _compile_compare(
+    env: SandboxedEnvironment, node: nodes.Compare, names: set[str]
+) -> _Evaluator:
+    """Compile a comparison with Python chained comparison semantics."""
+    first = _compile_expr(env, node.expr, names)
+    operands: list[tuple[Callable[[Any, Any], Any], _Evaluator]] = []
+    for operand in node.ops:
+        if operand.op not in _COMPARE_OPERATORS:
+            raise _Unsupported
+        operands.append(
+            (_COMPARE_OPERATORS[operand.op], _compile_expr(env, operand.expr, names))
+        )
+
+    def _compare() -> Any:
+        left = first()
+        result: Any = True
+        for compare_op, right_expr in operands:
+            right = right_expr()
+            if not (result := compare_op(left, right)):
+                return result
+            left = right
+        return result
+
+    return _compare
@@ -15,7 +15,9 @@ import importlib
 import logging
 import os
 import pathlib
+import stat
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,8 +31,13 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
-from .core import HomeAssistant, callback
+from .const import (
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_HOMEASSISTANT_STARTED,
+    Platform,
+    __version__,
+)
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.config_flows import FLOWS
@@ -41,6 +48,7 @@ from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED
+from .util.file import WriteError, write_utf8_file
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
@@ -132,6 +140,8 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, float]] = HassKey("import_timings")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -149,6 +159,10 @@ IMPORT_EVENT_LOOP_WARNING = (
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+# The storage helper imports the loader so its STORAGE_DIR can't be used
+MANIFEST_CACHE_PATH = (".storage", "core.manifest_cache")
+_MANIFEST_CACHE_VERSION = (1, __version__)
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -270,6 +284,146 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    import_timings = hass.data[DATA_IMPORT_TIMINGS] = {}
+    cache = hass.data[DATA_MANIFEST_CACHE] = ManifestCache(
+        hass.config.path(*MANIFEST_CACHE_PATH), import_timings
+    )
+
+    async def _async_save_manifest_cache(_event: Event) -> None:
+        """Save the manifest cache."""
+        if (data := cache.async_snapshot()) is not None:
+            await hass.async_add_executor_job(cache.save, data)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save_manifest_cache)
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_manifest_cache
+    )
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long importing each integration took during this run."""
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
+@callback
+def async_get_previous_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long importing each integration took during previous runs.
+
+    Only available once the manifest cache has been loaded, which
+    happens when the first integrations are resolved.
+    """
+    if (cache := hass.data.get(DATA_MANIFEST_CACHE)) is None:
+        return {}
+    return cache.previous_import_timings
+
+
+class ManifestCache:
+    """Cache of parsed manifests persisted between restarts.
+
+    Entries are keyed by the manifest path and hold the manifest and the
+    top level files of the integration. They are only used as long as the
+    modification times of the manifest and its directory are unchanged,
+    so reading an integration only needs two stat calls.
+
+    The import times of the integrations are saved along with the
+    manifests so the next run can start the slowest imports first.
+    """
+
+    def __init__(self, path: str, import_timings: dict[str, float]) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self.previous_import_timings: dict[str, float] = {}
+        self._import_timings = import_timings
+        self._saved_import_timings: dict[str, float] = {}
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    def ensure_loaded(self) -> None:
+        """Load the cache from disk if it was not loaded yet.
+
+        Must be run in the executor.
+        """
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                data = json_loads(pathlib.Path(self.path).read_bytes())
+            except FileNotFoundError:
+                return
+            except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+                _LOGGER.debug("Ignoring unreadable manifest cache: %s", err)
+                return
+            if (
+                not isinstance(data, dict)
+                or data.get("version") != list(_MANIFEST_CACHE_VERSION)
+                or not isinstance(entries := data.get("entries"), dict)
+            ):
+                _LOGGER.debug("Ignoring outdated manifest cache")
+                return
+            self._entries.update(entries)
+            if isinstance(import_timings := data.get("import_timings"), dict):
+                self.previous_import_timings = import_timings
+                self._saved_import_timings = import_timings
+
+    def get(
+        self, manifest_path: pathlib.Path, mtimes: list[int]
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the cached manifest and top level files."""
+        if (entry := self._entries.get(str(manifest_path))) is None or entry[
+            "mtimes"
+        ] != mtimes:
+            return None
+        top_level_files = entry["top_level_files"]
+        return (
+            cast(Manifest, dict(entry["manifest"])),
+            None if top_level_files is None else set(top_level_files),
+        )
+
+    def add(
+        self,
+        manifest_path: pathlib.Path,
+        mtimes: list[int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Store the manifest and top level files of an integration."""
+        self._entries[str(manifest_path)] = {
+            "mtimes": mtimes,
+            "manifest": dict(manifest),
+            "top_level_files": None
+            if top_level_files is None
+            else sorted(top_level_files),
+        }
+        self._dirty = True
+
+    @callback
+    def async_snapshot(self) -> dict[str, Any] | None:
+        """Return the data to save or None if nothing changed."""
+        import_timings = {**self.previous_import_timings, **self._import_timings}
+        if not self._dirty and import_timings == self._saved_import_timings:
+            return None
+        self._dirty = False
+        self._saved_import_timings = import_timings
+        return {
+            "version": _MANIFEST_CACHE_VERSION,
+            "entries": dict(self._entries),
+            "import_timings": import_timings,
+        }
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Save a snapshot of the cache to disk.
+
+        Must be run in the executor.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, json_bytes(data), True, "wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Unable to save manifest cache: %s", err)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -652,30 +806,49 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
+            file_path = manifest_path.parent
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+                manifest_stat = manifest_path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if not stat.S_ISREG(manifest_stat.st_mode):
                 continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+            # The directory modification time changes when
+            # files are added or removed from the integration
+            mtimes = [manifest_stat.st_mtime_ns, file_path.stat().st_mtime_ns]
+            if manifest_cache is not None and (
+                cached := manifest_cache.get(manifest_path, mtimes)
+            ):
+                manifest, top_level_files = cached
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s",
+                        manifest_path,
+                        err,
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None:
+                    manifest_cache.add(manifest_path, mtimes, manifest, top_level_files)
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -769,6 +942,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1066,6 +1240,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1086,6 +1261,9 @@ class Integration:
                 with suppress(ImportError):
                     self.get_platform(platform_name)
 
+        # Measured here instead of around the executor job so time
+        # spent waiting for other imports is not included
+        self._import_timings[domain] = time.perf_counter() - start
         return cache[domain]
 
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
@@ -1322,6 +1500,8 @@ def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is not None:
+        manifest_cache.ensure_loaded()
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
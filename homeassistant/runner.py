@@ -52,6 +52,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    intern_state_attributes: bool = False
 
     safe_mode: bool = False
 
@@ -4,19 +4,66 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import logging
+import os
+import tempfile
+from time import process_time
 from timeit import default_timer as timer
-
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+import tracemalloc
+from types import SimpleNamespace
+
+from aiohttp import web
+from aiohttp.http_writer import StreamWriter
+from aiohttp.test_utils import make_mocked_request
+from sqlalchemy import insert
+
+from homeassistant import config_entries, core, loader
+from homeassistant.components.logbook.const import DOMAIN as LOGBOOK_DOMAIN
+from homeassistant.components.logbook.models import LogbookConfig
+from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.recorder import get_instance, history, statistics
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    Statistics,
+    StatisticsMeta,
+)
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    StateAttributesManager,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor import recorder as sensor_recorder
+from homeassistant.components.statistics.sensor import (
+    STATS_NUMERIC_SUPPORT,
+    STATS_SORTED_STATES,
+    StatisticsSensor,
+)
+from homeassistant.components.websocket_api import commands as websocket_commands
+from homeassistant.components.websocket_api.messages import cached_event_message
+from homeassistant.const import EVENT_LOGBOOK_ENTRY, EVENT_STATE_CHANGED, UnitOfEnergy
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    recorder as recorder_helper,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.template import Template, TemplateEnvironment
+from homeassistant.helpers.template_code_cache import (
+    DATA_TEMPLATE_CODE_CACHE,
+    TemplateCodeCache,
+)
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import EnergyConverter
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +355,649 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+async def _set_states_with_shared_attributes(hass, intern_attributes):
+    """Set 15k states of which every 100 share the same attributes."""
+    if intern_attributes:
+        hass.states.async_enable_attribute_interning()
+
+    tracemalloc.start()
+    start = timer()
+
+    for idx in range(15000):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx}",
+            str(idx),
+            {
+                "friendly_name": "Benchmark",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "group": idx // 100,
+            },
+        )
+
+    runtime = timer() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Traced memory after setting the states: {size / 2**20:.1f} MiB")
+    return runtime
+
+
+@benchmark
+async def set_states(hass):
+    """Set 15k states without attribute interning."""
+    return await _set_states_with_shared_attributes(hass, False)
+
+
+@benchmark
+async def set_states_interned(hass):
+    """Set 15k states with attribute interning."""
+    return await _set_states_with_shared_attributes(hass, True)
+
+
+def _template_sources(count):
+    """Return distinct template sources of typical shapes."""
+    return [
+        (
+            f"{{{{ states('sensor.benchmark_{idx}') | float(0) * {idx} }}}}"
+            if idx % 2
+            else f"{{% if is_state('light.benchmark_{idx}', 'on') %}}on"
+            f"{{% else %}}{{{{ state_attr('light.benchmark_{idx}', 'mode') }}}}"
+            "{% endif %}"
+        )
+        for idx in range(count)
+    ]
+
+
+@benchmark
+async def template_compile_cold(hass):
+    """Compile 5k templates with an empty template code cache."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.data[DATA_TEMPLATE_CODE_CACHE] = TemplateCodeCache(
+            os.path.join(tmpdir, "cache")
+        )
+        env = TemplateEnvironment(hass)
+        sources = _template_sources(5000)
+
+        start = timer()
+        for source in sources:
+            env.compile(source)
+        return timer() - start
+
+
+@benchmark
+async def template_compile_warm(hass):
+    """Load the template code cache and compile 5k cached templates."""
+    sources = _template_sources(5000)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "cache")
+        hass.data[DATA_TEMPLATE_CODE_CACHE] = cache = TemplateCodeCache(path)
+        env = TemplateEnvironment(hass)
+        for source in sources:
+            env.compile(source)
+        cache.save(cache.async_snapshot())
+
+        start = timer()
+        hass.data[DATA_TEMPLATE_CODE_CACHE] = cache = TemplateCodeCache(path)
+        cache.load()
+        env = TemplateEnvironment(hass)
+        for source in sources:
+            env.compile(source)
+        runtime = timer() - start
+
+    assert cache.hits == len(sources)
+    return runtime
+
+
+_TEMPLATE_SHAPES = {
+    "float_multiply": "{{ states('sensor.power') | float(0) * 2 }}",
+    "is_state_and": "{{ is_state('light.one', 'on') and is_state('light.two', 'on') }}",
+    "state_attr": "{{ state_attr('light.one', 'brightness') }}",
+    "compare": "{{ states('sensor.power') | float(0) > 20 }}",
+}
+
+
+async def _render_template_shapes(hass, prefix):
+    """Render each template shape 20k times with render info collection."""
+    hass.states.async_set("sensor.power", "12.5")
+    hass.states.async_set("light.one", "on", {"brightness": 100})
+    hass.states.async_set("light.two", "off")
+
+    runtime = 0.0
+    for name, source in _TEMPLATE_SHAPES.items():
+        template = Template(prefix + source, hass)
+        template.async_render_to_info()
+        start = timer()
+        for _ in range(20000):
+            template.async_render_to_info()
+        shape_runtime = timer() - start
+        print(f"{name}: {shape_runtime:.3f}s")
+        runtime += shape_runtime
+    return runtime
+
+
+@benchmark
+async def template_render_fast_path(hass):
+    """Render simple template shapes through the fast path."""
+    return await _render_template_shapes(hass, "")
+
+
+@benchmark
+async def template_render_jinja(hass):
+    """Render simple template shapes through Jinja."""
+    # Comments are not supported by the fast path but render nothing
+    return await _render_template_shapes(hass, "{# jinja #}")
+
+
+async def _state_changed_events_stream(hass, count=100000):
+    """Return state_changed events of 1000 entities.
+
+    Nine out of ten state changes keep the attributes of the entity.
+    """
+    events = []
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        events.append(event)
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx in range(count):
+        entity_idx = idx % 1000
+        hass.states.async_set(
+            f"sensor.benchmark_{entity_idx}",
+            str(idx),
+            {
+                "friendly_name": f"Benchmark {entity_idx}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "update": idx // 10000 if idx % 10 else idx,
+            },
+        )
+    await hass.async_block_till_done()
+    unsub()
+    return events
+
+
+@benchmark
+async def recorder_serialize_attributes(hass):
+    """Serialize the attributes of 100k state changes with the recorder cache."""
+    events = await _state_changed_events_stream(hass)
+    manager = StateAttributesManager(SimpleNamespace(dialect_name=None))
+
+    start = timer()
+    for event in events:
+        manager.serialize_from_event(event)
+    runtime = timer() - start
+    print(f"{len(events) / runtime:.0f} events/s")
+    return runtime
+
+
+@benchmark
+async def recorder_serialize_attributes_uncached(hass):
+    """Serialize the attributes of 100k state changes without a cache."""
+    events = await _state_changed_events_stream(hass)
+
+    start = timer()
+    for event in events:
+        StateAttributes.shared_attrs_bytes_from_event(event, None)
+    runtime = timer() - start
+    print(f"{len(events) / runtime:.0f} events/s")
+    return runtime
+
+
+def _websocket_connection():
+    """Return a websocket connection that keeps the last message sent."""
+    sent = deque(maxlen=1)
+    return SimpleNamespace(
+        subscriptions={},
+        user=SimpleNamespace(is_admin=True, name="benchmark"),
+        sent=sent,
+        send_message=sent.append,
+        send_result=lambda msg_id: None,
+    )
+
+
+async def _forward_events_to_connections(hass, subscribe):
+    """Fire 500 state changes per second for 10s to 200 connections."""
+    events = await _state_changed_events_stream(hass, 5000)
+    connections = [_websocket_connection() for _ in range(200)]
+    for connection in connections:
+        subscribe(connection)
+
+    start = timer()
+    for event in events:
+        hass.bus.async_fire_internal(
+            EVENT_STATE_CHANGED, event.data, context=event.context
+        )
+    await hass.async_block_till_done()
+    runtime = timer() - start
+
+    for connection in connections:
+        assert connection.sent[0].endswith(b',"id":1}')
+    print(f"{runtime / 10:.1%} of one CPU for 500 events/s")
+    return runtime
+
+
+@benchmark
+async def websocket_subscribe_events(hass):
+    """Forward state changes to 200 subscribe_events connections."""
+
+    def subscribe(connection):
+        websocket_commands.handle_subscribe_events(
+            hass,
+            connection,
+            {"id": 1, "type": "subscribe_events", "event_type": EVENT_STATE_CHANGED},
+        )
+
+    return await _forward_events_to_connections(hass, subscribe)
+
+
+@benchmark
+async def websocket_subscribe_events_per_connection(hass):
+    """Forward state changes to 200 connections with a listener each."""
+
+    @core.callback
+    def forward_events(send_message, user, message_id_as_bytes, event):
+        """Forward state changed events like one listener per connection did."""
+        if not user.is_admin:
+            return
+        send_message(cached_event_message(message_id_as_bytes, event))
+
+    def subscribe(connection):
+        connection.subscriptions[1] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(forward_events, connection.send_message, connection.user, b"1"),
+        )
+
+    return await _forward_events_to_connections(hass, subscribe)
+
+
+@benchmark
+async def entity_registry_indexes(hass):
+    """Index 50k entity registry entries and look them up by domain."""
+    domains = ("light", "sensor", "switch", "binary_sensor", "climate")
+    entries = [
+        er.RegistryEntry(
+            entity_id=f"{domains[idx % 5]}.benchmark_{idx}",
+            unique_id=str(idx),
+            platform=f"platform_{idx % 50}",
+            config_entry_id=f"config_entry_{idx % 500}",
+            device_id=f"device_{idx // 4}",
+            disabled_by=er.RegistryEntryDisabler.USER if idx % 20 == 0 else None,
+        )
+        for idx in range(50000)
+    ]
+
+    tracemalloc.start()
+    items = er.EntityRegistryItems()
+    for entry in entries:
+        items[entry.entity_id] = entry
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Container and indexes: {size / len(entries):.0f} bytes per entry")
+
+    start = timer()
+    for _ in range(100):
+        scanned = [entry for entry in items.values() if entry.domain == "sensor"]
+    scan = timer() - start
+
+    start = timer()
+    for _ in range(100):
+        indexed = items.get_entries_for_domain("sensor", True)
+    runtime = timer() - start
+
+    assert indexed == scanned
+    print(f"100 domain lookups: {scan:.3f}s scanning, {runtime:.3f}s indexed")
+    return runtime
+
+
+@benchmark
+async def statistics_build_converted_stats(hass):
+    """Build 1M mean/min/max statistics rows converted from kWh to Wh."""
+    db_rows = [
+        (idx * 300.0, None if idx % 97 == 0 else idx * 1.5, idx * 0.5, idx * 2.0)
+        for idx in range(10**6)
+    ]
+    row_mapping = (("mean", 1), ("min", 2), ("max", 3))
+    convert_values = EnergyConverter.values_converter_factory(
+        UnitOfEnergy.KILO_WATT_HOUR, UnitOfEnergy.WATT_HOUR
+    )
+
+    start = timer()
+    statistics._build_stats(db_rows, 300.0, 0, row_mapping)  # noqa: SLF001
+    unconverted = timer() - start
+
+    start = timer()
+    statistics._build_converted_stats(  # noqa: SLF001
+        db_rows, 300.0, 0, row_mapping, convert_values
+    )
+    runtime = timer() - start
+
+    print(f"Without unit conversion: {unconverted:.3f}s")
+    return runtime
+
+
+async def _async_setup_recorder(hass, tmpdir):
+    """Set up the recorder with an sqlite database in tmpdir."""
+    hass.config.config_dir = tmpdir
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    recorder_helper.async_initialize_recorder(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    assert await async_setup_component(
+        hass,
+        "recorder",
+        {
+            "recorder": {
+                "db_url": f"sqlite:///{tmpdir}/benchmark.db",
+                "commit_interval": 0,
+            }
+        },
+    )
+    await hass.async_start()
+    instance = get_instance(hass)
+    await instance.async_block_till_done()
+    return instance
+
+
+@benchmark
+async def sensor_compile_statistics(hass):
+    """Compile 5-minute statistics of 6k sensors of which 600 changed."""
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_setup_recorder(hass, tmpdir)
+        assert await async_setup_component(hass, "sensor", {})
+        # The history does not reach back before the recorder was started
+        start = dt_util.utcnow() + timedelta(minutes=1)
+        end = start + timedelta(minutes=5)
+        start_ts = start.timestamp()
+        entity_ids = [f"sensor.benchmark_{idx}" for idx in range(6000)]
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0", attributes, timestamp=start_ts - 60)
+        for offset in range(10):
+            for entity_id in entity_ids[:600]:
+                hass.states.async_set(
+                    entity_id, str(offset), attributes, timestamp=start_ts + offset
+                )
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+
+        def _query_history(session, entity_ids):
+            query_start = timer()
+            states = history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - timedelta.resolution,
+                end,
+                entity_ids=entity_ids,
+            )
+            assert len(states) == len(entity_ids)
+            return timer() - query_start
+
+        def _compile():
+            with session_scope(session=instance.get_session()) as session:
+                # Every sensor was queried for each period before sensors
+                # not updated during the period were skipped
+                query_all = _query_history(session, entity_ids)
+                query_changed = _query_history(session, entity_ids[:600])
+                compile_start = timer()
+                sensor_recorder.compile_statistics(hass, session, start, end)
+                return query_all, query_changed, timer() - compile_start
+
+        query_all, query_changed, runtime = await instance.async_add_executor_job(
+            _compile
+        )
+        print(
+            f"History queries: {query_all:.3f}s for all sensors,"
+            f" {query_changed:.3f}s for changed sensors"
+        )
+        return runtime
+
+
+@benchmark
+async def energy_dashboard_statistics(hass):
+    """Load 3 years of monthly sums of 200 energy statistics twice."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_setup_recorder(hass, tmpdir)
+        end = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        # Only periods starting at the start time or later can be cached
+        start = dt_util.start_of_local_day(end - timedelta(days=3 * 365)).replace(day=1)
+        statistic_ids = {f"sensor.energy_{idx}" for idx in range(200)}
+
+        def _insert_statistics():
+            with session_scope(session=instance.get_session()) as session:
+                metadatas = [
+                    StatisticsMeta(
+                        statistic_id=statistic_id,
+                        source="recorder",
+                        unit_of_measurement="kWh",
+                        has_mean=False,
+                        has_sum=True,
+                    )
+                    for statistic_id in statistic_ids
+                ]
+                session.add_all(metadatas)
+                session.flush()
+                hours = range(int(start.timestamp()), int(end.timestamp()), 3600)
+                for metadata in metadatas:
+                    session.execute(
+                        insert(Statistics),
+                        [
+                            {
+                                "metadata_id": metadata.id,
+                                "created_ts": start_ts,
+                                "start_ts": start_ts,
+                                "state": float(hour),
+                                "sum": float(hour),
+                            }
+                            for hour, start_ts in enumerate(hours)
+                        ],
+                    )
+                    # Keep the database lock short for the recorder thread
+                    session.commit()
+
+        def _load_dashboard():
+            load_start = timer()
+            stats = statistics.statistics_during_period(
+                hass, start, end, statistic_ids, "month", None, {"sum"}
+            )
+            assert len(stats) == len(statistic_ids)
+            return timer() - load_start
+
+        await instance.async_add_executor_job(_insert_statistics)
+        uncached = await instance.async_add_executor_job(_load_dashboard)
+        runtime = await instance.async_add_executor_job(_load_dashboard)
+        print(f"First load: {uncached:.3f}s, second load: {runtime:.3f}s")
+        return runtime
+
+
+@benchmark
+async def statistics_sensor_characteristics(hass):
+    """Update a statistics sensor with 10k samples for each characteristic."""
+    await er.async_load(hass)
+    await dr.async_load(hass)
+    samples = [
+        core.State("sensor.source", str(idx % 1000 / 10), {"unit_of_measurement": "W"})
+        for idx in range(10000)
+    ]
+    updates = samples[:100]
+
+    def _time_updates(characteristic, keep_sorted_states):
+        sensor = StatisticsSensor(
+            hass,
+            "sensor.source",
+            characteristic,
+            None,
+            characteristic,
+            len(samples),
+            None,
+            False,
+            2,
+            50,
+        )
+        if not keep_sorted_states:
+            # Sort all samples on each update like before they were kept sorted
+            sensor._sorted_states = None  # noqa: SLF001
+        for state in samples:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+        start = timer()
+        for state in updates:
+            sensor._add_state_to_queue(state)  # noqa: SLF001
+            sensor._async_purge_update_and_schedule()  # noqa: SLF001
+        return timer() - start
+
+    runtime = 0
+    for characteristic in sorted(STATS_NUMERIC_SUPPORT):
+        characteristic_runtime = _time_updates(characteristic, True)
+        runtime += characteristic_runtime
+        print(
+            f"{characteristic}: "
+            f"{characteristic_runtime / len(updates) * 1000:.3f}ms per update"
+        )
+        if characteristic in STATS_SORTED_STATES:
+            sorting_runtime = _time_updates(characteristic, False)
+            print(
+                f"{characteristic} sorting on each update: "
+                f"{sorting_runtime / len(updates) * 1000:.3f}ms per update"
+            )
+    return runtime
+
+
+@benchmark
+async def logbook_row_cache(hass):
+    """Read a day of 96k logbook entries three times."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = await _async_setup_recorder(hass, tmpdir)
+        await er.async_load(hass)
+        hass.data[LOGBOOK_DOMAIN] = LogbookConfig({})
+        end = dt_util.start_of_local_day()
+        start = end - timedelta(days=1)
+        start_ts = start.timestamp()
+        for idx in range(96000):
+            hass.bus.async_fire(
+                EVENT_LOGBOOK_ENTRY,
+                {"name": f"Automation {idx % 500}", "message": "triggered"},
+                time_fired=start_ts + idx * 0.9,
+            )
+        hass.bus.async_fire(EVENT_LOGBOOK_ENTRY, {"name": "Now", "message": "now"})
+        await hass.async_block_till_done()
+        await instance.async_block_till_done()
+        row_cache = hass.data[LOGBOOK_DOMAIN].row_cache
+
+        def _read_day():
+            read_start = timer()
+            events = EventProcessor(hass, (EVENT_LOGBOOK_ENTRY,)).get_events(start, end)
+            assert len(events) == 96000
+            return timer() - read_start
+
+        tracemalloc.start()
+        uncached = await instance.async_add_executor_job(_read_day)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"Uncached: {uncached:.3f}s, "
+            f"{size / 2**20:.1f} MiB held for {row_cache._num_rows} cached rows"  # noqa: SLF001
+        )
+        for _ in range(2):
+            hits, misses = row_cache.hits, row_cache.misses
+            runtime = await instance.async_add_executor_job(_read_day)
+            print(
+                f"Cached: {runtime:.3f}s, {row_cache.hits - hits} hits, "
+                f"{row_cache.misses - misses} misses"
+            )
+        return runtime
+
+
+@benchmark
+async def hls_segment_view(hass):
+    """Serve a 1 MiB HLS segment of 16 parts to 1000 viewers."""
+    # The requirements of stream are not installed with the core
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.core import Part, Segment
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.stream.hls import HlsSegmentView
+
+    segment = Segment(
+        sequence=0,
+        init=b"",
+        stream_id=0,
+        start_time=dt_util.utcnow(),
+        _stream_outputs=(),
+    )
+    segment.parts = [
+        Part(duration=0.125, has_keyframe=idx == 0, data=os.urandom(2**16))
+        for idx in range(16)
+    ]
+    track = SimpleNamespace(
+        idle_timer=SimpleNamespace(awake=lambda: None),
+        get_segment=lambda sequence: segment,
+    )
+    stream = SimpleNamespace(add_provider=lambda provider: track)
+    view = HlsSegmentView()
+
+    async def _drain():
+        """Pretend the viewer has read everything written so far."""
+
+    # The transport drops the data like a viewer reading it instantly
+    protocol = SimpleNamespace(
+        transport=SimpleNamespace(write=lambda data: None, is_closing=lambda: False),
+        _drain_helper=_drain,
+    )
+
+    async def _serve_segment(request):
+        await view.handle(request, stream, "0", "")
+
+    async def _serve_joined_segment(request):
+        # Serving a copy of the segment, as was done before
+        response = web.Response(
+            body=segment.get_data(), headers={"Content-Type": "video/iso.segment"}
+        )
+        await response.prepare(request)
+        await response.write_eof()
+
+    def _request():
+        return make_mocked_request(
+            "GET",
+            "/api/hls/token/segment/0.m4s",
+            writer=StreamWriter(protocol, asyncio.get_running_loop()),
+        )
+
+    async def _serve_viewers(serve):
+        """Return the CPU time and peak allocation per viewer."""
+        requests = [_request() for _ in range(viewers)]
+        start = process_time()
+        for request in requests:
+            await serve(request)
+        cpu_time = process_time() - start
+
+        # Allocations are traced separately as tracing slows down the CPU
+        peak = 0
+        tracemalloc.start()
+        for _ in range(viewers):
+            request = _request()
+            tracemalloc.reset_peak()
+            size, _ = tracemalloc.get_traced_memory()
+            await serve(request)
+            peak += tracemalloc.get_traced_memory()[1] - size
+        tracemalloc.stop()
+        return cpu_time / viewers, peak / viewers
+
+    viewers = 1000
+    joined_cpu_time, joined_peak = await _serve_viewers(_serve_joined_segment)
+    cpu_time, peak = await _serve_viewers(_serve_segment)
+    print(
+        f"Per viewer: {cpu_time * 1000:.3f}ms CPU and {peak / 1024:.1f} KiB "
+        f"allocated at peak, {joined_cpu_time * 1000:.3f}ms CPU and "
+        f"{joined_peak / 1024:.1f} KiB when joining the parts"
+    )
+    return cpu_time * viewers
@@ -72,6 +72,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_STORAGE_LOAD_TIME is a dict, indicating how long reading and
+# parsing each base storage file took before integrations were set up.
+DATA_STORAGE_LOAD_TIME: HassKey[dict[str, float]] = HassKey("storage_load_time")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -816,6 +820,12 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_storage_load_timings(hass: core.HomeAssistant) -> dict[str, float]:
+    """Return timing data for each base storage file loaded at startup."""
+    return hass.data.get(DATA_STORAGE_LOAD_TIME, {})
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 
 from homeassistant.const import (
@@ -117,6 +117,31 @@ class BaseUnitConverter:
         from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
         return lambda val: None if val is None else (val / from_ratio) * to_ratio
 
+    @classmethod
+    @lru_cache
+    def values_converter_factory(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many values which allows None.
+
+        The conversion is inlined in a single list comprehension so
+        no function is called for each value.
+        """
+        if from_unit == to_unit:
+            return list
+        from_ratio, to_ratio = cls._get_from_to_ratio(from_unit, to_unit)
+        return lambda values: [
+            None if val is None else (val / from_ratio) * to_ratio for val in values
+        ]
+
+    @classmethod
+    def _values_converter_from_allow_none(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many values one by one."""
+        convert = cls.converter_factory_allow_none(from_unit, to_unit)
+        return lambda values: [convert(val) for val in values]
+
     @classmethod
     @lru_cache
     def get_unit_ratio(cls, from_unit: str | None, to_unit: str | None) -> float:
@@ -411,6 +436,16 @@ class SpeedConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def values_converter_factory(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many speeds which allows None."""
+        if UnitOfSpeed.BEAUFORT in (from_unit, to_unit) and from_unit != to_unit:
+            return cls._values_converter_from_allow_none(from_unit, to_unit)
+        return super().values_converter_factory(from_unit, to_unit)
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
@@ -490,6 +525,16 @@ class TemperatureConverter(BaseUnitConverter):
         convert = cls._converter_factory(from_unit, to_unit)
         return lambda value: None if value is None else convert(value)
 
+    @classmethod
+    @lru_cache
+    def values_converter_factory(
+        cls, from_unit: str | None, to_unit: str | None
+    ) -> Callable[[Iterable[float | None]], list[float | None]]:
+        """Return a function to convert many temperatures which allows None."""
+        if from_unit == to_unit:
+            return list
+        return cls._values_converter_from_allow_none(from_unit, to_unit)
+
     @classmethod
     def _converter_factory(
         cls, from_unit: str | None, to_unit: str | None
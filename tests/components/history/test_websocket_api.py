@@ -9,6 +9,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
+from homeassistant.components.history.const import HISTORY_STREAM_CHUNK_TIME
 from homeassistant.components.recorder import Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
@@ -543,6 +544,78 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends long time ranges in chunks."""
+    start_time = dt_util.utcnow() - timedelta(days=3)
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    first_boundary = start_time + HISTORY_STREAM_CHUNK_TIME
+    second_boundary = start_time + HISTORY_STREAM_CHUNK_TIME * 2
+    with freeze_time(start_time + timedelta(hours=1)):
+        hass.states.async_set("sensor.one", "on")
+        await async_recorder_block_till_done(hass)
+    # States exactly at a boundary are sent with the chunk that ends there
+    with freeze_time(first_boundary):
+        hass.states.async_set("sensor.one", "off")
+        await async_recorder_block_till_done(hass)
+    with freeze_time(second_boundary):
+        hass.states.async_set("sensor.one", "on")
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    first_timestamp = (start_time + timedelta(hours=1)).timestamp()
+    assert response["event"] == {
+        "end_time": pytest.approx(first_boundary.timestamp()),
+        "start_time": pytest.approx(start_time.timestamp()),
+        "states": {
+            "sensor.one": [
+                {"lu": pytest.approx(first_timestamp), "s": "on"},
+                {"lu": pytest.approx(first_boundary.timestamp()), "s": "off"},
+            ]
+        },
+    }
+
+    # The next chunk starts exactly at the end of the previous one
+    response = await client.receive_json()
+    assert response["event"] == {
+        "end_time": pytest.approx(second_boundary.timestamp()),
+        "start_time": first_boundary.timestamp(),
+        "states": {
+            "sensor.one": [
+                {"lu": pytest.approx(second_boundary.timestamp()), "s": "on"}
+            ]
+        },
+    }
+
+    # The last chunk has no states and is not sent
+    await client.send_json({"id": 2, "type": "ping"})
+    response = await client.receive_json()
+    assert response == {"id": 2, "type": "pong"}
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -3,7 +3,12 @@
 import pytest
 
 from homeassistant.components import automation
-from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ENTITY_MATCH_ALL,
+    MATCH_ALL,
+    SERVICE_TURN_OFF,
+)
 from homeassistant.core import Context, HomeAssistant, ServiceCall
 from homeassistant.setup import async_setup_component
 
@@ -518,6 +523,57 @@ async def test_event_data_with_list(
     assert len(service_calls) == 1
 
 
+async def test_if_fires_on_any_event_with_data(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test the firing of events of any type with event data."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": MATCH_ALL,
+                    "event_data": {"some_attr": "some_value"},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"some_attr": "some_value"})
+    hass.bus.async_fire("other_event", {"some_attr": "some_value"})
+    hass.bus.async_fire("test_event", {"some_attr": "other_value"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 2
+
+
+async def test_event_data_with_unhashable_tuple(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test event data with a tuple containing a list is matched."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {"some_attr": (1, [2])},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"some_attr": (1, [2])})
+    hass.bus.async_fire("test_event", {"some_attr": (1, [3])})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+
 @pytest.mark.parametrize(
     "event_type", ["state_reported", ["test_event", "state_reported"]]
 )
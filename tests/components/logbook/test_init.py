@@ -4,7 +4,7 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -19,6 +19,8 @@ from homeassistant.components.logbook.models import EventAsRow, LazyEventPartial
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.const import DOMAIN as RECORDER_DOMAIN
+from homeassistant.components.recorder.services import SERVICE_PURGE
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -125,6 +127,108 @@ async def test_service_call_create_logbook_entry(hass_: HomeAssistant) -> None:
     assert last_call.data.get(logbook.ATTR_DOMAIN) == "logbook"
 
 
+async def test_get_events_serves_past_hours_from_row_cache(
+    hass_: HomeAssistant,
+) -> None:
+    """Test rows of past hours are cached until rows are purged."""
+    now = dt_util.utcnow()
+    for hours_ago, message in ((3, "first"), (2, "second")):
+        with freeze_time(now - timedelta(hours=hours_ago)):
+            hass_.bus.async_fire(
+                logbook.EVENT_LOGBOOK_ENTRY,
+                {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: message},
+            )
+            await async_wait_recording_done(hass_)
+    hass_.bus.async_fire(
+        logbook.EVENT_LOGBOOK_ENTRY,
+        {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: "third"},
+    )
+    await async_wait_recording_done(hass_)
+
+    row_cache = hass_.data[logbook.DOMAIN].row_cache
+    event_processor = EventProcessor(hass_, (EVENT_LOGBOOK_ENTRY,))
+    start = now - timedelta(hours=4)
+    end = now + timedelta(hours=1)
+
+    def _messages() -> list[str]:
+        return [
+            event[logbook.ATTR_MESSAGE]
+            for event in event_processor.get_events(start, end)
+        ]
+
+    assert _messages() == ["first", "second", "third"]
+    assert row_cache.hits == 0
+    num_hours = row_cache.misses
+    assert num_hours >= 3
+
+    assert _messages() == ["first", "second", "third"]
+    assert row_cache.hits == num_hours
+    assert row_cache.misses == num_hours
+
+    # A window starting in the middle of a cached hour
+    start = now - timedelta(hours=2, seconds=1)
+    assert _messages() == ["second", "third"]
+    start = now - timedelta(hours=4)
+
+    # Hours after the last event committed by the recorder are not cached
+    hits = row_cache.hits
+    with patch.object(
+        recorder.get_instance(hass_),
+        "last_committed_event_ts",
+        (now - timedelta(hours=3)).timestamp(),
+    ):
+        assert _messages() == ["first", "second", "third"]
+    assert row_cache.hits == hits + 1
+
+    await hass_.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 0})
+    await hass_.async_block_till_done()
+    await async_wait_recording_done(hass_)
+
+    assert _messages() == []
+    assert row_cache.misses == 2 * num_hours
+
+
+async def test_get_events_row_cache_window_larger_than_cache(
+    hass_: HomeAssistant,
+) -> None:
+    """Test a window with more rows than the row cache holds still hits."""
+    now = dt_util.utcnow()
+    messages = []
+    for hours_ago in (4, 3, 2, 0):
+        with freeze_time(now - timedelta(hours=hours_ago)):
+            for idx in range(2):
+                message = f"{hours_ago} hours ago {idx}"
+                messages.append(message)
+                hass_.bus.async_fire(
+                    logbook.EVENT_LOGBOOK_ENTRY,
+                    {logbook.ATTR_NAME: "Alarm", logbook.ATTR_MESSAGE: message},
+                )
+            await async_wait_recording_done(hass_)
+
+    row_cache = hass_.data[logbook.DOMAIN].row_cache
+    row_cache.max_rows = 3
+    event_processor = EventProcessor(hass_, (EVENT_LOGBOOK_ENTRY,))
+    start = now - timedelta(hours=5)
+    end = now + timedelta(hours=1)
+
+    def _messages() -> list[str]:
+        return [
+            event[logbook.ATTR_MESSAGE]
+            for event in event_processor.get_events(start, end)
+        ]
+
+    assert _messages() == messages
+    assert row_cache.hits == 0
+    num_hours = row_cache.misses
+
+    # The hour of the first two rows stays cached, the hours of the
+    # other rows of the window did not fit
+    for request in range(1, 3):
+        assert _messages() == messages
+        assert row_cache.hits == request * (num_hours - 2)
+        assert row_cache.misses == num_hours + request * 2
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_service_call_create_logbook_entry_invalid_entity_id(
     hass: HomeAssistant,
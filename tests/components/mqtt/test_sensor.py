@@ -112,6 +112,50 @@ async def test_setting_sensor_value_via_mqtt_message(
     assert state.attributes.get("unit_of_measurement") == "fav unit"
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                sensor.DOMAIN: [
+                    {
+                        "name": "temperature",
+                        "state_topic": "test-topic",
+                        "value_template": "{{ value_json.temperature }}",
+                    },
+                    {
+                        "name": "humidity",
+                        "state_topic": "test-topic",
+                        "value_template": "{{ value_json.humidity }}",
+                    },
+                ]
+            }
+        }
+    ],
+)
+async def test_setting_sensor_values_of_one_message_as_batch(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test the states written for one message are fired as one batch."""
+    await mqtt_mock_entry()
+    batches: list[list[Event]] = []
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED,
+        callback(lambda event: None),
+        callback(lambda events: batches.append(events)),
+    )
+
+    async_fire_mqtt_message(hass, "test-topic", '{"temperature": 20, "humidity": 50}')
+
+    assert len(batches) == 1
+    assert {event.data["entity_id"] for event in batches[0]} == {
+        "sensor.temperature",
+        "sensor.humidity",
+    }
+    assert hass.states.get("sensor.temperature").state == "20"
+    assert hass.states.get("sensor.humidity").state == "50"
+
+
 @pytest.mark.parametrize(
     "hass_config",
     [
@@ -0,0 +1,85 @@
+"""The tests for the recorder state attributes manager."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers import state_attributes
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    StateAttributesManager,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+
+def _state_changed_event(entity_id: str, new_state: State | None) -> Event:
+    """Return a state changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+    )
+
+
+def test_serialize_from_event_reuses_unchanged_attributes() -> None:
+    """Test attributes are only serialized again when they change."""
+    manager = StateAttributesManager(MagicMock(dialect_name=None))
+    state = State("sensor.power", "1", {"unit_of_measurement": "W"})
+    same_attributes = State("sensor.power", "2", state.attributes)
+    new_attributes = State("sensor.power", "3", {"unit_of_measurement": "kW"})
+
+    with patch.object(
+        StateAttributes,
+        "shared_attrs_bytes_from_event",
+        wraps=StateAttributes.shared_attrs_bytes_from_event,
+    ) as mock_serialize:
+        assert (
+            manager.serialize_from_event(_state_changed_event("sensor.power", state))
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert (
+            manager.serialize_from_event(
+                _state_changed_event("sensor.power", same_attributes)
+            )
+            == b'{"unit_of_measurement":"W"}'
+        )
+        assert len(mock_serialize.mock_calls) == 1
+
+        assert (
+            manager.serialize_from_event(
+                _state_changed_event("sensor.power", new_attributes)
+            )
+            == b'{"unit_of_measurement":"kW"}'
+        )
+        assert len(mock_serialize.mock_calls) == 2
+
+        # Removing the entity forgets the serialized attributes
+        assert (
+            manager.serialize_from_event(_state_changed_event("sensor.power", None))
+            == b"{}"
+        )
+        assert (
+            manager.serialize_from_event(
+                _state_changed_event("sensor.power", new_attributes)
+            )
+            == b'{"unit_of_measurement":"kW"}'
+        )
+        assert len(mock_serialize.mock_calls) == 4
+
+
+def test_serialized_attributes_are_bounded() -> None:
+    """Test the serialized attributes cache is bounded and cleared on reset."""
+    with patch.object(state_attributes, "CACHE_SIZE", 2):
+        manager = StateAttributesManager(MagicMock(dialect_name=None))
+    states = [State(f"sensor.power_{i}", "1", {"index": i}) for i in range(3)]
+    for state in states:
+        manager.serialize_from_event(_state_changed_event(state.entity_id, state))
+    assert list(manager._serialized.keys()) == ["sensor.power_2", "sensor.power_1"]
+
+    manager.adjust_lru_size(4)
+    assert manager._serialized.get_size() == 4
+    manager.adjust_lru_size(3)
+    assert manager._serialized.get_size() == 4
+
+    manager.reset()
+    assert len(manager._serialized) == 0
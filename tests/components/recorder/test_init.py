@@ -287,6 +287,42 @@ async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+async def test_saving_state_batch(hass: HomeAssistant, setup_recorder: None) -> None:
+    """Test saving the states of a batch of state changes."""
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    instance = get_instance(hass)
+    await async_block_recorder(hass, 0.1)
+
+    hass.states.async_set_many(
+        [
+            ("test.one", "on", attributes),
+            ("test.two", "off", attributes),
+            ("test.three", "on", None),
+        ]
+    )
+    # Each event of the batch counts towards the backlog
+    assert instance.backlog == 3
+
+    await async_wait_recording_done(hass)
+
+    db_states: dict[str, State] = {}
+    with session_scope(hass=hass, read_only=True) as session:
+        for db_state, states_meta in session.query(States, StatesMeta).outerjoin(
+            StatesMeta, States.metadata_id == StatesMeta.metadata_id
+        ):
+            db_state.entity_id = states_meta.entity_id
+            db_states[states_meta.entity_id] = db_state.to_native()
+    assert {entity_id: state.state for entity_id, state in db_states.items()} == {
+        "test.one": "on",
+        "test.two": "off",
+        "test.three": "on",
+    }
+    assert (
+        db_states["test.one"].last_updated_timestamp
+        == db_states["test.three"].last_updated_timestamp
+    )
+
+
 @pytest.mark.parametrize(
     ("db_engine", "expected_attributes"),
     [
@@ -558,6 +594,155 @@ async def test_saving_event(hass: HomeAssistant, setup_recorder: None) -> None:
     )
 
 
+async def test_saving_events_with_known_foreign_keys_in_bulk(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test events with known event type and data ids are inserted in bulk."""
+    instance = get_instance(hass)
+    event_type = "EVENT_TEST_BULK"
+    event_data = {"test_attr": 5}
+
+    hass.bus.async_fire(event_type, event_data)
+    await async_wait_recording_done(hass)
+    # The event type and data now have ids
+    assert instance._pending_event_rows == []
+
+    context = Context(user_id="b400facee45711eaa9308bfd3d19e474")
+    for _ in range(3):
+        hass.bus.async_fire(event_type, event_data, context=context)
+    hass.bus.async_fire(event_type)
+    await async_wait_recording_done(hass)
+    assert instance._pending_event_rows == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_events = (
+            session.query(Events)
+            .filter(Events.event_type_id.in_(select_event_type_ids((event_type,))))
+            .order_by(Events.event_id)
+            .all()
+        )
+        assert len(db_events) == 5
+        assert len({db_event.data_id for db_event in db_events[:4]}) == 1
+        assert db_events[4].data_id is None
+        for db_event in db_events[1:4]:
+            native_event = db_event.to_native()
+            assert native_event.context.user_id == context.user_id
+
+
+async def _async_commit_pending(hass: HomeAssistant) -> None:
+    """Process the queued events and commit them with a long commit interval."""
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+
+async def test_saving_states_with_known_foreign_keys_in_bulk(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test states with known metadata and attributes ids are inserted in bulk."""
+    instance = await async_setup_recorder_instance(hass, {CONF_COMMIT_INTERVAL: 30})
+    attributes = {"test_attr": 5}
+
+    hass.states.async_set("test.one", "0", attributes)
+    hass.states.async_set("test.two", "0", attributes)
+    # A removed state has empty attributes
+    hass.states.async_set("test.three", "0")
+    await _async_commit_pending(hass)
+    # The metadata and attributes now have ids
+
+    with patch.object(States, "from_event", wraps=States.from_event) as from_event:
+        for value in ("1", "2", "3"):
+            hass.states.async_set("test.one", value, attributes)
+        hass.states.async_set("test.two", "1", attributes)
+        hass.states.async_remove("test.two")
+        await _async_commit_pending(hass)
+    assert from_event.call_count == 0
+    assert instance._pending_state_rows == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = [
+            (db_state, states_meta.entity_id)
+            for db_state, states_meta in session.query(States, StatesMeta)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        ]
+    assert [(db_state.state, entity_id) for db_state, entity_id in db_states] == [
+        ("0", "test.one"),
+        ("0", "test.two"),
+        ("0", "test.three"),
+        ("1", "test.one"),
+        ("2", "test.one"),
+        ("3", "test.one"),
+        ("1", "test.two"),
+        (None, "test.two"),
+    ]
+    assert db_states[2][0].attributes_id == db_states[-1][0].attributes_id
+    state_ids = [db_state.state_id for db_state, _ in db_states]
+    assert [db_state.old_state_id for db_state, _ in db_states] == [
+        None,
+        None,
+        None,
+        state_ids[0],
+        state_ids[3],
+        state_ids[4],
+        state_ids[1],
+        state_ids[6],
+    ]
+
+    # The last bulk inserted state is linked after the commit
+    hass.states.async_set("test.one", "4", attributes)
+    await _async_commit_pending(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        db_state = session.query(States).order_by(States.state_id.desc()).first()
+        assert db_state.state == "4"
+        assert db_state.old_state_id == state_ids[5]
+
+
+async def test_bulk_and_orm_rows_keep_processing_order(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test ids follow the processing order when bulk and ORM rows are mixed."""
+    await async_setup_recorder_instance(hass, {CONF_COMMIT_INTERVAL: 30})
+    attributes = {"test_attr": 5}
+
+    hass.bus.async_fire("known_event")
+    hass.states.async_set("test.known", "0", attributes)
+    await _async_commit_pending(hass)
+
+    # New event types, entities and attributes need the ORM
+    hass.bus.async_fire("known_event", {"seq": 1})
+    hass.bus.async_fire("known_event")
+    hass.bus.async_fire("new_event")
+    hass.bus.async_fire("known_event")
+    hass.states.async_set("test.known", "1", attributes)
+    hass.states.async_set("test.new", "2", attributes)
+    hass.states.async_set("test.known", "3", {"test_attr": 6})
+    hass.states.async_set("test.known", "4", attributes)
+    await _async_commit_pending(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        event_types = [
+            event_type
+            for (event_type,) in session.query(EventTypes.event_type)
+            .select_from(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type.in_(("known_event", "new_event")))
+            .order_by(Events.event_id)
+        ]
+        states = [
+            state for (state,) in session.query(States.state).order_by(States.state_id)
+        ]
+    assert event_types == [
+        "known_event",
+        "known_event",
+        "known_event",
+        "new_event",
+        "known_event",
+    ]
+    assert states == ["0", "1", "2", "3", "4"]
+
+
 async def test_saving_state_with_commit_interval_zero(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -2320,6 +2505,7 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
 
         __bases__ = []
         _has_events = False
+        insert_executemany_returning_sort_by_parameter_order = False
 
         def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
@@ -26,7 +26,11 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.purge import purge_old_data
-from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.queries import (
+    disconnect_states_rows,
+    disconnect_states_rows_updated_since,
+    select_event_type_ids,
+)
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
@@ -206,6 +210,108 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_in_batches_disconnects_remaining_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test states referring to a purged batch are disconnected when they remain."""
+    now = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        old_state = None
+        for days in range(5, 0, -1):
+            timestamp = dt_util.utc_to_timestamp(now - timedelta(days=days))
+            state = States(
+                entity_id="test.batches",
+                state=f"state_{days}",
+                last_changed_ts=timestamp,
+                last_updated_ts=timestamp,
+                old_state=old_state,
+            )
+            session.add(state)
+            old_state = state
+
+    purge_before = now - timedelta(days=2, hours=12)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 2),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 2),
+    ):
+        finished = purge_old_data(
+            recorder_mock, purge_before, states_batch_size=1, repack=False
+        )
+        assert not finished
+
+        with session_scope(hass=hass) as session:
+            states = {state.state: state for state in session.query(States)}
+            # The oldest states are purged first
+            assert set(states) == {"state_3", "state_2", "state_1"}
+            assert states["state_3"].old_state_id is None
+            assert states["state_2"].old_state_id == states["state_3"].state_id
+
+        finished = purge_old_data(
+            recorder_mock, purge_before, states_batch_size=1, repack=False
+        )
+        assert not finished
+
+        with session_scope(hass=hass) as session:
+            states = {state.state: state for state in session.query(States)}
+            assert set(states) == {"state_2", "state_1"}
+            assert states["state_2"].old_state_id is None
+            assert states["state_1"].old_state_id == states["state_2"].state_id
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "disconnects_batch"),
+    [(SupportedDialect.MYSQL, True), (SupportedDialect.SQLITE, False)],
+)
+async def test_purge_old_states_disconnects_batch_on_mysql(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    dialect_name: SupportedDialect,
+    disconnects_batch: bool,
+) -> None:
+    """Test states in a purged batch are disconnected from each other on MySQL.
+
+    MySQL and MariaDB check the old_state_id foreign key row by row while
+    deleting, so a state must not refer to another state of the batch.
+    """
+    now = dt_util.utcnow()
+    with session_scope(hass=hass) as session:
+        old_state = None
+        for days in range(3, 0, -1):
+            timestamp = dt_util.utc_to_timestamp(now - timedelta(days=days))
+            state = States(
+                entity_id="test.batches",
+                state=f"state_{days}",
+                last_changed_ts=timestamp,
+                last_updated_ts=timestamp,
+                old_state=old_state,
+            )
+            session.add(state)
+            old_state = state
+
+    with (
+        patch.object(recorder_mock, "dialect_name", dialect_name),
+        patch(
+            "homeassistant.components.recorder.purge.disconnect_states_rows",
+            wraps=disconnect_states_rows,
+        ) as disconnect_mock,
+        patch(
+            "homeassistant.components.recorder.purge.disconnect_states_rows_updated_since",
+            wraps=disconnect_states_rows_updated_since,
+        ) as disconnect_updated_since_mock,
+    ):
+        finished = purge_old_data(
+            recorder_mock, now - timedelta(days=1, hours=12), repack=False
+        )
+        assert finished
+
+    assert len(disconnect_mock.mock_calls) == int(disconnects_batch)
+    assert len(disconnect_updated_since_mock.mock_calls) == int(not disconnects_batch)
+    with session_scope(hass=hass) as session:
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["state_1"]
+        assert states[0].old_state_id is None
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
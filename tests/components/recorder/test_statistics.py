@@ -35,6 +35,10 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.table_managers.statistics_rollup import (
+    RollupKey,
+    StatisticsRollupManager,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -1293,6 +1297,158 @@ async def test_daily_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2022-10-05 12:00:00+00:00")
+async def test_daily_statistics_rollups_are_cached(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test daily statistics of days which have ended are cached."""
+    await hass.config.async_set_time_zone("UTC")
+    instance = recorder.get_instance(hass)
+    day1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    day2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    day3 = dt_util.as_utc(dt_util.parse_datetime("2022-10-05 00:00:00"))
+    day4 = dt_util.as_utc(dt_util.parse_datetime("2022-10-06 00:00:00"))
+    external_statistics = [
+        {"start": day1, "last_reset": None, "state": 0, "sum": 2},
+        {"start": day2, "last_reset": None, "state": 1, "sum": 3},
+        {"start": day3, "last_reset": None, "state": 2, "sum": 4},
+    ]
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _expected(sum2: float) -> dict[str, list[dict[str, Any]]]:
+        return {
+            "test:total_energy_import": [
+                {"start": day1.timestamp(), "end": day2.timestamp(), "sum": 2.0},
+                {"start": day2.timestamp(), "end": day3.timestamp(), "sum": sum2},
+                {"start": day3.timestamp(), "end": day4.timestamp(), "sum": 4.0},
+            ]
+        }
+
+    def _get_daily_statistics() -> dict[str, list[dict[str, Any]]]:
+        return statistics_during_period(
+            hass,
+            day1,
+            statistic_ids={"test:total_energy_import"},
+            period="day",
+            types={"sum"},
+        )
+
+    assert _get_daily_statistics() == _expected(3.0)
+
+    # Only the hourly statistics of the current day are fetched again
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=statistics._generate_statistics_during_period_stmt,
+    ) as mock_stmt:
+        assert _get_daily_statistics() == _expected(3.0)
+    assert len(mock_stmt.mock_calls) == 1
+    assert mock_stmt.mock_calls[0].args[0] == day3
+
+    # Adjusting the statistics drops the cached days
+    instance.async_adjust_statistics("test:total_energy_import", day2, 1.0, "kWh")
+    await async_wait_recording_done(hass)
+    expected = _expected(4.0)
+    expected["test:total_energy_import"][2]["sum"] = 5.0
+    assert _get_daily_statistics() == expected
+
+
+@pytest.mark.freeze_time("2022-10-05 12:00:00+00:00")
+async def test_daily_statistics_rollups_unaligned_start(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test days which started before an unaligned start time are not cached."""
+    await hass.config.async_set_time_zone("UTC")
+    day1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    day2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    external_statistics = [
+        {"start": day1, "last_reset": None, "max": 10, "mean": 10, "min": 10},
+        {
+            "start": day1 + timedelta(hours=13),
+            "last_reset": None,
+            "max": 30,
+            "mean": 30,
+            "min": 30,
+        },
+        {"start": day2, "last_reset": None, "max": 50, "mean": 50, "min": 50},
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    start_time = day1 + timedelta(hours=12)
+
+    def _get_daily_means() -> list[float | None]:
+        with session_scope(hass=hass, read_only=True) as session:
+            metadata = recorder.get_instance(hass).statistics_meta_manager.get_many(
+                session, statistic_ids={"test:temperature"}
+            )
+            stats = statistics._reduced_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                None,
+                {"test:temperature"},
+                metadata,
+                [metadata["test:temperature"][0]],
+                "day",
+                None,
+                {"mean"},
+            )
+        return [row["mean"] for row in stats["test:temperature"]]
+
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=statistics._generate_statistics_during_period_stmt,
+    ) as mock_stmt:
+        # The hour before the start time is not included in the first day
+        assert _get_daily_means() == [30.0, 50.0]
+        assert _get_daily_means() == [30.0, 50.0]
+    assert [call.args[0] for call in mock_stmt.mock_calls] == [start_time] * 2
+
+
+def test_statistics_rollup_manager_lru_size() -> None:
+    """Test the least recently used periods are dropped."""
+    manager = StatisticsRollupManager(lru_size=2)
+    key: RollupKey = ("day", "UTC", frozenset({"mean"}), None, None)
+    periods = [(0.0, 86400.0), (86400.0, 172800.0), (172800.0, 259200.0)]
+    rows: list[Any] = [{"start": start, "end": end} for start, end in periods]
+    manager.add(
+        manager.generation,
+        {
+            "test:one": {key: {periods[0][0]: (periods[0][1], rows[0])}},
+            "test:two": {key: {periods[1][0]: (periods[1][1], rows[1])}},
+        },
+    )
+    assert manager.get("test:one", key, periods[:1]) == ([rows[0]], 1)
+    manager.add(
+        manager.generation,
+        {"test:three": {key: {periods[2][0]: (periods[2][1], rows[2])}}},
+    )
+    assert manager.get("test:one", key, periods[:1]) == ([rows[0]], 1)
+    assert manager.get("test:two", key, periods[1:2]) == ([], 0)
+    assert manager.get("test:three", key, periods[2:]) == ([rows[2]], 1)
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_weekly_statistics_mean(
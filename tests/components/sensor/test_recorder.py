@@ -2294,6 +2294,62 @@ async def test_compile_hourly_statistics_unchanged(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_skips_history_of_unchanged_sensors(
+    hass: HomeAssistant,
+) -> None:
+    """Test history is only queried for sensors updated during the period."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero) as freezer:
+        four, _ = await async_record_states(
+            hass, freezer, zero, "sensor.test1", POWER_SENSOR_ATTRIBUTES
+        )
+        five = four + timedelta(seconds=5)
+        freezer.move_to(five)
+        hass.states.async_set("sensor.test2", "20", POWER_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as mock_history:
+        do_adhoc_statistics(hass, start=four)
+        await async_wait_recording_done(hass)
+    assert len(mock_history.mock_calls) == 1
+    assert mock_history.mock_calls[0].kwargs["entity_ids"] == ["sensor.test2"]
+
+    stats = statistics_during_period(hass, four, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(four).timestamp(),
+                "end": process_timestamp(four + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(30),
+                "min": pytest.approx(30),
+                "max": pytest.approx(30),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(four).timestamp(),
+                "end": process_timestamp(four + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(20),
+                "min": pytest.approx(20),
+                "max": pytest.approx(20),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+    }
+
+
 async def test_compile_hourly_statistics_partially_unavailable(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
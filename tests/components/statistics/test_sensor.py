@@ -796,6 +796,57 @@ async def test_percentile(hass: HomeAssistant) -> None:
     assert state.state == str(2.72)
 
 
+async def test_sorted_characteristics_with_full_buffer(hass: HomeAssistant) -> None:
+    """Test median and percentile are correct while values leave the buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test_median",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": "median",
+                    "sampling_size": 4,
+                },
+                {
+                    "platform": "statistics",
+                    "name": "test_percentile",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": "percentile",
+                    "sampling_size": 4,
+                    "percentile": 90,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    # Repeated values must be removed from the sorted values one at a time
+    source_values = [*VALUES_NUMERIC, 17, 17, 5]
+    for idx, value in enumerate(source_values):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        values = [float(v) for v in source_values[max(0, idx - 3) : idx + 1]]
+
+        state = hass.states.get("sensor.test_median")
+        assert state is not None
+        assert state.state == str(round(statistics.median(values), 2))
+        state = hass.states.get("sensor.test_percentile")
+        assert state is not None
+        expected = (
+            values[0]
+            if len(values) == 1
+            else statistics.quantiles(values, n=100, method="exclusive")[89]
+        )
+        assert state.state == str(round(expected, 2))
+
+
 async def test_device_class(hass: HomeAssistant) -> None:
     """Test device class, which depends on the source entity."""
     assert await async_setup_component(
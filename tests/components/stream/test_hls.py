@@ -432,6 +432,43 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_segment_with_multiple_parts(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test a segment is served as the parts it has when it is requested."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    segment = Segment(sequence=0, duration=SEGMENT_DURATION)
+    segment.init = INIT_BYTES
+    segment.parts = [
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=True, data=b"first"),
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=False, data=b"second"),
+    ]
+    hls.put(segment)
+    await hass.async_block_till_done()
+
+    segment_response = await hls_client.get("/segment/0.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert segment_response.headers["Content-Type"] == "video/iso.segment"
+    assert segment_response.content_length == len(b"firstsecond")
+    assert await segment_response.read() == b"firstsecond"
+
+    # A part added later is included in the next request
+    segment.parts.append(
+        Part(duration=SEGMENT_DURATION / 2, has_keyframe=False, data=b"third")
+    )
+    segment_response = await hls_client.get("/segment/0.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == b"firstsecondthird"
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
@@ -11,7 +11,7 @@ import voluptuous as vol
 
 from homeassistant import loader
 from homeassistant.components.device_automation import toggle_entity
-from homeassistant.components.websocket_api import const
+from homeassistant.components.websocket_api import commands, const
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_OK,
@@ -673,6 +673,51 @@ async def test_subscribe_unsubscribe_events(
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_events_shares_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscriptions to the same event type share one bus listener."""
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for msg_id in (5, 6):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_events", "event_type": "test_event"}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    for msg_id in (5, 6):
+        async with asyncio.timeout(3):
+            msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["type"] == "event"
+        assert msg["event"]["data"] == {"hello": "world"}
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.bus.async_fire("test_event", {"hello": "again"})
+    async with asyncio.timeout(3):
+        msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["event"]["data"] == {"hello": "again"}
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 6}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_get_states(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -706,6 +751,31 @@ async def test_get_services(
         assert msg["result"].keys() == hass.services.async_services().keys()
 
 
+async def test_get_services_only_encodes_changed_domains(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_services only encodes the domains that changed."""
+    hass.services.async_register("domain_a", "service", lambda call: None)
+    hass.services.async_register("domain_b", "service", lambda call: None)
+    await websocket_client.send_json({"id": 5, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"].keys() == hass.services.async_services().keys()
+
+    hass.services.async_register("domain_b", "new_service", lambda call: None)
+    with patch.object(commands, "json_bytes", wraps=commands.json_bytes) as mock_json:
+        await websocket_client.send_json({"id": 6, "type": "get_services"})
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"].keys() == hass.services.async_services().keys()
+    assert msg["result"]["domain_b"].keys() == {"service", "new_service"}
+
+    # The changed domain and the combined payload are encoded
+    encoded = [call.args[0] for call in mock_json.mock_calls]
+    assert len(encoded) == 2
+    assert encoded[0].keys() == {"service", "new_service"}
+
+
 async def test_get_config(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -910,6 +980,50 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_shares_initial_states(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the initial states are shared until a state changes."""
+    hass.states.async_set("light.one", "off", {"color": "red"})
+
+    async def _subscribe(msg_id: int) -> dict[str, Any]:
+        await websocket_client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        return msg["event"]["a"]
+
+    with patch.object(
+        commands,
+        "_async_get_allowed_states",
+        wraps=commands._async_get_allowed_states,
+    ) as mock_get_allowed_states:
+        assert (await _subscribe(7))["light.one"]["s"] == "off"
+        payload = hass.data[commands.ALL_COMPRESSED_STATES_JSON_CACHE]
+        assert (await _subscribe(8))["light.one"]["s"] == "off"
+        assert hass.data[commands.ALL_COMPRESSED_STATES_JSON_CACHE] is payload
+
+        hass.states.async_set("light.one", "on")
+        assert commands.ALL_COMPRESSED_STATES_JSON_CACHE not in hass.data
+        # Skip the change events sent to the existing subscriptions
+        for _ in range(2):
+            msg = await websocket_client.receive_json()
+            assert msg["event"]["c"]["light.one"]["+"]["s"] == "on"
+
+        assert (await _subscribe(9))["light.one"]["s"] == "on"
+        # Filtered subscriptions do not use the shared states
+        await websocket_client.send_json(
+            {"id": 10, "type": "subscribe_entities", "entity_ids": ["light.one"]}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["a"]["light.one"]["s"] == "on"
+
+    assert len(mock_get_allowed_states.mock_calls) == 1
+
+
 async def test_subscribe_entities_with_unserializable_state(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2544,12 +2658,18 @@ async def test_integration_setup_info(
     hass_admin_user: MockUser,
 ) -> None:
     """Test subscribe/unsubscribe bootstrap_integrations."""
-    with patch(
-        "homeassistant.components.websocket_api.commands.async_get_setup_timings",
-        return_value={
-            "august": 12.5,
-            "isy994": 12.8,
-        },
+    with (
+        patch(
+            "homeassistant.components.websocket_api.commands.async_get_setup_timings",
+            return_value={
+                "august": 12.5,
+                "isy994": 12.8,
+            },
+        ),
+        patch(
+            "homeassistant.components.websocket_api.commands.async_get_import_timings",
+            return_value={"august": 1.5},
+        ),
     ):
         await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
         msg = await websocket_client.receive_json()
@@ -2558,8 +2678,28 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
-        {"domain": "isy994", "seconds": 12.8},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
+        {"domain": "isy994", "seconds": 12.8, "import_seconds": None},
+    ]
+
+
+async def test_storage_load_info(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test getting the load times of the base storage files."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_storage_load_timings",
+        return_value={"core.entity_registry": 0.5, "core.config_entries": 0.1},
+    ):
+        await websocket_client.send_json({"id": 7, "type": "storage/load_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"key": "core.entity_registry", "seconds": 0.5},
+        {"key": "core.config_entries", "seconds": 0.1},
     ]
 
 
@@ -2865,6 +3005,118 @@ async def test_integration_descriptions(
     assert response["result"]
 
 
+async def test_subscribe_entities_batch(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test a batch of state changes is sent in one message."""
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.one", "light.two"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"a": {}}
+
+    hass.states.async_set_many(
+        [
+            ("light.one", "on", None),
+            ("light.other", "on", None),
+            ("light.two", "off", None),
+        ]
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.one": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.two": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+        }
+    }
+
+    # A batch with only filtered entities sends nothing
+    hass.states.async_set_many([("light.other", "off", None)])
+    hass.states.async_set("light.one", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
+async def test_subscribe_entities_batch_with_non_admin_user(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test a batch of state changes only sends the permitted entities."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    assert not hass_admin_user.is_admin
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    hass.states.async_set_many(
+        [
+            ("light.not_permitted", "on", None),
+            ("light.permitted", "on", None),
+        ]
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+
+async def test_subscribe_entities_batch_with_entity_filter(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test a batch of state changes only sends the entities of the filter."""
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "include": {"domains": ["light"]}}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    hass.states.async_set_many(
+        [
+            ("switch.not_included", "on", None),
+            ("light.include", "on", None),
+        ]
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.include": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+
 async def test_subscribe_entities_chained_state_change(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -6,10 +6,15 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_event_message_prefix,
+    cached_state_diff_batch_messages,
+    cached_state_diff_message,
+    event_message_suffix,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -83,6 +88,17 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_cached_event_message_prefix_and_suffix(hass: HomeAssistant) -> None:
+    """Test an event message can be built from a shared prefix."""
+    events = async_capture_events(hass, "test_event")
+    hass.bus.async_fire("test_event", {"hello": "world"})
+    await hass.async_block_till_done()
+
+    prefix = cached_event_message_prefix(events[0])
+    assert prefix + event_message_suffix(b"2") == cached_event_message(b"2", events[0])
+    assert prefix + event_message_suffix(b"3") == cached_event_message(b"3", events[0])
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -281,6 +297,55 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_cached_state_diff_batch_messages(hass: HomeAssistant) -> None:
+    """Test the state diffs of a batch are combined."""
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.door", "on")
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    with hass.states.async_batch_state_changes():
+        hass.states.async_set("light.new", "on")
+        hass.states.async_set("light.window", "off")
+        hass.states.async_remove("light.door")
+        hass.states.async_set("light.window", "on")
+    await hass.async_block_till_done()
+    assert len(state_change_events) == 4
+
+    messages = cached_state_diff_batch_messages(b"7", state_change_events)
+
+    # The second change of light.window starts a new message
+    assert len(messages) == 2
+    first = json_loads(messages[0])
+    assert first["id"] == 7
+    assert first["type"] == "event"
+    assert first["event"] == {
+        "a": _state_diff_event(state_change_events[0])["a"],
+        "c": _state_diff_event(state_change_events[1])["c"],
+        "r": ["light.door"],
+    }
+    assert messages[1] == cached_state_diff_message(b"7", state_change_events[3])
+
+    assert cached_state_diff_batch_messages(b"7", state_change_events[:1]) == [
+        cached_state_diff_message(b"7", state_change_events[0])
+    ]
+
+
+async def test_cached_state_diff_batch_messages_unserializable(
+    hass: HomeAssistant,
+) -> None:
+    """Test a state that can not be serialized does not drop the batch."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    with hass.states.async_batch_state_changes():
+        hass.states.async_set("light.window", "on")
+        hass.states.async_set("light.broken", "on", {"bad": _Unserializeable()})
+    await hass.async_block_till_done()
+
+    messages = cached_state_diff_batch_messages(b"7", state_change_events)
+
+    assert len(messages) == 2
+    assert json_loads(messages[0])["event"] == _state_diff_event(state_change_events[0])
+    assert json_loads(messages[1])["success"] is False
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
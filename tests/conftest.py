@@ -1189,6 +1189,28 @@ def mock_get_source_ip() -> Generator[_patch]:
         patcher.stop()
 
 
+@pytest.fixture(autouse=True)
+def mock_template_code_cache_save() -> Generator[None]:
+    """Prevent the template code cache from being written to the config dir.
+
+    This is function scoped so tests can override it to save the cache.
+    """
+    with patch(
+        "homeassistant.helpers.template_code_cache.TemplateCodeCache.save",
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_manifest_cache_save() -> Generator[None]:
+    """Prevent the manifest cache from being written to the config dir.
+
+    This is function scoped so tests can override it to save the cache.
+    """
+    with patch("homeassistant.loader.ManifestCache.save"):
+        yield
+
+
 @pytest.fixture(autouse=True, scope="session")
 def translations_once() -> Generator[_patch]:
     """Only load translations once per session."""
@@ -12,9 +12,15 @@ from syrupy.assertion import SnapshotAssertion
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+    EntityCategory,
+)
 from homeassistant.core import (
     CoreState,
+    Event,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -599,6 +605,35 @@ async def test_async_remove_with_platform(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_async_batch_state_writes(hass: HomeAssistant) -> None:
+    """Test the state writes of a platform are fired as one batch."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+    entity1 = MockEntity(name="test_1")
+    entity2 = MockEntity(name="test_2")
+    await component.async_add_entities([entity1, entity2])
+    batches: list[list[Event]] = []
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED,
+        callback(lambda event: None),
+        callback(lambda events: batches.append(events)),
+    )
+
+    with entity1.platform.async_batch_state_writes():
+        for entity in (entity1, entity2):
+            entity._attr_state = "on"
+            entity.async_write_ha_state()
+        assert batches == []
+
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        entity1.entity_id,
+        entity2.entity_id,
+    ]
+    assert hass.states.get(entity1.entity_id).state == "on"
+    assert hass.states.get(entity2.entity_id).state == "on"
+
+
 async def test_async_remove_with_platform_update_finishes(hass: HomeAssistant) -> None:
     """Remove an entity when an update finishes after its been removed."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -299,7 +299,7 @@ async def test_loading_saving_data(
     )
     entity_registry.async_update_entity(
         orig_entry2.entity_id,
-        categories={"scope", "id"},
+        categories={"scope": "id"},
         labels={"label1", "label2"},
     )
     orig_entry2 = entity_registry.async_get(orig_entry2.entity_id)
@@ -334,7 +334,7 @@ async def test_loading_saving_data(
     assert attr.evolve(orig_entry4, modified_at=new_entry4.modified_at) == new_entry4
 
     assert new_entry2.area_id == "mock-area-id"
-    assert new_entry2.categories == {"scope", "id"}
+    assert new_entry2.categories == {"scope": "id"}
     assert new_entry2.capabilities == {"max": 100}
     assert new_entry2.config_entry_id == mock_config.entry_id
     assert new_entry2.device_class == "user-class"
@@ -2189,6 +2189,89 @@ async def test_entries_for_category(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_category(entity_registry, "scope1", "")
 
 
+async def test_entries_for_platform(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries by platform."""
+    hue_light = entity_registry.async_get_or_create(
+        domain="light", platform="hue", unique_id="123"
+    )
+    hue_sensor = entity_registry.async_get_or_create(
+        domain="sensor", platform="hue", unique_id="123"
+    )
+    entity_registry.async_get_or_create(domain="light", platform="zha", unique_id="123")
+
+    assert er.async_entries_for_platform(entity_registry, "hue") == [
+        hue_light,
+        hue_sensor,
+    ]
+    assert not er.async_entries_for_platform(entity_registry, "unknown")
+
+    entity_registry.async_remove(hue_light.entity_id)
+    assert er.async_entries_for_platform(entity_registry, "hue") == [hue_sensor]
+
+
+async def test_entries_for_domain(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries by domain."""
+    hue_light = entity_registry.async_get_or_create(
+        domain="light", platform="hue", unique_id="123"
+    )
+    entity_registry.async_get_or_create(
+        domain="sensor", platform="hue", unique_id="123"
+    )
+    zha_light = entity_registry.async_get_or_create(
+        domain="light",
+        platform="zha",
+        unique_id="123",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    assert er.async_entries_for_domain(entity_registry, "light") == [hue_light]
+    assert er.async_entries_for_domain(
+        entity_registry, "light", include_disabled_entities=True
+    ) == [hue_light, zha_light]
+    assert not er.async_entries_for_domain(entity_registry, "unknown")
+
+    entity_registry.async_remove(hue_light.entity_id)
+    assert not er.async_entries_for_domain(entity_registry, "light")
+
+
+async def test_entries_for_disabled_by(entity_registry: er.EntityRegistry) -> None:
+    """Test getting entity entries by disabler."""
+    hue_light = entity_registry.async_get_or_create(
+        domain="light", platform="hue", unique_id="123"
+    )
+    zha_light = entity_registry.async_get_or_create(
+        domain="light",
+        platform="zha",
+        unique_id="123",
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    assert er.async_entries_for_disabled_by(
+        entity_registry, er.RegistryEntryDisabler.USER
+    ) == [zha_light]
+    assert not er.async_entries_for_disabled_by(
+        entity_registry, er.RegistryEntryDisabler.INTEGRATION
+    )
+
+    hue_light = entity_registry.async_update_entity(
+        hue_light.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+    )
+    zha_light = entity_registry.async_update_entity(
+        zha_light.entity_id, disabled_by=None
+    )
+    assert not er.async_entries_for_disabled_by(
+        entity_registry, er.RegistryEntryDisabler.USER
+    )
+    assert er.async_entries_for_disabled_by(
+        entity_registry, er.RegistryEntryDisabler.INTEGRATION
+    ) == [hue_light]
+
+    entity_registry.async_remove(hue_light.entity_id)
+    assert not er.async_entries_for_disabled_by(
+        entity_registry, er.RegistryEntryDisabler.INTEGRATION
+    )
+
+
 async def test_get_or_create_thread_safety(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
@@ -1,6 +1,7 @@
 """Test event helpers."""
 
 import asyncio
+from collections import Counter
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
@@ -1915,6 +1916,101 @@ async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     }
 
 
+async def test_track_template_result_attribute_only_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates that only read state values skip attribute-only changes."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    templates = {
+        "state": Template("{{ states('sensor.one') | float(0) * 2 }}", hass),
+        "attribute": Template(
+            "{{ state_attr('sensor.one', 'unit_of_measurement') }}", hass
+        ),
+        "domain": Template("{{ states.sensor | map(attribute='state') | list }}", hass),
+        "domain_attribute": Template(
+            "{{ states.sensor | map(attribute='attributes') | list | count }}", hass
+        ),
+    }
+    for template in templates.values():
+        async_track_template_result(
+            hass, [TrackTemplate(template, None, 0)], lambda *_: None
+        )
+    await hass.async_block_till_done()
+    names = {template: name for name, template in templates.items()}
+
+    def renders() -> dict[str, int]:
+        counts = Counter(
+            names[call.args[0]] for call in render_to_info_mock.call_args_list
+        )
+        return {name: counts[name] for name in templates}
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as render_to_info_mock:
+        hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert renders() == {
+            "state": 0,
+            "attribute": 1,
+            "domain": 0,
+            "domain_attribute": 1,
+        }
+
+        hass.states.async_set("sensor.one", "3", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert renders() == {
+            "state": 1,
+            "attribute": 2,
+            "domain": 1,
+            "domain_attribute": 2,
+        }
+
+        hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert renders() == {
+            "state": 1,
+            "attribute": 2,
+            "domain": 1,
+            "domain_attribute": 3,
+        }
+
+
+async def test_track_template_result_whole_state_attribute_change(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates rendering whole states re-render on attribute changes."""
+    hass.states.async_set("sensor.one", "1", {"a": 1})
+    results: dict[str, str] = {}
+    for name, template in (
+        ("state", Template("{{ states.sensor.one }}", hass)),
+        ("domain", Template("{{ states.sensor | list }}", hass)),
+    ):
+
+        @callback
+        def _update(
+            event: Event[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+            name: str = name,
+        ) -> None:
+            results[name] = updates[0].result
+
+        async_track_template_result(
+            hass, [TrackTemplate(template, None, 0)], _update
+        ).async_refresh()
+    assert "a=1" in results["state"]
+    assert "a=1" in results["domain"]
+
+    hass.states.async_set("sensor.one", "1", {"a": 2})
+    await hass.async_block_till_done()
+
+    assert "a=2" in results["state"]
+    assert "a=2" in results["domain"]
+
+
 async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     """Test tracking template with a wildcard."""
     specific_runs = []
@@ -18,6 +18,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -550,3 +551,46 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+async def test_stored_states_are_decoded_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored states are only decoded when they are restored."""
+    now = dt_util.utcnow()
+    stored_states = [
+        StoredState(State("input_boolean.b0", "on"), None, now),
+        StoredState(
+            State("input_boolean.b1", "off", {"icon": "mdi:test"}),
+            RestoredExtraData({"native_value": 5}),
+            now,
+        ),
+    ]
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": json_round_trip([state.as_dict() for state in stored_states]),
+    }
+    data = async_get(hass)
+
+    with patch.object(State, "from_dict", wraps=State.from_dict) as mock_from_dict:
+        await data.async_load()
+        assert len(mock_from_dict.mock_calls) == 0
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert state.state == "off"
+        assert state.attributes == {"icon": "mdi:test"}
+        extra_data = await entity.async_get_last_extra_data()
+        assert extra_data.as_dict() == {"native_value": 5}
+        assert len(mock_from_dict.mock_calls) == 1
+
+        # Undecoded states are saved as they were loaded
+        await data.async_dump_states()
+        assert len(mock_from_dict.mock_calls) == 1
+
+    assert hass_storage[STORAGE_KEY]["data"] == json_round_trip(
+        [state.as_dict() for state in stored_states]
+    )
@@ -1176,6 +1176,33 @@ async def test_async_get_all_descriptions_dynamically_created_services(
     }
 
 
+async def test_async_get_all_descriptions_reuses_unchanged_domains(
+    hass: HomeAssistant,
+) -> None:
+    """Test the descriptions of unchanged domains are reused."""
+    await async_setup_component(hass, DOMAIN_GROUP, {DOMAIN_GROUP: {}})
+    await async_setup_component(hass, DOMAIN_LOGGER, {DOMAIN_LOGGER: {}})
+    descriptions = await service.async_get_all_descriptions(hass)
+
+    hass.services.async_register(DOMAIN_LOGGER, "new_service", lambda x: None, None)
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions is not descriptions
+    assert new_descriptions[DOMAIN_GROUP] is descriptions[DOMAIN_GROUP]
+    assert new_descriptions[DOMAIN_LOGGER] is not descriptions[DOMAIN_LOGGER]
+    assert "new_service" in new_descriptions[DOMAIN_LOGGER]
+
+    descriptions = new_descriptions
+    service.async_set_service_schema(
+        hass, DOMAIN_LOGGER, "new_service", {"description": "new service"}
+    )
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions[DOMAIN_GROUP] is descriptions[DOMAIN_GROUP]
+    assert new_descriptions[DOMAIN_LOGGER] is not descriptions[DOMAIN_LOGGER]
+    assert (
+        new_descriptions[DOMAIN_LOGGER]["new_service"]["description"] == "new service"
+    )
+
+
 async def test_async_get_all_descriptions_new_service_added_while_loading(
     hass: HomeAssistant,
 ) -> None:
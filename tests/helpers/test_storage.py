@@ -1046,6 +1046,54 @@ async def test_store_manager_caching(
         await hass.async_stop(force=True)
 
 
+async def test_store_manager_parallel_preload(tmpdir: py.path.local) -> None:
+    """Test stores wait for their key to be preloaded instead of reading it."""
+    loop = asyncio.get_running_loop()
+    keys = [f"integration{idx}" for idx in range(10)]
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        for key in (*keys, "other"):
+            tmp_storage.join(key).write_binary(
+                json_bytes({"data": {key: key}, "version": 1})
+            )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        with patch.object(
+            storage.json_util, "load_json", wraps=storage.json_util.load_json
+        ) as mock_load_json:
+            preload_task = hass.async_create_task(store_manager.async_preload(keys))
+            assert store_manager.async_get_preload_future("integration9") is not None
+
+            store = storage.Store(hass, 1, "integration9")
+            assert await store.async_load() == {"integration9": "integration9"}
+            load_times = await preload_task
+
+        assert len(mock_load_json.mock_calls) == len(keys)
+        assert store_manager.async_get_preload_future("integration9") is None
+        assert set(load_times) == set(keys)
+
+        # Cancelling a store waiting for a preload does not cancel the preload
+        preload_task = hass.async_create_task(store_manager.async_preload(["other"]))
+        cancelled_load = hass.async_create_task(
+            storage.Store(hass, 1, "other").async_load()
+        )
+        await asyncio.sleep(0)
+        cancelled_load.cancel()
+        store = storage.Store(hass, 1, "other")
+        assert await store.async_load() == {"other": "other"}
+        await preload_task
+        assert cancelled_load.cancelled()
+
+        await hass.async_stop(force=True)
+
+
 async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
     """Test store manager ignores subdirs."""
     loop = asyncio.get_running_loop()
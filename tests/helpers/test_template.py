@@ -5605,6 +5605,39 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_full_state_reads(hass: HomeAssistant) -> None:
+    """Test info tracks which entities had more than the state value read."""
+    hass.states.async_set("light.one", "on", {"brightness": 100})
+    hass.states.async_set("light.two", "off")
+    hass.states.async_set("sensor.one", "1")
+
+    info = render_to_info(
+        hass,
+        "{{ states('light.one') }}{{ states.light.two.domain }}"
+        "{{ state_attr('sensor.one', 'unit_of_measurement') }}",
+    )
+    assert info.entities == {"light.one", "light.two", "sensor.one"}
+    assert info.entities_full_state == {"sensor.one"}
+    assert info.collection_full_state is False
+    assert not info.filter_attribute_change("light.one")
+    assert not info.filter_attribute_change("light.two")
+    assert info.filter_attribute_change("sensor.one")
+
+    info = render_to_info(hass, "{{ states.light | map(attribute='state') | list }}")
+    assert info.collection_full_state is False
+    assert not info.filter_attribute_change("light.one")
+
+    info = render_to_info(
+        hass, "{{ states.light | selectattr('attributes.brightness') | list }}"
+    )
+    assert info.collection_full_state is True
+    assert info.filter_attribute_change("light.one")
+    assert not info.filter_attribute_change("sensor.one")
+
+    info = render_to_info(hass, '{{ states("light.one") | float }}')
+    assert info.filter_attribute_change("light.one")
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
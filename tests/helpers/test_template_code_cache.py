@@ -0,0 +1,105 @@
+"""Tests for the template code cache."""
+
+import marshal
+from pathlib import Path
+from unittest.mock import patch
+
+import jinja2
+import pytest
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import template, template_code_cache
+from homeassistant.helpers.template_code_cache import (
+    DATA_TEMPLATE_CODE_CACHE,
+    TemplateCodeCache,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_template_code_cache_save() -> None:
+    """Allow the template code cache to be saved in these tests."""
+
+
+async def test_cache_hits_and_misses(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled code is reused from the cache."""
+    cache = TemplateCodeCache(str(tmp_path / "cache"))
+    hass.data[DATA_TEMPLATE_CODE_CACHE] = cache
+
+    tpl = template.Template("{{ 1 + 2 }}", hass)
+    assert tpl.async_render() == 3
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert len(cache) == 1
+
+    # A fresh environment does not have the code in its in-memory cache
+    env = template.TemplateEnvironment(hass)
+    code = env.compile("{{ 1 + 2 }}")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert jinja2.Template.from_code(env, code, env.globals, None).render()
+
+    # Limited environments are cached separately
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    limited_env.compile("{{ 1 + 2 }}")
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 2
+
+
+async def test_save_and_load(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the cache is persisted between runs."""
+    path = str(tmp_path / ".storage" / "cache")
+    cache = TemplateCodeCache(path)
+    env = template.TemplateEnvironment(hass)
+    cache.set("default", "{{ 1 }}", env.compile("{{ 1 }}"))
+
+    data = cache.async_snapshot()
+    assert data is not None
+    assert cache.async_snapshot() is None
+    await hass.async_add_executor_job(cache.save, data)
+
+    loaded = TemplateCodeCache(path)
+    await hass.async_add_executor_job(loaded.load)
+    assert len(loaded) == 1
+    assert loaded.get("default", "{{ 1 }}") is not None
+    assert loaded.get("limited", "{{ 1 }}") is None
+
+
+async def test_load_ignores_outdated_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a cache written by another version or corrupt cache is ignored."""
+    path = tmp_path / "cache"
+    path.write_bytes(marshal.dumps({"version": (0,), "entries": {b"a": b"b"}}))
+    cache = TemplateCodeCache(str(path))
+    await hass.async_add_executor_job(cache.load)
+    assert len(cache) == 0
+
+    path.write_bytes(b"not marshal data")
+    await hass.async_add_executor_job(cache.load)
+    assert len(cache) == 0
+
+
+async def test_lru_eviction(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the least recently used entries are evicted."""
+    cache = TemplateCodeCache(str(tmp_path / "cache"), max_size=2)
+    env = template.TemplateEnvironment(hass)
+    for source in ("{{ 1 }}", "{{ 2 }}"):
+        cache.set("default", source, env.compile(source))
+    assert cache.get("default", "{{ 1 }}") is not None
+
+    cache.set("default", "{{ 3 }}", env.compile("{{ 3 }}"))
+    assert len(cache) == 2
+    assert cache.get("default", "{{ 1 }}") is not None
+    assert cache.get("default", "{{ 2 }}") is None
+    assert cache.get("default", "{{ 3 }}") is not None
+
+
+async def test_async_load_saves_on_final_write(hass: HomeAssistant) -> None:
+    """Test the cache is loaded into hass.data and saved on final write."""
+    with patch.object(TemplateCodeCache, "load"):
+        await template_code_cache.async_load(hass)
+    cache = hass.data[DATA_TEMPLATE_CODE_CACHE]
+
+    template.Template("{{ 4 + 5 }}", hass).async_render()
+    with patch.object(TemplateCodeCache, "save") as mock_save:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+    assert len(mock_save.mock_calls) == 1
+    assert cache.async_snapshot() is None
@@ -0,0 +1,119 @@
+"""Tests for the template fast path."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import template
+from homeassistant.helpers.template_fast_path import FastPathTemplate
+
+FAST_PATH_TEMPLATES = [
+    "{{ states('sensor.power') }}",
+    "{{ states('sensor.power') | float(0) * 2 }}",
+    "{{ states('sensor.missing') | float(0) * 2 }}",
+    "{{ states('sensor.power') | int(0) // 4 % 3 }}",
+    "{{ states('sensor.power') | float(0) / 3 | round(2) }}",
+    "{{ -(states('sensor.power') | float(0)) ** 2 + 1 }}",
+    "{{ is_state('light.one', 'on') and is_state('light.two', 'on') }}",
+    "{{ is_state('light.one', 'on') or is_state('light.two', 'on') }}",
+    "{{ not is_state('light.two', 'on') }}",
+    "{{ 10 < states('sensor.power') | float(0) <= 100 }}",
+    "{{ states('sensor.power') | float(0) != 5 }}",
+    "{{ state_attr('light.one', 'brightness') }}",
+    "{{ is_state_attr('light.one', 'brightness', 100) }}",
+    "{{ has_value('light.one') }}",
+    "Power: {{ states('sensor.power') }} W",
+]
+
+JINJA_TEMPLATES = [
+    "{{ 1 + 2 }}",
+    "{{ states.sensor.power.state }}",
+    "{{ states('sensor.power', with_unit=True) }}",
+    "{{ states('sensor.power') ~ ' W' }}",
+    "{{ value }}",
+    "{% if is_state('light.one', 'on') %}on{% endif %}",
+    "{{ expand('light.one') | count }}",
+    "{{ 'on' in states('light.one') }}",
+]
+
+
+@pytest.fixture(autouse=True)
+def setup_states(hass: HomeAssistant) -> None:
+    """Set up the states used by the templates."""
+    hass.states.async_set("sensor.power", "42.5", {"unit_of_measurement": "W"})
+    hass.states.async_set("light.one", "on", {"brightness": 100})
+    hass.states.async_set("light.two", "off")
+
+
+def _render_to_info(hass: HomeAssistant, source: str) -> tuple[Any, frozenset[str]]:
+    """Render a template and return the result and collected entities."""
+    info = template.Template(source, hass).async_render_to_info()
+    return info.result(), info.entities
+
+
+@pytest.mark.parametrize("source", FAST_PATH_TEMPLATES)
+async def test_fast_path_matches_jinja(hass: HomeAssistant, source: str) -> None:
+    """Test the fast path renders the same result and entities as Jinja."""
+    tpl = template.Template(source, hass)
+    tpl.async_render()
+    assert isinstance(tpl._compiled, FastPathTemplate)
+
+    fast_result = _render_to_info(hass, source)
+    with patch.object(template, "async_compile_fast_path", return_value=None):
+        jinja_result = _render_to_info(hass, source)
+    assert fast_result == jinja_result
+
+
+@pytest.mark.parametrize("source", JINJA_TEMPLATES)
+async def test_unsupported_templates_use_jinja(
+    hass: HomeAssistant, source: str
+) -> None:
+    """Test templates outside the supported subset are rendered by Jinja."""
+    tpl = template.Template(source, hass)
+    tpl.async_render({"value": 1})
+    assert not isinstance(tpl._compiled, FastPathTemplate)
+
+
+async def test_fast_path_variables_shadow_globals(hass: HomeAssistant) -> None:
+    """Test variables named like the globals are resolved by Jinja."""
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    assert tpl.async_render() == 42.5
+    assert isinstance(tpl._compiled, FastPathTemplate)
+    assert tpl.async_render({"states": lambda entity_id: "shadowed"}) == "shadowed"
+    assert tpl.async_render({"other": 1}) == 42.5
+
+
+async def test_fast_path_errors(hass: HomeAssistant) -> None:
+    """Test errors are raised like when rendering with Jinja."""
+    tpl = template.Template("{{ states('sensor.power') | float(0) / 0 }}", hass)
+    with pytest.raises(TemplateError, match="division by zero"):
+        tpl.async_render()
+
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    with pytest.raises(TemplateError, match="not supported in limited templates"):
+        tpl.async_render(limited=True)
+
+
+@pytest.mark.parametrize(
+    ("source", "fast_path"),
+    [("{{ states('light.two') }}", True), ("{{ 2 + 3 }}", False)],
+)
+async def test_fast_path_parses_source_once(
+    hass: HomeAssistant, source: str, fast_path: bool
+) -> None:
+    """Test each source is only parsed once for the fast path."""
+    with patch.object(
+        template.TemplateEnvironment,
+        "parse",
+        autospec=True,
+        side_effect=template.TemplateEnvironment.parse,
+    ) as parse_mock:
+        for _ in range(2):
+            tpl = template.Template(source, hass)
+            tpl.async_render()
+            assert isinstance(tpl._compiled, FastPathTemplate) is fast_path
+
+    assert parse_mock.call_count == 1
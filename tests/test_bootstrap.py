@@ -26,6 +26,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
+from homeassistant.setup import async_get_storage_load_timings
 
 from .common import (
     MockConfigEntry,
@@ -130,6 +131,20 @@ async def test_empty_setup(hass: HomeAssistant) -> None:
         assert domain in hass.config.components, domain
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_base_functionality_storage_load_times(hass: HomeAssistant) -> None:
+    """Test the load times of the preloaded base storage files are kept."""
+    load_times = {"core.entity_registry": 0.5, "core.config_entries": 0.1}
+    with patch(
+        "homeassistant.helpers.storage._StoreManager.async_preload",
+        return_value=load_times,
+    ) as mock_preload:
+        await bootstrap.async_load_base_functionality(hass)
+
+    mock_preload.assert_called_once_with(bootstrap.BASE_PRELOAD_STORAGE)
+    assert async_get_storage_load_timings(hass) == load_times
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_config_does_not_turn_off_debug(hass: HomeAssistant) -> None:
     """Test that config does not turn off debug if its turned on by runtime config."""
@@ -172,6 +187,32 @@ async def test_asyncio_debug_on_turns_hass_debug_on(
     assert hass.config.debug is True
 
 
+@pytest.mark.parametrize("intern_state_attributes", [True, False])
+@pytest.mark.parametrize("hass_config", [{}])
+@pytest.mark.usefixtures("mock_hass_config")
+async def test_setup_hass_intern_state_attributes(
+    mock_enable_logging: AsyncMock,
+    mock_is_virtual_env: Mock,
+    mock_mount_local_lib_path: AsyncMock,
+    mock_ensure_config_exists: AsyncMock,
+    mock_process_ha_config_upgrade: Mock,
+    intern_state_attributes: bool,
+) -> None:
+    """Test attribute interning is only enabled when requested."""
+    hass = await bootstrap.async_setup_hass(
+        runner.RuntimeConfig(
+            config_dir=get_test_config_dir(),
+            skip_pip=True,
+            recovery_mode=False,
+            intern_state_attributes=intern_state_attributes,
+        ),
+    )
+
+    assert (
+        hass.states.async_interned_attributes_count() is not None
+    ) is intern_state_attributes
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_preload_translations(hass: HomeAssistant) -> None:
     """Test translations are preloaded for all frontend deps and base platforms."""
@@ -1166,6 +1166,71 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events keyed on an event data value."""
+    calls = []
+    filtered_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def filtered_listener(event):
+        """Mock filtered listener."""
+        filtered_calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data.get("service") == "turn_on"
+
+    unsub = hass.bus.async_listen_keyed("test", "domain", "light", listener)
+    unsub_filtered = hass.bus.async_listen_keyed(
+        "test", "domain", "light", filtered_listener, mock_filter
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+
+    hass.bus.async_fire("test", {"domain": "switch", "service": "turn_on"})
+    hass.bus.async_fire("test", {"service": "turn_on"})
+    hass.bus.async_fire("test", {"domain": ["light"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+    assert len(filtered_calls) == 0
+
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_off"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert len(filtered_calls) == 0
+
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_on"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert len(filtered_calls) == 1
+
+    unsub()
+    hass.bus.async_fire("test", {"domain": "light", "service": "turn_on"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert len(filtered_calls) == 2
+
+    unsub_filtered()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_sanity_checks(hass: HomeAssistant) -> None:
+    """Test keyed listeners can't be registered for all events."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "domain", "light", listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1561,6 +1626,192 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_attribute_interning(hass: HomeAssistant) -> None:
+    """Test identical attributes are shared between states when enabled."""
+    attrs = {"unit_of_measurement": "W", "device_class": "power"}
+    hass.states.async_set("sensor.one", "1", attrs)
+    assert hass.states.async_interned_attributes_count() is None
+
+    hass.states.async_enable_attribute_interning()
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    hass.states.async_set("sensor.three", "3", {**attrs, "icon": "mdi:flash"})
+    hass.states.async_set("sensor.bool", "1", {"value": True})
+    hass.states.async_set("sensor.int", "1", {"value": 1})
+    hass.states.async_set("sensor.list", "1", {"value": [1]})
+    hass.states.async_set("sensor.list_two", "1", {"value": [1]})
+    hass.states.async_set("sensor.zero", "1", {"value": 0.0})
+    hass.states.async_set("sensor.negative_zero", "1", {"value": -0.0})
+    hass.states.async_set("sensor.reversed", "4", dict(reversed(attrs.items())))
+
+    # Existing states are not changed
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    assert one.attributes is not two.attributes
+    hass.states.async_set("sensor.one", "1", dict(attrs))
+    assert hass.states.get("sensor.one") is one
+    assert one.attributes is not two.attributes
+    hass.states.async_set("sensor.four", "4", dict(attrs))
+    four = hass.states.get("sensor.four")
+    assert four.attributes is two.attributes
+    assert isinstance(two.attributes, ReadOnlyDict)
+    assert hass.states.get("sensor.three").attributes is not two.attributes
+    # Equal values of different types must not be shared
+    bool_attrs = hass.states.get("sensor.bool").attributes
+    int_attrs = hass.states.get("sensor.int").attributes
+    assert bool_attrs is not int_attrs
+    assert type(bool_attrs["value"]) is bool
+    assert type(int_attrs["value"]) is int
+    # Unhashable values are never shared
+    assert (
+        hass.states.get("sensor.list").attributes
+        is not hass.states.get("sensor.list_two").attributes
+    )
+    # Floats of a different sign are not shared
+    zero_attrs = hass.states.get("sensor.zero").attributes
+    negative_zero_attrs = hass.states.get("sensor.negative_zero").attributes
+    assert zero_attrs is not negative_zero_attrs
+    assert str(negative_zero_attrs["value"]) == "-0.0"
+    # Attributes in a different order are not shared
+    reversed_attrs = hass.states.get("sensor.reversed").attributes
+    assert reversed_attrs is not two.attributes
+    assert list(reversed_attrs) == ["device_class", "unit_of_measurement"]
+    assert hass.states.async_interned_attributes_count() == 7
+
+
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting the state of multiple entities at once."""
+    hass.states.async_set("light.unchanged", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches: list[list[ha.Event]] = []
+    single_events: list[ha.Event] = []
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED,
+        callback(lambda event: single_events.append(event)),
+        callback(lambda events: batches.append(events)),
+    )
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 100}),
+            ("light.unchanged", "on", None),
+            ("light.ceiling", "off", None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").attributes == {"brightness": 100}
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert len(batches) == 1
+    assert batches[0] == events
+    assert single_events == []
+    bowl = hass.states.get("light.bowl")
+    ceiling = hass.states.get("light.ceiling")
+    assert bowl.last_updated_timestamp == ceiling.last_updated_timestamp
+    assert bowl.context is not ceiling.context
+
+    context = ha.Context()
+    hass.states.async_set_many(
+        [("light.bowl", "off", None), ("light.ceiling", "on", None)],
+        context=context,
+    )
+    assert hass.states.get("light.bowl").context is context
+    assert hass.states.get("light.ceiling").context is context
+    assert len(batches) == 2
+
+    # Events fired on their own go to the single event listener
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert len(single_events) == 1
+
+
+async def test_statemachine_batch_state_changes(hass: HomeAssistant) -> None:
+    """Test batching the state_changed events of a block."""
+    hass.states.async_set("light.kitchen", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches: list[list[ha.Event]] = []
+    remove_batch = hass.bus.async_listen_batch(
+        MATCH_ALL,
+        callback(lambda event: None),
+        callback(lambda events: batches.append(events)),
+    )
+
+    with hass.states.async_batch_state_changes():
+        hass.states.async_set("light.bowl", "on")
+        with hass.states.async_batch_state_changes():
+            hass.states.async_set("light.ceiling", "on")
+        assert hass.states.get("light.ceiling").state == "on"
+        hass.states.async_remove("light.kitchen")
+        assert events == []
+        assert batches == []
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.ceiling",
+        "light.kitchen",
+    ]
+    assert events[2].data["new_state"] is None
+    assert len(batches) == 1
+    assert batches[0] == events
+
+    # An empty block fires nothing
+    with hass.states.async_batch_state_changes():
+        pass
+    assert len(batches) == 1
+
+    remove_batch()
+    with hass.states.async_batch_state_changes():
+        hass.states.async_set("light.bowl", "off")
+    assert len(batches) == 1
+    assert len(events) == 4
+
+
+async def test_eventbus_fire_batch_listener_order(hass: HomeAssistant) -> None:
+    """Test batch listeners get the whole batch before other listeners."""
+    calls: list[tuple[str, str]] = []
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED,
+        callback(lambda event: calls.append(("single", event.data["entity_id"]))),
+    )
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED,
+        callback(lambda event: None),
+        callback(
+            lambda events: calls.extend(
+                ("batch", event.data["entity_id"]) for event in events
+            )
+        ),
+    )
+
+    hass.states.async_set_many([("light.bowl", "on", None), ("light.lamp", "on", None)])
+
+    assert calls == [
+        ("batch", "light.bowl"),
+        ("batch", "light.lamp"),
+        ("single", "light.bowl"),
+        ("single", "light.lamp"),
+    ]
+
+
+async def test_eventbus_listen_batch_requires_callbacks(hass: HomeAssistant) -> None:
+    """Test batch listeners must be callbacks."""
+
+    def not_a_callback(event: ha.Event) -> None:
+        pass
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_batch(
+            EVENT_STATE_CHANGED, not_a_callback, callback(lambda events: None)
+        )
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_batch(
+            EVENT_STATE_CHANGED, callback(lambda event: None), not_a_callback
+        )
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
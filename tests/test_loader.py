@@ -2035,3 +2035,65 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_cache(hass: HomeAssistant, tmp_path: pathlib.Path) -> None:
+    """Test manifests are reused from the cache until they change."""
+    path = tmp_path / "manifest_cache"
+    cache = hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(str(path), {})
+
+    def _resolve_hue() -> loader.Integration:
+        from homeassistant import components  # pylint: disable=import-outside-toplevel
+
+        return loader._resolve_integrations_from_root(hass, components, ["hue"])["hue"]
+
+    integration = await hass.async_add_executor_job(_resolve_hue)
+    data = cache.async_snapshot()
+    assert data is not None
+    assert cache.async_snapshot() is None
+
+    # Emulate a restart with the saved cache
+    path.write_text(json_dumps(data))
+    cache = hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(str(path), {})
+    with (
+        patch("homeassistant.loader.os.listdir") as mock_listdir,
+        patch("homeassistant.loader.json_loads", wraps=json_loads) as mock_json_loads,
+    ):
+        cached_integration = await hass.async_add_executor_job(_resolve_hue)
+    assert cached_integration.manifest == integration.manifest
+    assert cached_integration.platforms_exists(["light"]) == ["light"]
+    assert mock_listdir.call_count == 0
+    # Only the cache itself is parsed
+    assert mock_json_loads.call_count == 1
+    assert cache.async_snapshot() is None
+
+    # A cache written by another version is ignored
+    data["version"] = [0, "0.0.0"]
+    path.write_text(json_dumps(data))
+    cache = hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(str(path), {})
+    with patch("homeassistant.loader.os.listdir", wraps=os.listdir) as mock_listdir:
+        await hass.async_add_executor_job(_resolve_hue)
+    assert mock_listdir.call_count == 1
+    assert cache.async_snapshot() is not None
+
+
+async def test_import_timings(hass: HomeAssistant, tmp_path: pathlib.Path) -> None:
+    """Test import times are recorded and saved for the next run."""
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_component()
+    import_timings = loader.async_get_import_timings(hass)
+    assert import_timings["hue"] >= 0
+
+    path = tmp_path / "manifest_cache"
+    cache = loader.ManifestCache(str(path), import_timings)
+    data = cache.async_snapshot()
+    assert data["import_timings"] == import_timings
+    assert cache.async_snapshot() is None
+
+    path.write_text(json_dumps(data))
+    hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(str(path), {})
+    assert loader.async_get_previous_import_timings(hass) == {}
+    await hass.async_add_executor_job(
+        hass.data[loader.DATA_MANIFEST_CACHE].ensure_loaded
+    )
+    assert loader.async_get_previous_import_timings(hass) == import_timings
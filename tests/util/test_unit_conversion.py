@@ -882,6 +882,28 @@ def test_unit_conversion_factory_allow_none(
     ) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize(
+    ("converter", "values", "from_unit", "to_unit"),
+    [
+        (converter, [value, None, value * 2], from_unit, to_unit)
+        for converter, item in _CONVERTED_VALUE.items()
+        for value, from_unit, _, to_unit in item
+    ],
+)
+def test_values_converter_factory(
+    converter: type[BaseUnitConverter],
+    values: list[float | None],
+    from_unit: str,
+    to_unit: str,
+) -> None:
+    """Test converting many values gives the same results as one by one."""
+    convert = converter.converter_factory_allow_none(from_unit, to_unit)
+    assert converter.values_converter_factory(from_unit, to_unit)(values) == [
+        convert(value) for value in values
+    ]
+    assert converter.values_converter_factory(from_unit, from_unit)(values) == values
+
+
 @pytest.mark.parametrize(
     ("value", "from_unit", "expected", "to_unit"),
     [